@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect._internal.concurrency.api import create_call, from_sync
+from prefect._internal.concurrency.calls import Call
+from prefect._internal.concurrency.threads import (
+    EventLoopThread,
+    WorkerThread,
+    WorkerThreadPool,
+)
+
+CALLS = 1_000
+
+
+def identity(x):
+    return x
+
+
+async def aidentity(x):
+    return x
+
+
+CALL_TYPES = {"default": Call.new, "lightweight": Call.new_lightweight}
+
+
+@pytest.mark.parametrize("call_type", CALL_TYPES)
+def bench_call_new(benchmark: BenchmarkFixture, call_type: str):
+    new = CALL_TYPES[call_type]
+
+    def create_calls():
+        for i in range(CALLS):
+            new(identity, i)
+
+    benchmark.extra_info["calls"] = CALLS
+    benchmark(create_calls)
+
+
+@pytest.mark.parametrize("call_type", CALL_TYPES)
+def bench_call_run_sync(benchmark: BenchmarkFixture, call_type: str):
+    new = CALL_TYPES[call_type]
+
+    def run_calls():
+        for i in range(CALLS):
+            call = new(identity, i)
+            call.run()
+            call.result()
+
+    benchmark.extra_info["calls"] = CALLS
+    benchmark(run_calls)
+
+
+@pytest.mark.parametrize("call_type", CALL_TYPES)
+def bench_call_run_async(benchmark: BenchmarkFixture, call_type: str):
+    new = CALL_TYPES[call_type]
+
+    async def run_calls():
+        for i in range(CALLS):
+            call = new(aidentity, i)
+            await call.run()
+            call.result()
+
+    benchmark.extra_info["calls"] = CALLS
+    benchmark(lambda: asyncio.run(run_calls()))
+
+
+@pytest.mark.parametrize("portal", ["new-thread", "pool"])
+def bench_call_in_worker_thread(benchmark: BenchmarkFixture, portal: str):
+    pool = WorkerThreadPool()
+
+    def run_calls():
+        for i in range(100):
+            runner = WorkerThread(run_once=True) if portal == "new-thread" else pool
+            runner.submit(Call.new(identity, i)).result()
+
+    benchmark.extra_info["calls"] = 100
+    benchmark(run_calls)
+    pool.wait_for_exit()
+
+
+@pytest.mark.parametrize("submit", ["one-at-a-time", "many"])
+def bench_calls_in_loop_thread(benchmark: BenchmarkFixture, submit: str):
+    loop_thread = EventLoopThread(name="BenchEventLoopThread")
+    loop_thread.start()
+
+    def run_calls():
+        if submit == "many":
+            calls = loop_thread.submit_many(
+                Call.new(aidentity, i) for i in range(CALLS)
+            )
+        else:
+            calls = [loop_thread.submit(Call.new(aidentity, i)) for i in range(CALLS)]
+        for call in calls:
+            call.result()
+
+    benchmark.extra_info["calls"] = CALLS
+    benchmark(run_calls)
+    loop_thread.shutdown()
+    loop_thread.thread.join()
+
+
+ITEMS = 10_000
+
+
+async def numbers(n):
+    for i in range(n):
+        yield i
+
+
+async def collect_numbers(n):
+    return [i async for i in numbers(n)]
+
+
+@pytest.mark.parametrize("mode", ["collect", "stream-1", "stream-64"])
+def bench_iter_in_loop_thread(benchmark: BenchmarkFixture, mode: str):
+    def iterate():
+        if mode == "collect":
+            items = from_sync.call_soon_in_loop_thread(
+                create_call(collect_numbers, ITEMS)
+            ).result()
+        else:
+            buffer_size = int(mode.split("-")[1])
+            items = from_sync.iter_in_loop_thread(
+                create_call(numbers, ITEMS), buffer_size=buffer_size
+            )
+        for _ in items:
+            pass
+
+    benchmark.extra_info["items"] = ITEMS
+    benchmark(iterate)
@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect._internal.concurrency.cancellation import (
+    CancelledError,
+    CooperativeCancelScope,
+    WatcherThreadCancelScope,
+    cancel_sync_after,
+    check_cancelled,
+)
+
+SCOPES = 1_000
+
+
+@pytest.mark.parametrize("timeout", [None, 10.0])
+def bench_watcher_thread_cancel_scope(benchmark: BenchmarkFixture, timeout):
+    def enter_and_exit_scopes():
+        for _ in range(SCOPES):
+            with WatcherThreadCancelScope(timeout=timeout):
+                pass
+
+    benchmark.extra_info["scopes"] = SCOPES
+    benchmark(enter_and_exit_scopes)
+
+
+def bench_nested_watcher_thread_cancel_scopes(benchmark: BenchmarkFixture):
+    # Many deadlines are pending at once
+    def enter_and_exit_scopes(depth):
+        if depth:
+            with WatcherThreadCancelScope(timeout=10.0 + depth):
+                enter_and_exit_scopes(depth - 1)
+
+    benchmark.extra_info["scopes"] = 100
+    benchmark(enter_and_exit_scopes, 100)
+
+
+@pytest.mark.timeout(method="thread")  # alarm-based pytest-timeout will interfere
+def bench_nested_cancel_sync_after_in_main_thread(benchmark: BenchmarkFixture):
+    def enter_and_exit_scopes():
+        for _ in range(SCOPES):
+            with cancel_sync_after(10.0):
+                with cancel_sync_after(5.0):
+                    pass
+
+    benchmark.extra_info["scopes"] = SCOPES * 2
+    benchmark(enter_and_exit_scopes)
+
+
+CHECKS = 100_000
+
+
+@pytest.mark.parametrize("depth", [0, 1, 3])
+def bench_check_cancelled(benchmark: BenchmarkFixture, depth: int):
+    def check_in_scopes(depth):
+        if depth:
+            with CooperativeCancelScope():
+                check_in_scopes(depth - 1)
+        else:
+            for _ in range(CHECKS):
+                check_cancelled()
+
+    benchmark.extra_info["checks"] = CHECKS
+    benchmark(check_in_scopes, depth)
+
+
+@pytest.mark.parametrize(
+    "cls", [CooperativeCancelScope, WatcherThreadCancelScope], ids=["check", "inject"]
+)
+def bench_cancellation_latency(benchmark: BenchmarkFixture, cls):
+    # Measures the time from cancelling a busy loop in another thread to the loop
+    # exiting with a cancelled error
+    state = {}
+
+    def busy_loop():
+        try:
+            with cls() as scope:
+                state["scope"] = scope
+                state["entered"].set()
+                while True:
+                    check_cancelled()
+        except CancelledError:
+            pass
+
+    def setup():
+        state["entered"] = threading.Event()
+        state["thread"] = threading.Thread(target=busy_loop)
+        state["thread"].start()
+        state["entered"].wait()
+
+    def cancel():
+        state["scope"].cancel()
+        state["thread"].join()
+
+    benchmark.pedantic(cancel, setup=setup, rounds=100)
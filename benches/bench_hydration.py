@@ -0,0 +1,38 @@
+import json
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.utilities.schema_tools.hydration import hydrate, hydrate_many
+
+
+def _large_json(rows: int) -> str:
+    return json.dumps(
+        {
+            "rows": [
+                {"id": i, "name": f"row-{i}", "values": [i * 1.5, i], "flag": True}
+                for i in range(rows)
+            ]
+        }
+    )
+
+
+@pytest.mark.parametrize("rows", [10, 1000, 20000])
+def bench_hydrate_json(benchmark: BenchmarkFixture, rows: int):
+    obj = {"param": {"__prefect_kind": "json", "value": _large_json(rows)}}
+    benchmark(hydrate, obj)
+
+
+@pytest.mark.parametrize("rows", [10, 1000, 20000])
+def bench_hydrate_json_stdlib(benchmark: BenchmarkFixture, rows: int):
+    # Baseline for `bench_hydrate_json`; the `json` kind used `json.loads` previously
+    value = _large_json(rows)
+    benchmark(json.loads, value)
+
+
+def bench_hydrate_many_repeated_json(benchmark: BenchmarkFixture):
+    objs = [
+        {"param": {"__prefect_kind": "json", "value": _large_json(1000)}}
+        for _ in range(100)
+    ]
+    benchmark(hydrate_many, objs)
@@ -0,0 +1,152 @@
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect._internal.concurrency.fanin import FanInServer
+from prefect._internal.concurrency.services import BatchedQueueService, QueueService
+from prefect._internal.concurrency.threads import wait_for_global_loop_exit
+
+ITEMS = 10_000
+
+
+class CountingService(QueueService[int]):
+    async def _handle(self, item: int):
+        pass
+
+
+class CountingBatchedService(BatchedQueueService[int]):
+    _max_batch_size = 500
+
+    async def _handle_batch(self, items: List[int]):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def shutdown_global_loop():
+    yield
+    wait_for_global_loop_exit()
+
+
+def _send_and_drain(service_type, items: int = ITEMS, threads: int = 1):
+    instance = service_type.instance()
+
+    def send(count: int):
+        for i in range(count):
+            instance.send(i)
+
+    if threads == 1:
+        send(items)
+    else:
+        with ThreadPoolExecutor(threads) as executor:
+            for _ in range(threads):
+                executor.submit(send, items // threads)
+
+    instance.drain()
+
+
+@pytest.mark.parametrize("threads", [1, 4])
+def bench_queue_service_throughput(benchmark: BenchmarkFixture, threads: int):
+    benchmark.extra_info["items"] = ITEMS
+    benchmark.pedantic(
+        _send_and_drain, args=(CountingService, ITEMS, threads), rounds=5
+    )
+
+
+@pytest.mark.parametrize("threads", [1, 4])
+def bench_batched_queue_service_throughput(benchmark: BenchmarkFixture, threads: int):
+    benchmark.extra_info["items"] = ITEMS
+    benchmark.pedantic(
+        _send_and_drain, args=(CountingBatchedService, ITEMS, threads), rounds=5
+    )
+
+
+def bench_queue_service_latency(benchmark: BenchmarkFixture):
+    # Time from sending a single item to an idle service until it is handled
+    handled = threading.Event()
+
+    class LatencyService(QueueService[int]):
+        async def _handle(self, item: int):
+            handled.set()
+
+    instance = LatencyService.instance()
+
+    def send_one():
+        handled.clear()
+        instance.send(1)
+        handled.wait()
+
+    benchmark(send_one)
+    instance.drain()
+
+
+class UpdateService(QueueService[int]):
+    async def _handle(self, item: int):
+        # Simulate a request for each update
+        time.sleep(0.0001)
+
+
+class CoalescingUpdateService(UpdateService):
+    def _coalesce_key(self, item: int):
+        return item % 10
+
+
+@pytest.mark.parametrize(
+    "service_type", [UpdateService, CoalescingUpdateService], ids=["fifo", "coalesce"]
+)
+def bench_queue_service_updates(benchmark: BenchmarkFixture, service_type):
+    # A burst of updates to 10 entities
+    benchmark.extra_info["items"] = 2_000
+    benchmark.pedantic(_send_and_drain, args=(service_type, 2_000), rounds=5)
+
+
+class FanInCountingService(QueueService[int]):
+    _fan_in = True
+
+    async def _handle(self, item: int):
+        pass
+
+
+def _produce(items: int):
+    instance = FanInCountingService.instance()
+    for i in range(items):
+        instance.send(i)
+    QueueService.drain_all()
+
+
+def _produce_in_children(children: int, items: int = ITEMS):
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_produce, args=(items // children,))
+        for _ in range(children)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+@pytest.mark.parametrize("fan_in", [False, True], ids=["per-process", "fan-in"])
+@pytest.mark.parametrize("children", [1, 4])
+def bench_queue_service_child_processes(
+    benchmark: BenchmarkFixture, children: int, fan_in: bool
+):
+    # Items sent by child processes, handled in each child or forwarded to the parent
+    benchmark.extra_info["items"] = ITEMS
+    if not fan_in:
+        benchmark.pedantic(_produce_in_children, args=(children,), rounds=5)
+        return
+
+    def produce_and_handle():
+        _produce_in_children(children)
+        instance = FanInCountingService.instance()
+        while instance.stats()["handled_count"] < ITEMS:
+            time.sleep(0.001)
+        instance.drain()
+
+    with FanInServer():
+        benchmark.pedantic(produce_and_handle, rounds=5)
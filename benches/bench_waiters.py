@@ -0,0 +1,74 @@
+import asyncio
+import threading
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect._internal.concurrency.api import create_call, from_async, from_sync
+from prefect._internal.concurrency.threads import wait_for_global_loop_exit
+from prefect._internal.concurrency.waiters import SyncWaiter
+
+CALLS = 1_000
+
+
+def identity(x):
+    return x
+
+
+async def aidentity(x):
+    return x
+
+
+async def acall_back(x, thread: threading.Thread):
+    # Send a call back to the waiting thread
+    return await from_async.call_in_waiting_thread(
+        create_call(identity, x), thread=thread
+    )
+
+
+@pytest.fixture(autouse=True)
+def shutdown_global_loop():
+    yield
+    wait_for_global_loop_exit()
+
+
+def bench_sync_waiter_registration(benchmark: BenchmarkFixture):
+    # The part of each round trip spent creating and registering the waiter
+    call = create_call(identity, 1)
+
+    def register():
+        for _ in range(CALLS):
+            SyncWaiter(call).close()
+
+    benchmark.extra_info["calls"] = CALLS
+    benchmark(register)
+
+
+def bench_from_sync_wait_for_call_in_loop_thread(benchmark: BenchmarkFixture):
+    def round_trips():
+        for i in range(CALLS):
+            from_sync.wait_for_call_in_loop_thread(create_call(aidentity, i))
+
+    benchmark.extra_info["calls"] = CALLS
+    benchmark(round_trips)
+
+
+def bench_from_async_wait_for_call_in_loop_thread(benchmark: BenchmarkFixture):
+    async def round_trips():
+        for i in range(CALLS):
+            await from_async.wait_for_call_in_loop_thread(create_call(aidentity, i))
+
+    benchmark.extra_info["calls"] = CALLS
+    benchmark(lambda: asyncio.run(round_trips()))
+
+
+def bench_from_sync_wait_for_call_in_loop_thread_with_callback(
+    benchmark: BenchmarkFixture,
+):
+    def round_trips():
+        thread = threading.current_thread()
+        for i in range(CALLS):
+            from_sync.wait_for_call_in_loop_thread(create_call(acall_back, i, thread))
+
+    benchmark.extra_info["calls"] = CALLS
+    benchmark(round_trips)
@@ -1,24 +1,34 @@
 """
 Primary developer-facing API for concurrency management.
 """
+
 import abc
 import asyncio
 import concurrent.futures
 import contextlib
+import queue
 import threading
 from typing import (
+    AsyncIterator,
     Awaitable,
     Callable,
     ContextManager,
     Iterable,
+    Iterator,
+    List,
     Optional,
     TypeVar,
     Union,
 )
 
+from prefect._internal.concurrency.processes import get_process_pool
+from prefect._internal.concurrency.streams import (
+    DEFAULT_STREAM_BUFFER_SIZE,
+    StreamBuffer,
+)
 from prefect._internal.concurrency.threads import (
-    WorkerThread,
     get_global_loop,
+    get_worker_pool,
     in_global_loop,
 )
 from prefect._internal.concurrency.waiters import (
@@ -38,6 +48,12 @@ def create_call(__fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> Call
     return Call.new(__fn, *args, **kwargs)
 
 
+def create_lightweight_call(
+    __fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+) -> Call[T]:
+    return Call.new_lightweight(__fn, *args, **kwargs)
+
+
 def _cast_to_call(call_like: Union[Callable[[], T], Call[T]]) -> Call[T]:
     if isinstance(call_like, Call):
         return call_like
@@ -45,6 +61,75 @@ def _cast_to_call(call_like: Union[Callable[[], T], Call[T]]) -> Call[T]:
         return create_call(call_like)
 
 
+async def _produce_from_call(
+    source: Call[AsyncIterator[T]], buffer: StreamBuffer[T]
+) -> None:
+    def get_iterator() -> AsyncIterator[T]:
+        source.run()
+        return source.result()
+
+    await buffer.produce(get_iterator)
+
+
+def _submit_stream(
+    source: Call[AsyncIterator[T]], buffer: StreamBuffer[T], timeout: Optional[float]
+) -> Call[None]:
+    call = _base.call_soon_in_loop_thread(
+        create_call(_produce_from_call, source, buffer), timeout=timeout
+    )
+    # End the stream if the call is cancelled before it starts producing
+    call.future.add_done_callback(lambda _: buffer.cancel_if_not_started())
+    return call
+
+
+def _iter_stream(
+    source: Call[AsyncIterator[T]], buffer: StreamBuffer[T], timeout: Optional[float]
+) -> Iterator[T]:
+    _submit_stream(source, buffer, timeout)
+    try:
+        while True:
+            try:
+                items = buffer.get_batch()
+            except StopIteration:
+                break
+            yield from items
+    except GeneratorExit:
+        buffer.close()
+        if buffer.in_producer_loop():
+            # The generator was finalized on the loop thread running the producer,
+            # e.g. by garbage collection in a callback; waiting would deadlock
+            raise
+
+        # Iteration ended early; wait for the producer to exit
+        buffer.wait_for_producer()
+        raise
+    except BaseException:
+        # Stop the producer and wait for it to exit
+        buffer.close()
+        buffer.wait_for_producer()
+        raise
+
+    buffer.wait_for_producer()
+
+
+async def _aiter_stream(
+    source: Call[AsyncIterator[T]], buffer: StreamBuffer[T], timeout: Optional[float]
+) -> AsyncIterator[T]:
+    _submit_stream(source, buffer, timeout)
+    try:
+        while True:
+            try:
+                items = await buffer.aget_batch()
+            except StopAsyncIteration:
+                return
+            for item in items:
+                yield item
+    finally:
+        # Stop the producer if iteration ended early and wait for it to exit
+        buffer.close()
+        await buffer.await_producer()
+
+
 class _base(abc.ABC):
     @abc.abstractstaticmethod
     def wait_for_call_in_loop_thread(
@@ -66,7 +151,7 @@ class _base(abc.ABC):
         done_callbacks: Optional[Iterable[Call]] = None,
     ) -> T:
         """
-        Schedule a function in a new worker thread.
+        Schedule a function in a worker thread.
 
         Returns the result of the call.
         """
@@ -77,12 +162,30 @@ class _base(abc.ABC):
         __call: Union[Callable[[], T], Call[T]], timeout: Optional[float] = None
     ) -> Call[T]:
         """
-        Schedule a call for execution in a new worker thread.
+        Schedule a call for execution in a worker thread from the global pool.
+
+        Returns the submitted call.
+        """
+        call = _cast_to_call(__call)
+        runner = get_worker_pool()
+        call.set_timeout(timeout)
+        runner.submit(call)
+        return call
+
+    @staticmethod
+    def call_soon_in_worker_process(
+        __call: Union[Callable[[], T], Call[T]], timeout: Optional[float] = None
+    ) -> Call[T]:
+        """
+        Schedule a call for execution in a worker process from the global pool.
+
+        If the call times out or is cancelled while running, its worker process is
+        terminated.
 
         Returns the submitted call.
         """
         call = _cast_to_call(__call)
-        runner = WorkerThread(run_once=True)
+        runner = get_process_pool()
         call.set_timeout(timeout)
         runner.submit(call)
         return call
@@ -103,6 +206,28 @@ class _base(abc.ABC):
         runner.submit(call)
         return call
 
+    @staticmethod
+    def call_soon_many_in_loop_thread(
+        __calls: Iterable[Union[Callable[[], Awaitable[T]], Call[Awaitable[T]]]],
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[Call[T]]:
+        """
+        Schedule many calls for execution in the global event loop thread.
+
+        The calls are handed to the event loop together instead of one at a time. If
+        `max_concurrency` is set, at most that many of the calls run at once. The
+        timeout applies to each call.
+
+        Returns the submitted calls, in order.
+        """
+        calls = [_cast_to_call(call) for call in __calls]
+        runner = get_global_loop()
+        for call in calls:
+            call.set_timeout(timeout)
+        runner.submit_many(calls, max_concurrency=max_concurrency)
+        return calls
+
     @staticmethod
     def call_soon_in_waiting_thread(
         __call: Union[Callable[[], T], Call[T]],
@@ -142,7 +267,18 @@ class _base(abc.ABC):
         __call: Union[Callable[[], T], Call[T]], timeout: Optional[float] = None
     ) -> T:
         """
-        Run a call in a new worker thread.
+        Run a call in a worker thread.
+
+        Returns the result of the call.
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def call_in_worker_process(
+        __call: Union[Callable[[], T], Call[T]], timeout: Optional[float] = None
+    ) -> T:
+        """
+        Run a call in a worker process.
 
         Returns the result of the call.
         """
@@ -160,6 +296,54 @@ class _base(abc.ABC):
         """
         raise NotImplementedError()
 
+    @staticmethod
+    def call_many_in_loop_thread(
+        __calls: Iterable[Union[Callable[[], Awaitable[T]], Call[Awaitable[T]]]],
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[T]:
+        """
+        Run many calls in the global event loop thread.
+
+        Returns the results of the calls, in order. If any call fails, the exception
+        of the first one to fail in order is raised.
+
+        Unlike `call_in_loop_thread`, the calls are not run inline when waiting from
+        the global event loop thread; a `RuntimeError` is raised instead. Coroutine
+        calls cannot finish while the loop is blocked waiting for them.
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def call_many_in_loop_thread_as_completed(
+        __calls: Iterable[Union[Callable[[], Awaitable[T]], Call[Awaitable[T]]]],
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Iterable[Call[T]]:
+        """
+        Run many calls in the global event loop thread.
+
+        Yields each call as it completes. Like `call_many_in_loop_thread`, raises a
+        `RuntimeError` when waiting from the global event loop thread.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractstaticmethod
+    def iter_in_loop_thread(
+        __call: Union[Callable[[], AsyncIterator[T]], Call[AsyncIterator[T]]],
+        timeout: Optional[float] = None,
+        buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+    ) -> Iterable[T]:
+        """
+        Iterate over an async iterator in the global event loop thread.
+
+        Items are passed through a buffer of `buffer_size` items; the iterator is
+        paused while the buffer is full. The iterator is not started until iteration
+        begins, and ending iteration early stops it. The timeout applies to the whole
+        iteration.
+        """
+        raise NotImplementedError()
+
 
 class from_async(_base):
     @staticmethod
@@ -170,15 +354,15 @@ class from_async(_base):
         contexts: Optional[Iterable[ContextManager]] = None,
     ) -> Awaitable[T]:
         call = _cast_to_call(__call)
-        waiter = AsyncWaiter(call)
-        for callback in done_callbacks or []:
-            waiter.add_done_callback(callback)
-        _base.call_soon_in_loop_thread(call, timeout=timeout)
-        with contextlib.ExitStack() as stack:
-            for context in contexts or []:
-                stack.enter_context(context)
-            await waiter.wait()
-            return call.result()
+        with contextlib.closing(AsyncWaiter(call)) as waiter:
+            for callback in done_callbacks or []:
+                waiter.add_done_callback(callback)
+            _base.call_soon_in_loop_thread(call, timeout=timeout)
+            with contextlib.ExitStack() as stack:
+                for context in contexts or []:
+                    stack.enter_context(context)
+                await waiter.wait()
+                return call.result()
 
     @staticmethod
     async def wait_for_call_in_new_thread(
@@ -187,12 +371,12 @@ class from_async(_base):
         done_callbacks: Optional[Iterable[Call]] = None,
     ) -> Call[T]:
         call = _cast_to_call(__call)
-        waiter = AsyncWaiter(call=call)
-        for callback in done_callbacks or []:
-            waiter.add_done_callback(callback)
-        _base.call_soon_in_new_thread(call, timeout=timeout)
-        await waiter.wait()
-        return call.result()
+        with contextlib.closing(AsyncWaiter(call=call)) as waiter:
+            for callback in done_callbacks or []:
+                waiter.add_done_callback(callback)
+            _base.call_soon_in_new_thread(call, timeout=timeout)
+            await waiter.wait()
+            return call.result()
 
     @staticmethod
     def call_in_waiting_thread(
@@ -210,6 +394,13 @@ class from_async(_base):
         call = _base.call_soon_in_new_thread(__call, timeout=timeout)
         return call.aresult()
 
+    @staticmethod
+    def call_in_worker_process(
+        __call: Union[Callable[[], T], Call[T]], timeout: Optional[float] = None
+    ) -> Awaitable[T]:
+        call = _base.call_soon_in_worker_process(__call, timeout=timeout)
+        return call.aresult()
+
     @staticmethod
     def call_in_loop_thread(
         __call: Union[Callable[[], Awaitable[T]], Call[Awaitable[T]]],
@@ -218,6 +409,50 @@ class from_async(_base):
         call = _base.call_soon_in_loop_thread(__call, timeout=timeout)
         return call.aresult()
 
+    @staticmethod
+    async def call_many_in_loop_thread(
+        __calls: Iterable[Union[Callable[[], Awaitable[T]], Call[Awaitable[T]]]],
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[T]:
+        calls = _base.call_soon_many_in_loop_thread(
+            __calls, timeout=timeout, max_concurrency=max_concurrency
+        )
+        return [await call.aresult() for call in calls]
+
+    @staticmethod
+    def call_many_in_loop_thread_as_completed(
+        __calls: Iterable[Union[Callable[[], Awaitable[T]], Call[Awaitable[T]]]],
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Call[T]]:
+        loop = asyncio.get_running_loop()
+        done: asyncio.Queue = asyncio.Queue()
+        calls = [_cast_to_call(call) for call in __calls]
+        for call in calls:
+            call.future.add_done_callback(
+                lambda _, call=call: loop.call_soon_threadsafe(done.put_nowait, call)
+            )
+
+        _base.call_soon_many_in_loop_thread(
+            calls, timeout=timeout, max_concurrency=max_concurrency
+        )
+
+        async def as_completed():
+            for _ in calls:
+                yield await done.get()
+
+        return as_completed()
+
+    @staticmethod
+    def iter_in_loop_thread(
+        __call: Union[Callable[[], AsyncIterator[T]], Call[AsyncIterator[T]]],
+        timeout: Optional[float] = None,
+        buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+    ) -> AsyncIterator[T]:
+        buffer = StreamBuffer(buffer_size)
+        return _aiter_stream(_cast_to_call(__call), buffer, timeout)
+
 
 class from_sync(_base):
     @staticmethod
@@ -231,15 +466,15 @@ class from_sync(_base):
         contexts: Optional[Iterable[ContextManager]] = None,
     ) -> Awaitable[T]:
         call = _cast_to_call(__call)
-        waiter = SyncWaiter(call)
-        _base.call_soon_in_loop_thread(call, timeout=timeout)
-        for callback in done_callbacks or []:
-            waiter.add_done_callback(callback)
-        with contextlib.ExitStack() as stack:
-            for context in contexts or []:
-                stack.enter_context(context)
-            waiter.wait()
-            return call.result()
+        with contextlib.closing(SyncWaiter(call)) as waiter:
+            _base.call_soon_in_loop_thread(call, timeout=timeout)
+            for callback in done_callbacks or []:
+                waiter.add_done_callback(callback)
+            with contextlib.ExitStack() as stack:
+                for context in contexts or []:
+                    stack.enter_context(context)
+                waiter.wait()
+                return call.result()
 
     @staticmethod
     def wait_for_call_in_new_thread(
@@ -248,12 +483,12 @@ class from_sync(_base):
         done_callbacks: Optional[Iterable[Call]] = None,
     ) -> Call[T]:
         call = _cast_to_call(__call)
-        waiter = SyncWaiter(call=call)
-        for callback in done_callbacks or []:
-            waiter.add_done_callback(callback)
-        _base.call_soon_in_new_thread(call, timeout=timeout)
-        waiter.wait()
-        return call.result()
+        with contextlib.closing(SyncWaiter(call=call)) as waiter:
+            for callback in done_callbacks or []:
+                waiter.add_done_callback(callback)
+            _base.call_soon_in_new_thread(call, timeout=timeout)
+            waiter.wait()
+            return call.result()
 
     @staticmethod
     def call_in_waiting_thread(
@@ -271,6 +506,13 @@ class from_sync(_base):
         call = _base.call_soon_in_new_thread(__call, timeout=timeout)
         return call.result()
 
+    @staticmethod
+    def call_in_worker_process(
+        __call: Union[Callable[[], T], Call[T]], timeout: Optional[float] = None
+    ) -> T:
+        call = _base.call_soon_in_worker_process(__call, timeout=timeout)
+        return call.result()
+
     @staticmethod
     def call_in_loop_thread(
         __call: Union[Callable[[], Awaitable[T]], Call[Awaitable[T]]],
@@ -284,3 +526,57 @@ class from_sync(_base):
 
         call = _base.call_soon_in_loop_thread(__call, timeout=timeout)
         return call.result()
+
+    @staticmethod
+    def call_many_in_loop_thread(
+        __calls: Iterable[Union[Callable[[], Awaitable[T]], Call[Awaitable[T]]]],
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[T]:
+        if in_global_loop():
+            raise RuntimeError(
+                "Cannot wait for calls in the global event loop thread from the"
+                " global event loop thread."
+            )
+
+        calls = _base.call_soon_many_in_loop_thread(
+            __calls, timeout=timeout, max_concurrency=max_concurrency
+        )
+        return [call.result() for call in calls]
+
+    @staticmethod
+    def call_many_in_loop_thread_as_completed(
+        __calls: Iterable[Union[Callable[[], Awaitable[T]], Call[Awaitable[T]]]],
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Iterator[Call[T]]:
+        if in_global_loop():
+            raise RuntimeError(
+                "Cannot wait for calls in the global event loop thread from the"
+                " global event loop thread."
+            )
+
+        done: queue.SimpleQueue = queue.SimpleQueue()
+        calls = [_cast_to_call(call) for call in __calls]
+        for call in calls:
+            call.future.add_done_callback(lambda _, call=call: done.put(call))
+
+        _base.call_soon_many_in_loop_thread(
+            calls, timeout=timeout, max_concurrency=max_concurrency
+        )
+        return (done.get() for _ in calls)
+
+    @staticmethod
+    def iter_in_loop_thread(
+        __call: Union[Callable[[], AsyncIterator[T]], Call[AsyncIterator[T]]],
+        timeout: Optional[float] = None,
+        buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+    ) -> Iterator[T]:
+        if in_global_loop():
+            raise RuntimeError(
+                "Cannot iterate in the global event loop thread from the global event"
+                " loop thread."
+            )
+
+        buffer = StreamBuffer(buffer_size)
+        return _iter_stream(_cast_to_call(__call), buffer, timeout)
@@ -23,9 +23,11 @@ from typing import Any, Awaitable, Callable, Dict, Generic, Optional, Tuple, Typ
 from prefect._internal.concurrency import logger
 from prefect._internal.concurrency.cancellation import (
     CancelledError,
+    CancelScope,
     cancel_async_at,
     cancel_sync_at,
     get_deadline,
+    get_timeout,
 )
 from prefect._internal.concurrency.event_loop import get_running_loop
 from typing_extensions import ParamSpec
@@ -75,7 +77,8 @@ class Future(concurrent.futures.Future):
         super().__init__()
         self._cancel_scope = None
         self._deadline = None
-        self._cancel_callbacks = []
+        # Most futures never have cancel callbacks; avoid allocating a list for each
+        self._cancel_callbacks = ()
         self._name = name
         self._timed_out = False
 
@@ -97,6 +100,18 @@ class Future(concurrent.futures.Future):
                 self._cancel_scope.add_cancel_callback(callback)
             yield self._cancel_scope
 
+    @contextlib.contextmanager
+    def enforce_deadline_with(self, scope: CancelScope):
+        """
+        Enforce the deadline with a cancel scope that has not been entered yet, for
+        calls that are run elsewhere by their portal.
+        """
+        scope.set_timeout(get_timeout(self._deadline))
+        with scope as self._cancel_scope:
+            for callback in self._cancel_callbacks:
+                self._cancel_scope.add_cancel_callback(callback)
+            yield self._cancel_scope
+
     def add_cancel_callback(self, callback: Callable[[], None]):
         """
         Add a callback to be enforced on cancellation.
@@ -112,6 +127,8 @@ class Future(concurrent.futures.Future):
             self._cancel_scope.add_cancel_callback(callback)
 
         # Also add callbacks to tracking list
+        if not self._cancel_callbacks:
+            self._cancel_callbacks = []
         self._cancel_callbacks.append(callback)
 
     def timedout(self) -> bool:
@@ -209,7 +226,7 @@ class Future(concurrent.futures.Future):
                 except Exception:
                     logger.exception("exception calling callback for %r", self)
 
-        self._cancel_callbacks = []
+        self._cancel_callbacks = ()
         if self._cancel_scope:
             self._cancel_scope._callbacks = []
             self._cancel_scope = None
@@ -219,15 +236,32 @@ class Future(concurrent.futures.Future):
 class Call(Generic[T]):
     """
     A deferred function call.
+
+    Calls created with `new_lightweight` do not capture a context and run in the
+    context of their runner instead. They are not tracked as the current call and,
+    unless a timeout is set, run without a cancel scope, so they cannot be cancelled
+    once they have started. They are meant for internal calls that do not depend on
+    context variables.
     """
 
+    __slots__ = (
+        "future",
+        "fn",
+        "args",
+        "kwargs",
+        "context",
+        "timeout",
+        "runner",
+        "__weakref__",
+    )
+
     future: Future
     fn: Callable[..., T]
     args: Tuple
     kwargs: Dict[str, Any]
-    context: contextvars.Context
-    timeout: float
-    runner: Optional["Portal"] = None
+    context: Optional[contextvars.Context]
+    timeout: Optional[float]
+    runner: Optional["Portal"]
 
     @classmethod
     def new(cls, __fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> "Call[T]":
@@ -238,6 +272,24 @@ class Call(Generic[T]):
             kwargs=kwargs,
             context=contextvars.copy_context(),
             timeout=None,
+            runner=None,
+        )
+
+    @classmethod
+    def new_lightweight(
+        cls, __fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+    ) -> "Call[T]":
+        """
+        Create a call that does not capture the current context.
+        """
+        return cls(
+            future=Future(name=getattr(__fn, "__name__", str(__fn))),
+            fn=__fn,
+            args=args,
+            kwargs=kwargs,
+            context=None,
+            timeout=None,
+            runner=None,
         )
 
     def set_timeout(self, timeout: Optional[float] = None) -> None:
@@ -278,7 +330,7 @@ class Call(Generic[T]):
             f" with timeout of {self.timeout}s" if self.timeout is not None else "",
         )
 
-        coro = self.context.run(self._run_sync)
+        coro = self._run_in_context(self._run_sync)
 
         if coro is not None:
             loop = get_running_loop()
@@ -290,7 +342,7 @@ class Call(Generic[T]):
                     self,
                     loop,
                 )
-                task = self.context.run(loop.create_task, self._run_async(coro))
+                task = self._run_in_context(loop.create_task, self._run_async(coro))
 
                 # Prevent tasks from being garbage collected before completion
                 # See https://docs.python.org/3.10/library/asyncio-task.html#asyncio.create_task
@@ -304,10 +356,15 @@ class Call(Generic[T]):
             else:
                 # Otherwise, execute the function here
                 logger.debug("Executing coroutine for call %r in new loop", self)
-                return self.context.run(asyncio.run, self._run_async(coro))
+                return self._run_in_context(asyncio.run, self._run_async(coro))
 
         return None
 
+    def _run_in_context(self, fn: Callable[..., T], *args: Any) -> T:
+        if self.context is None:
+            return fn(*args)
+        return self.context.run(fn, *args)
+
     def result(self, timeout: Optional[float] = None) -> T:
         """
         Wait for the result of the call.
@@ -342,19 +399,28 @@ class Call(Generic[T]):
     def cancel(self) -> bool:
         return self.future.cancel()
 
+    def _is_lightweight(self) -> bool:
+        return self.context is None and self.timeout is None
+
+    def _call_fn(self):
+        try:
+            return self.fn(*self.args, **self.kwargs)
+        finally:
+            # Forget this call's arguments in order to free up any memory that may be
+            # referenced by them; after a call has happened, there's no need to keep a
+            # reference to them
+            self.args = None
+            self.kwargs = None
+
     def _run_sync(self):
         cancel_scope = None
         try:
-            with set_current_call(self):
-                with self.future.enforce_sync_deadline() as cancel_scope:
-                    try:
-                        result = self.fn(*self.args, **self.kwargs)
-                    finally:
-                        # Forget this call's arguments in order to free up any memory
-                        # that may be referenced by them; after a call has happened,
-                        # there's no need to keep a reference to them
-                        self.args = None
-                        self.kwargs = None
+            if self._is_lightweight():
+                result = self._call_fn()
+            else:
+                with set_current_call(self):
+                    with self.future.enforce_sync_deadline() as cancel_scope:
+                        result = self._call_fn()
 
             # Return the coroutine for async execution
             if inspect.isawaitable(result):
@@ -362,10 +428,10 @@ class Call(Generic[T]):
 
         except CancelledError:
             # Report cancellation
-            if cancel_scope.timedout():
+            if cancel_scope is not None and cancel_scope.timedout():
                 self.future._timed_out = True
                 self.future.cancel()
-            elif cancel_scope.cancelled():
+            elif cancel_scope is not None and cancel_scope.cancelled():
                 self.future.cancel()
             else:
                 raise
@@ -382,22 +448,18 @@ class Call(Generic[T]):
     async def _run_async(self, coro):
         cancel_scope = None
         try:
-            with set_current_call(self):
-                with self.future.enforce_async_deadline() as cancel_scope:
-                    try:
+            if self._is_lightweight():
+                result = await coro
+            else:
+                with set_current_call(self):
+                    with self.future.enforce_async_deadline() as cancel_scope:
                         result = await coro
-                    finally:
-                        # Forget this call's arguments in order to free up any memory
-                        # that may be referenced by them; after a call has happened,
-                        # there's no need to keep a reference to them
-                        self.args = None
-                        self.kwargs = None
         except CancelledError:
             # Report cancellation
-            if cancel_scope.timedout():
+            if cancel_scope is not None and cancel_scope.timedout():
                 self.future._timed_out = True
                 self.future.cancel()
-            elif cancel_scope.cancelled():
+            elif cancel_scope is not None and cancel_scope.cancelled():
                 self.future.cancel()
             else:
                 raise
@@ -5,14 +5,18 @@ Utilities for cancellation in synchronous and asynchronous contexts.
 import abc
 import asyncio
 import contextlib
+import contextvars
 import ctypes
+import heapq
+import itertools
 import math
 import os
 import signal
 import sys
 import threading
 import time
-from typing import Callable, Dict, Optional, Type
+import weakref
+from typing import Callable, Dict, List, Optional, Tuple, Type
 
 import anyio
 from prefect._internal.concurrency import logger
@@ -21,6 +25,28 @@ from prefect._internal.concurrency.event_loop import get_running_loop
 _THREAD_SHIELDS: Dict[threading.Thread, "ThreadShield"] = {}
 _THREAD_SHIELDS_LOCK = threading.Lock()
 
+# The innermost cancel scope entered in the current context; scopes link to the scope
+# that was current when they were entered. Copies of the context, e.g. for tasks or
+# calls, can outlive the scope so weak references are stored instead of the scopes.
+_current_cancel_scope: contextvars.ContextVar[Optional["weakref.ref[CancelScope]"]] = (
+    contextvars.ContextVar("current_cancel_scope", default=None)
+)
+
+
+def _active_cancel_scopes():
+    """
+    Iterate over the current cancel scope and the scopes enclosing it, skipping scopes
+    that have exited.
+    """
+    ref = _current_cancel_scope.get()
+    while ref is not None:
+        scope = ref()
+        if scope is None:
+            break
+        if not scope._exited:
+            yield scope
+        ref = scope._parent
+
 
 class ThreadShield:
     """
@@ -106,7 +132,8 @@ def shield():
     in this module.
 
     If an event loop is running in the thread where this is called, it will be shielded
-    from asynchronous cancellation as well.
+    from asynchronous cancellation as well. Cancellation checkpoints within the scope
+    do not raise; see `check_cancelled`.
     """
     with (
         anyio.CancelScope(shield=True)
@@ -114,7 +141,34 @@ def shield():
         else contextlib.nullcontext()
     ):
         with _get_thread_shield(threading.current_thread()):
-            yield
+            token = _current_cancel_scope.set(None)
+            try:
+                yield
+            finally:
+                _current_cancel_scope.reset(token)
+
+
+def get_current_cancel_scope() -> Optional["CancelScope"]:
+    """
+    Get the innermost cancel scope entered in the current context.
+
+    Returns `None` if there is no cancel scope or within a `shield`.
+    """
+    return next(_active_cancel_scopes(), None)
+
+
+def check_cancelled() -> None:
+    """
+    A cancellation checkpoint for synchronous code.
+
+    Raises a `CancelledError` if the current cancel scope or any scope enclosing it
+    has been cancelled. This only reads flags, so it is cheap enough to call on every
+    iteration of a long loop, and lets the loop exit at a point of its choosing
+    instead of wherever an injected exception or signal would land.
+    """
+    for scope in _active_cancel_scopes():
+        if scope._cancelled:
+            raise CancelledError()
 
 
 class CancelScope(abc.ABC):
@@ -142,6 +196,9 @@ class CancelScope(abc.ABC):
         self._timeout = timeout
         self._lock = threading.Lock()
         self._callbacks = []
+        self._exited = False
+        self._parent: Optional[weakref.ref[CancelScope]] = None
+        self._context_token: Optional[contextvars.Token] = None
         super().__init__()
 
     def __enter__(self):
@@ -150,6 +207,10 @@ class CancelScope(abc.ABC):
             self._started = True
             self._start_time = time.monotonic()
 
+        # Make the scope available to cancellation checkpoints
+        self._parent = _current_cancel_scope.get()
+        self._context_token = _current_cancel_scope.set(weakref.ref(self))
+
         logger.debug("%r entered", self)
         return self
 
@@ -159,6 +220,17 @@ class CancelScope(abc.ABC):
                 self._completed = True
             self._end_time = time.monotonic()
 
+        # Contexts copied while the scope was entered may still refer to it
+        self._exited = True
+
+        if self._context_token is not None:
+            try:
+                _current_cancel_scope.reset(self._context_token)
+            except ValueError:
+                # The scope was exited in another context than it was entered in
+                pass
+            self._context_token = None
+
         logger.debug("%r exited", self)
 
     @property
@@ -317,66 +389,200 @@ class NullCancelScope(CancelScope):
         return False
 
 
-class AlarmCancelScope(CancelScope):
+class _AlarmMultiplexer:
     """
-    A cancel scope that uses an alarm signal which can interrupt long-running system
-    calls.
+    Dispatches alarm signals to the alarm cancel scopes that are active in the main
+    thread.
 
-    Only the main thread can be cancelled with an alarm signal, so this scope is only
-    available in the main thread.
-    """
+    The deadlines of the scopes are kept in a heap and the interval timer is armed
+    for the earliest one, so nested scopes share a single signal handler and timer.
+    The handler and timer that were set before the first scope entered are restored
+    when the last scope exits.
 
-    def __enter__(self):
-        super().__enter__()
+    Alarm signals are blocked while the scopes or the timer are changed. An alarm
+    handled by the main thread during a change anyway, e.g. after the signal was
+    delivered to another thread, is deferred until the change is done.
 
-        current_thread = threading.current_thread()
+    Must only be used from the main thread.
+    """
+
+    def __init__(self) -> None:
+        self._scopes: List["AlarmCancelScope"] = []
+        self._heap: List[Tuple[float, int, "AlarmCancelScope"]] = []
+        self._counter = itertools.count()
+        self._armed_deadline: Optional[float] = None
+        self._previous_handler = None
         self._previous_timer = None
+        self._changing = 0
+        self._alarm_deferred = False
 
-        if current_thread is not threading.main_thread():
-            raise ValueError(
-                "Alarm based timeouts can only be used in the main thread."
-            )
+    @contextlib.contextmanager
+    def _changes(self):
+        """
+        Block alarm signals while changing the scopes or the timer.
+        """
+        previous_mask = signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})
+        self._changing += 1
+        try:
+            yield
+        finally:
+            self._changing -= 1
+            if not self._changing and not self._scopes:
+                # Discard an alarm for the scopes that have exited, since the handler
+                # it would run has been restored
+                self._alarm_deferred = False
+                if signal.SIGALRM in signal.sigpending():
+                    signal.sigwait({signal.SIGALRM})
+
+            signal.pthread_sigmask(signal.SIG_SETMASK, previous_mask)
+
+            if not self._changing and self._alarm_deferred:
+                self._alarm_deferred = False
+                self.handle_alarm()
+
+    def add(self, scope: "AlarmCancelScope") -> None:
+        with self._changes():
+            self._add(scope)
+
+    def _add(self, scope: "AlarmCancelScope") -> None:
+        if not self._scopes:
+            self._previous_handler = signal.getsignal(signal.SIGALRM)
+
+            if self._previous_handler != signal.SIG_DFL:
+                logger.warning(
+                    "%r overriding existing alarm handler %s",
+                    scope,
+                    self._previous_handler,
+                )
 
-        self._previous_alarm_handler = signal.getsignal(signal.SIGALRM)
+            # Capture alarm signals and raise a timeout
+            signal.signal(signal.SIGALRM, self.handle_alarm)
 
-        if self._previous_alarm_handler != signal.SIG_DFL:
-            logger.warning(
-                "%r overriding existing alarm handler %s",
-                self,
-                self._previous_alarm_handler,
-            )
+            # Disarm the previous timer until the last scope exits
+            self._previous_timer = signal.setitimer(signal.ITIMER_REAL, 0)
 
-        # Capture alarm signals and raise a timeout
-        signal.signal(signal.SIGALRM, self._sigalarm_to_error)
+        self._scopes.append(scope)
+        scope._alarm_active = True
 
-        # Set a timer to raise an alarm signal
-        if self.timeout is not None:
-            # Use `setitimer` instead of `signal.alarm` for float support; raises a SIGALRM
-            logger.debug("%r set alarm timer for %f seconds", self, self.timeout)
-            self._previous_timer = signal.setitimer(signal.ITIMER_REAL, self.timeout)
+        if scope._deadline is not None:
+            heapq.heappush(self._heap, (scope._deadline, next(self._counter), scope))
+            self._arm()
 
-        return self
+    def remove(self, scope: "AlarmCancelScope") -> None:
+        with self._changes():
+            self._remove(scope)
+
+    def _remove(self, scope: "AlarmCancelScope") -> None:
+        self._scopes.remove(scope)
+        scope._alarm_active = False
+
+        if self._scopes:
+            self._arm()
+            return
+
+        self._heap.clear()
+        self._armed_deadline = None
+
+        # Restore the previous timer and signal handler
+        signal.setitimer(signal.ITIMER_REAL, *self._previous_timer)
+        signal.signal(signal.SIGALRM, self._previous_handler)
+
+    def active(self) -> bool:
+        return bool(self._scopes)
 
-    def _sigalarm_to_error(self, *args):
-        logger.debug("%r captured alarm raising as cancelled error", self)
-        if self.cancel(throw=False):
+    def _arm(self) -> None:
+        """
+        Set the timer for the earliest deadline of the active scopes.
+        """
+        with self._changes():
+            self._arm_earliest()
+
+    def _arm_earliest(self) -> None:
+        # Exited scopes are removed from the heap lazily
+        while self._heap and not self._heap[0][2]._alarm_pending():
+            heapq.heappop(self._heap)
+
+        deadline = self._heap[0][0] if self._heap else None
+        if deadline == self._armed_deadline:
+            return
+
+        self._armed_deadline = deadline
+        if deadline is None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        else:
+            # Use `setitimer` instead of `signal.alarm` for float support; a zero
+            # delay would disarm the timer instead
+            delay = max(deadline - time.monotonic(), 1e-6)
+            logger.debug("Set alarm timer for %f seconds", delay)
+            signal.setitimer(signal.ITIMER_REAL, delay)
+
+    def handle_alarm(self, *args) -> None:
+        if self._changing:
+            self._alarm_deferred = True
+            return
+
+        self._armed_deadline = None
+
+        # Cancel the scopes that have reached their deadline
+        now = time.monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, scope = heapq.heappop(self._heap)
+            if scope._alarm_pending():
+                scope.cancel(throw=False)
+
+        self._arm()
+
+        # Raise for scopes that were cancelled and have not raised yet, including
+        # those cancelled manually
+        raised = False
+        for scope in self._scopes:
+            if scope.cancelled() and not scope._alarm_raised:
+                scope._alarm_raised = True
+                raised = True
+
+        if raised:
+            logger.debug("Alarm captured; raising as cancelled error")
             shield = _get_thread_shield(threading.main_thread())
             if shield.active():
-                logger.debug("%r thread shield active; delaying exception", self)
+                logger.debug("Thread shield active; delaying exception")
                 shield.set_exception(CancelledError())
             else:
                 raise CancelledError()
 
-    def __exit__(self, *_):
-        retval = super().__exit__(*_)
 
-        if self.timeout is not None:
-            # Restore the previous timer
-            signal.setitimer(signal.ITIMER_REAL, *self._previous_timer)
+_ALARMS = _AlarmMultiplexer()
 
-        # Restore the previous signal handler
-        signal.signal(signal.SIGALRM, self._previous_alarm_handler)
 
+class AlarmCancelScope(CancelScope):
+    """
+    A cancel scope that uses an alarm signal which can interrupt long-running system
+    calls.
+
+    Only the main thread can be cancelled with an alarm signal, so this scope is only
+    available in the main thread. Nested alarm scopes share one signal handler and
+    timer; see `_AlarmMultiplexer`.
+    """
+
+    def __enter__(self):
+        # Check before entering so a failed scope is not left as the current scope
+        if threading.current_thread() is not threading.main_thread():
+            raise ValueError(
+                "Alarm based timeouts can only be used in the main thread."
+            )
+
+        super().__enter__()
+        self._alarm_active = False
+        self._alarm_raised = False
+
+        _ALARMS.add(self)
+        return self
+
+    def _alarm_pending(self) -> bool:
+        return self._alarm_active and not self._alarm_raised and not self._completed
+
+    def __exit__(self, *_):
+        retval = super().__exit__(*_)
+        _ALARMS.remove(self)
         return retval
 
     def cancel(self, throw: bool = True):
@@ -390,6 +596,166 @@ class AlarmCancelScope(CancelScope):
         return True
 
 
+class _ScheduledDeadline:
+    """
+    A callback scheduled by a `DeadlineScheduler`.
+
+    The callback is cleared when the deadline is cancelled or when it starts running.
+    """
+
+    __slots__ = ("deadline", "seq", "callback")
+
+    def __init__(self, deadline: float, seq: int, callback: Callable[[], None]):
+        self.deadline = deadline
+        self.seq = seq
+        self.callback: Optional[Callable[[], None]] = callback
+
+    def __lt__(self, other: "_ScheduledDeadline") -> bool:
+        return (self.deadline, self.seq) < (other.deadline, other.seq)
+
+
+class DeadlineScheduler:
+    """
+    Runs callbacks at deadlines from a single shared thread.
+
+    Deadlines are kept in a heap, so scheduling and cancelling a deadline is
+    O(log n) and does not start a thread. The thread is started when a deadline is
+    scheduled and exits once it has been idle for `idle_timeout` seconds.
+
+    Callbacks run in the scheduler thread and should not block, or they will delay
+    other deadlines.
+    """
+
+    def __init__(
+        self, name: str = "DeadlineScheduler", idle_timeout: float = 1.0
+    ) -> None:
+        self.name = name
+        self.idle_timeout = idle_timeout
+        self._heap: List[_ScheduledDeadline] = []
+        self._condition = threading.Condition(threading.Lock())
+        self._thread: Optional[threading.Thread] = None
+        self._firing: Optional[_ScheduledDeadline] = None
+        self._cancelled_count = 0
+        self._counter = itertools.count()
+
+    def schedule(
+        self, deadline: float, callback: Callable[[], None]
+    ) -> _ScheduledDeadline:
+        """
+        Schedule a callback to run at a deadline computed with the monotonic clock.
+
+        Returns a handle that can be passed to `cancel`.
+        """
+        entry = _ScheduledDeadline(deadline, next(self._counter), callback)
+        with self._condition:
+            heapq.heappush(self._heap, entry)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self.name, daemon=True
+                )
+                self._thread.start()
+            elif self._heap[0] is entry:
+                # Wake the thread to wait for the earlier deadline
+                self._condition.notify_all()
+
+        return entry
+
+    def cancel(self, entry: _ScheduledDeadline) -> bool:
+        """
+        Cancel a scheduled callback.
+
+        If the callback is running, waits for it to finish. Returns `False` if the
+        callback already ran.
+        """
+        with self._condition:
+            if entry.callback is not None:
+                entry.callback = None
+                self._cancelled_count += 1
+
+                if self._heap[0] is entry:
+                    # Wake the thread so it does not wait for the cancelled deadline
+                    self._condition.notify_all()
+
+                # Cancelled entries are dropped lazily; rebuild the heap if they make
+                # up most of it so long deadlines do not accumulate
+                if self._cancelled_count > 64 and self._cancelled_count * 2 > len(
+                    self._heap
+                ):
+                    self._heap = [e for e in self._heap if e.callback is not None]
+                    heapq.heapify(self._heap)
+                    self._cancelled_count = 0
+
+                return True
+
+            while self._firing is entry:
+                self._condition.wait()
+
+            return False
+
+    def pending(self) -> int:
+        """
+        The number of deadlines that have not been cancelled or run.
+        """
+        with self._condition:
+            return len(self._heap) - self._cancelled_count
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    # Drop cancelled deadlines
+                    while self._heap and self._heap[0].callback is None:
+                        heapq.heappop(self._heap)
+                        self._cancelled_count -= 1
+
+                    if not self._heap:
+                        if not self._condition.wait(self.idle_timeout) and not (
+                            self._heap
+                        ):
+                            self._thread = None
+                            return
+                        continue
+
+                    timeout = self._heap[0].deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+
+                entry = heapq.heappop(self._heap)
+                callback, entry.callback = entry.callback, None
+                self._firing = entry
+
+            try:
+                callback()
+            except Exception:
+                logger.exception("%s encountered exception in %r", self.name, callback)
+            finally:
+                with self._condition:
+                    self._firing = None
+                    self._condition.notify_all()
+
+
+_DEADLINE_SCHEDULER = DeadlineScheduler()
+
+
+def get_deadline_scheduler() -> DeadlineScheduler:
+    """
+    Get the deadline scheduler shared by cancel scopes in this process.
+    """
+    return _DEADLINE_SCHEDULER
+
+
+def _reset_deadline_scheduler_after_fork() -> None:
+    # The scheduler thread does not exist in the child
+    global _DEADLINE_SCHEDULER
+    _DEADLINE_SCHEDULER = DeadlineScheduler()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_deadline_scheduler_after_fork)
+
+
 class WatcherThreadCancelScope(CancelScope):
     """
     A cancel scope that uses a watcher thread and an injected exception to enforce
@@ -399,32 +765,36 @@ class WatcherThreadCancelScope(CancelScope):
     instruction. This can raise exceptions in unexpected places. See `shield` for
     guarding against interruption.
 
-    If a timeout is specified, a watcher thread is spawned that will run for `timeout`
-    seconds then send the exception to the supervised thread.
+    If a timeout is specified, the deadline is watched by the shared
+    `DeadlineScheduler` thread, which sends the exception to the supervised thread
+    once the deadline passes. If the supervised thread is shielded at that time, a
+    thread is started to send the exception once the shield is released.
     """
 
     def __enter__(self):
         super().__enter__()
-        self._event = threading.Event()
-        self._enforcer_thread = None
+        self._scheduler = None
+        self._scheduled = None
+        self._delivery_thread = None
         self._supervised_thread = threading.current_thread()
 
         if self.timeout is not None:
-            name = self.name or f"for scope {hex(id(self))}"
-            self._enforcer_thread = threading.Thread(
-                target=self._timeout_enforcer,
-                name=f"timeout-watcher {name} {self.timeout:.2f}",
+            self._scheduler = get_deadline_scheduler()
+            self._scheduled = self._scheduler.schedule(
+                self._deadline, self._timeout_enforcer
             )
-            self._enforcer_thread.start()
 
         return self
 
     def __exit__(self, *_):
         retval = super().__exit__(*_)
-        self._event.set()
-        if self._enforcer_thread:
-            logger.debug("%r joining enforcer thread %r", self, self._enforcer_thread)
-            self._enforcer_thread.join()
+        if self._scheduled is not None:
+            # Waits for the enforcer if it is running
+            self._scheduler.cancel(self._scheduled)
+            self._scheduled = None
+        if self._delivery_thread:
+            logger.debug("%r joining delivery thread %r", self, self._delivery_thread)
+            self._delivery_thread.join()
         return retval
 
     def _send_cancelled_error(self):
@@ -446,17 +816,26 @@ class WatcherThreadCancelScope(CancelScope):
 
     def _timeout_enforcer(self):
         """
-        Target for a thread that enforces a timeout.
+        Callback for the deadline scheduler that enforces a timeout.
         """
-        if not self._event.wait(self.timeout):
-            logger.debug("%r enforcer detected timeout!", self)
-            if self.cancel(throw=False):
-                with _get_thread_shield(self._supervised_thread):
-                    self._send_cancelled_error()
-
-        # Wait for the supervised thread to exit its context
-        logger.debug("%r waiting for supervised thread to exit", self)
-        self._event.wait()
+        logger.debug("%r enforcer detected timeout!", self)
+        if not self.cancel(throw=False):
+            return
+
+        shield = _get_thread_shield(self._supervised_thread)
+        if shield._lock.acquire(blocking=False):
+            try:
+                self._send_cancelled_error()
+            finally:
+                shield._lock.release()
+        else:
+            # Do not block the scheduler while the supervised thread is shielded
+            self._delivery_thread = threading.Thread(
+                target=self._send_cancelled_error,
+                name=f"timeout-delivery {self.name or hex(id(self))}",
+                daemon=True,
+            )
+            self._delivery_thread.start()
 
     def cancel(self, throw: bool = True):
         if not super().cancel():
@@ -468,6 +847,49 @@ class WatcherThreadCancelScope(CancelScope):
         return True
 
 
+class CooperativeCancelScope(CancelScope):
+    """
+    A cancel scope that is only enforced at cancellation checkpoints.
+
+    Cancelling the scope does not interrupt the code within it; the next call to
+    `check_cancelled` in the scope raises a `CancelledError` instead. No exception is
+    injected into the thread and no signal is used, but code within the scope must
+    check for cancellation regularly. If the scope is cancelled and the code does not
+    raise, a `CancelledError` is raised when the scope exits.
+
+    If a timeout is specified, the deadline is watched by the shared
+    `DeadlineScheduler`.
+    """
+
+    def __enter__(self):
+        super().__enter__()
+        self._scheduler = None
+        self._scheduled = None
+
+        if self.timeout is not None:
+            self._scheduler = get_deadline_scheduler()
+            self._scheduled = self._scheduler.schedule(self._deadline, self._expire)
+
+        return self
+
+    def _expire(self):
+        logger.debug("%r detected timeout!", self)
+        self.cancel()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._scheduled is not None:
+            self._scheduler.cancel(self._scheduled)
+            self._scheduled = None
+
+        super().__exit__(exc_type, exc_val, exc_tb)
+
+        if self.cancelled() and exc_type is not CancelledError:
+            # Ensure cancellation error is propagated on exit
+            raise CancelledError() from exc_val
+
+        return False
+
+
 def get_deadline(timeout: Optional[float]):
     """
     Compute an deadline given a timeout.
@@ -556,11 +978,14 @@ def cancel_sync_after(timeout: Optional[float], name: Optional[str] = None):
         return
 
     thread = threading.current_thread()
-    existing_alarm_handler = signal.getsignal(signal.SIGALRM) != signal.SIG_DFL
+    # Alarm scopes can be nested since they share our handler
+    existing_alarm_handler = not _ALARMS.active() and (
+        signal.getsignal(signal.SIGALRM) != signal.SIG_DFL
+    )
 
     if (
         thread is threading.main_thread()
-        # Avoid nested alarm handlers; it's hard to follow and they will interfere with
+        # Avoid overriding alarm handlers that are not ours; they will interfere with
         # each other
         and not existing_alarm_handler
         # Avoid using an alarm when there is no timeout; it's better saved for that case
@@ -0,0 +1,450 @@
+"""
+A queue that persists items to disk so they survive restarts.
+"""
+
+import asyncio
+import collections
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Deque, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from prefect._internal.concurrency import logger
+from prefect._internal.concurrency.metrics import Histogram
+from prefect._internal.concurrency.primitives import (
+    OverflowPolicy,
+    Queue,
+    _wake_waiter,
+)
+
+T = TypeVar("T")
+
+DEFAULT_MEMORY_SIZE = 1024
+"""The default maximum number of items to hold in memory for a `DurableQueue`."""
+
+DEFAULT_MAX_ATTEMPTS = 3
+"""The default number of times an item is handled before it is dead-lettered."""
+
+MAX_QUEUE_SLOTS = 16
+"""The number of queue files to try when the queue is in use by other processes."""
+
+
+def get_default_queue_dir() -> Path:
+    """
+    The directory for queue files, within the Prefect home directory.
+    """
+    home = os.environ.get("PREFECT_HOME") or Path("~", ".prefect")
+    return Path(home).expanduser() / "queues"
+
+
+class DurableQueue(Queue[T]):
+    """
+    A thread-safe queue with an async consumer that persists items in a SQLite
+    database.
+
+    Putting an item only adds it to memory; items are written to disk in batches by a
+    background thread shortly after they are put. Up to `memory_size` items are held
+    in memory; any more are dropped from memory once written and only read back from
+    disk as the consumer catches up, so memory use stays flat when the consumer falls
+    behind. Items are read back ahead of the consumer, on the background thread.
+
+    Retrieved items are tracked by the row ids returned by `take_row_ids`. Items stay
+    on disk until they are acknowledged with `ack`. Items that were not acknowledged
+    when the queue was last used, e.g. because the process exited first, are replayed
+    when the queue is opened again. Items that failed with `release` are replayed as
+    well, until they have failed `max_attempts` times; then they are moved to a
+    `dead_items` table instead.
+
+    A queue file is held exclusively by one process. If the file at `path` is in use,
+    numbered files next to it are tried instead, so concurrent processes do not
+    replay each other's items.
+
+    Items are serialized with `dumps` and `loads`, pickle by default. A `maxsize` is
+    supported with the `BLOCK` and `DROP_NEWEST` overflow policies. The time spent in
+    the queue by items that were spilled or replayed is measured from when they were
+    read back from disk.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        memory_size: int = DEFAULT_MEMORY_SIZE,
+        maxsize: Optional[int] = None,
+        get_size: Optional[Callable[[T], int]] = None,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        max_attempts: Optional[int] = DEFAULT_MAX_ATTEMPTS,
+        dumps: Callable[[T], bytes] = pickle.dumps,
+        loads: Callable[[bytes], T] = pickle.loads,
+        wait_times: Optional[Histogram] = None,
+    ) -> None:
+        if OverflowPolicy(overflow) not in (
+            OverflowPolicy.BLOCK,
+            OverflowPolicy.DROP_NEWEST,
+        ):
+            raise ValueError(
+                "Durable queues only support the BLOCK and DROP_NEWEST overflow"
+                " policies."
+            )
+
+        super().__init__(
+            maxsize=maxsize,
+            get_size=get_size or _get_unit_size,
+            overflow=overflow,
+            wait_times=wait_times,
+        )
+        self._memory_size = max(1, memory_size)
+        self._max_attempts = max_attempts
+        self._dumps = dumps
+        self._loads = loads
+
+        # The row ids of the items held in memory
+        self._ids: Deque[int] = collections.deque()
+        # The row ids of retrieved items, until they are taken by the consumer
+        self._retrieved_ids: Deque[int] = collections.deque()
+        # The number of items that are not held in memory
+        self._spilled = 0
+        # The largest row id that has been read into memory
+        self._cursor = 0
+
+        # Work for the background thread
+        self._io_ready = threading.Condition(self._lock)
+        self._writes: List[Tuple[int, int, T]] = []
+        self._deletes: List[int] = []
+        self._failures: List[int] = []
+        self._load_requested = False
+        self._disposing = False
+
+        self.path, self._db = _open_database(Path(path))
+        try:
+            self._spilled, self._size, last_id = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(MAX(id), 0)"
+                " FROM items"
+            ).fetchone()
+            self._next_id = last_id + 1
+            # The lock is not needed before the background thread is started
+            self._load_spilled(self._read_spilled())
+        except BaseException:
+            self._db.close()
+            raise
+
+        if self.qsize():
+            logger.debug("Replaying %s items from queue %s", self.qsize(), self.path)
+
+        self._io_thread = threading.Thread(
+            target=self._run_io, name=f"DurableQueue-{self.path.name}", daemon=True
+        )
+        self._io_thread.start()
+
+    def _try_put(self, item: T, size: int) -> bool:
+        if self._closed:
+            raise RuntimeError("Cannot put items in a closed queue.")
+
+        if (
+            self._maxsize is not None
+            and self.qsize()
+            and self._size + size > self._maxsize
+        ):
+            if self._overflow == OverflowPolicy.BLOCK:
+                return False
+            self.dropped_count += 1
+            return True
+
+        row_id = self._next_id
+        self._next_id += 1
+        self._writes.append((row_id, size, item))
+
+        # Items must be spilled once any are, so they are retrieved in order
+        if self._spilled or len(self._items) >= self._memory_size:
+            self._spilled += 1
+            self._size += size
+            self.put_count += 1
+        else:
+            self._append(item, size)
+            self._ids.append(row_id)
+            self._cursor = row_id
+
+        self._io_ready.notify()
+        return True
+
+    def _popleft(self) -> T:
+        item = super()._popleft()
+        self._retrieved_ids.append(self._ids.popleft())
+
+        # Read spilled items back before the consumer runs out of items
+        if (
+            self._spilled
+            and not self._load_requested
+            and len(self._items) <= self._memory_size // 2
+        ):
+            self._load_requested = True
+            self._io_ready.notify()
+
+        return item
+
+    def _has_pending_items(self) -> bool:
+        # Spilled items are read back by the background thread
+        return self._spilled > 0
+
+    def take_row_ids(self, count: int) -> List[int]:
+        """
+        Take the row ids of the `count` oldest retrieved items, to `ack` or `release`
+        them once they have been handled.
+
+        Must be called by the consumer, in the order the items were retrieved.
+        """
+        with self._lock:
+            return [self._retrieved_ids.popleft() for _ in range(count)]
+
+    def ack(self, row_ids: Iterable[int]) -> None:
+        """
+        Remove retrieved items from disk once they have been handled.
+        """
+        with self._lock:
+            self._deletes.extend(row_ids)
+            self._io_ready.notify()
+
+    def release(self, row_ids: Iterable[int]) -> None:
+        """
+        Record that retrieved items failed without removing them from disk.
+
+        The items will be replayed the next time the queue is opened, unless they have
+        failed `max_attempts` times.
+        """
+        with self._lock:
+            self._failures.extend(row_ids)
+            self._io_ready.notify()
+
+    def dispose(self) -> None:
+        """
+        Close the queue, finish writing to disk and close its database.
+
+        Items that were not acknowledged remain on disk.
+        """
+        self.close()
+        with self._lock:
+            self._disposing = True
+            self._io_ready.notify()
+
+        self._io_thread.join()
+        self._db.close()
+
+    def qsize(self) -> int:
+        return len(self._items) + self._spilled
+
+    def memory_qsize(self) -> int:
+        """
+        The number of items held in memory.
+        """
+        return len(self._items)
+
+    def _run_io(self) -> None:
+        """
+        Write items to disk and read spilled items back, until the queue is disposed.
+        """
+        while True:
+            with self._lock:
+                while not (
+                    self._writes
+                    or self._deletes
+                    or self._failures
+                    or self._load_requested
+                    or self._disposing
+                ):
+                    self._io_ready.wait()
+
+                writes, self._writes = self._writes, []
+                deletes, self._deletes = self._deletes, []
+                failures, self._failures = self._failures, []
+                load = self._load_requested and not self._disposing
+                disposing = self._disposing
+
+            try:
+                self._write(writes, deletes, failures)
+                rows = self._read_spilled() if load else None
+            except sqlite3.Error:
+                logger.error("Failed to update queue file %s", self.path, exc_info=True)
+                rows = [] if load else None
+
+            if rows is not None:
+                with self._lock:
+                    waiter = self._load_spilled(rows)
+                if waiter is not None:
+                    _wake_waiter(waiter)
+
+            if disposing:
+                with self._lock:
+                    if not (self._writes or self._deletes or self._failures):
+                        return
+
+    def _write(
+        self,
+        writes: List[Tuple[int, int, T]],
+        deletes: List[int],
+        failures: List[int],
+    ) -> None:
+        if not (writes or deletes or failures):
+            return
+
+        rows = []
+        for row_id, size, item in writes:
+            try:
+                rows.append((row_id, size, self._dumps(item)))
+            except Exception:
+                logger.error(
+                    "Item %s could not be written to queue %s and will not survive a"
+                    " restart.",
+                    row_id,
+                    self.path,
+                    exc_info=True,
+                )
+
+        self._db.execute("BEGIN")
+        try:
+            self._db.executemany(
+                "INSERT INTO items (id, size, data) VALUES (?, ?, ?)", rows
+            )
+            self._db.executemany(
+                "DELETE FROM items WHERE id = ?", [(row_id,) for row_id in deletes]
+            )
+            if failures:
+                self._record_failures(failures)
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        else:
+            self._db.execute("COMMIT")
+
+    def _record_failures(self, row_ids: List[int]) -> None:
+        """
+        Count an attempt for failed items, moving those out of attempts to the dead
+        letter table. Must be called in a transaction.
+        """
+        self._db.executemany(
+            "UPDATE items SET attempts = attempts + 1 WHERE id = ?",
+            [(row_id,) for row_id in row_ids],
+        )
+        if self._max_attempts is None:
+            return
+
+        dead = [
+            (row_id,)
+            for row_id in row_ids
+            if self._db.execute(
+                "SELECT 1 FROM items WHERE id = ? AND attempts >= ?",
+                (row_id, self._max_attempts),
+            ).fetchone()
+        ]
+        if dead:
+            self._db.executemany(
+                "INSERT INTO dead_items (item_id, size, attempts, data)"
+                " SELECT id, size, attempts, data FROM items WHERE id = ?",
+                dead,
+            )
+            self._db.executemany("DELETE FROM items WHERE id = ?", dead)
+            logger.warning(
+                "Moved %s items that failed %s times to the dead letter table of"
+                " queue %s",
+                len(dead),
+                self._max_attempts,
+                self.path,
+            )
+
+    def _read_spilled(self) -> List[Tuple[int, int, bytes]]:
+        with self._lock:
+            cursor = self._cursor
+            count = self._memory_size - len(self._items)
+
+        return self._db.execute(
+            "SELECT id, size, data FROM items WHERE id > ? ORDER BY id LIMIT ?",
+            (cursor, max(count, 1)),
+        ).fetchall()
+
+    def _load_spilled(
+        self, rows: List[Tuple[int, int, bytes]]
+    ) -> Optional[asyncio.Future]:
+        """
+        Add spilled items read from disk to memory. Must be called while holding the
+        lock.
+
+        Returns the waiting consumer, which must be woken after the lock is released.
+        """
+        self._load_requested = False
+        put_time = time.monotonic()
+        for row_id, size, data in rows:
+            self._spilled -= 1
+            self._cursor = row_id
+            try:
+                item = self._loads(data)
+            except Exception:
+                logger.error(
+                    "Discarding item %s from queue %s that could not be loaded.",
+                    row_id,
+                    self.path,
+                    exc_info=True,
+                )
+                self._deletes.append(row_id)
+                self._size -= size
+                continue
+
+            # The item was counted when it was put or when the queue was opened
+            self._size -= size
+            self.put_count -= 1
+            self._append(item, size, put_time)
+            self._ids.append(row_id)
+
+        if not rows and not self._writes:
+            # The count is out of sync with the database; nothing is left to load
+            self._spilled = 0
+        elif self._spilled and len(self._items) <= self._memory_size // 2:
+            self._load_requested = True
+
+        if self._items or not self._spilled:
+            waiter, self._waiter = self._waiter, None
+            return waiter
+        return None
+
+
+def _open_database(path: Path):
+    """
+    Open the first queue file, starting at `path`, that is not in use by another
+    process.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    for slot in range(MAX_QUEUE_SLOTS):
+        slot_path = path if not slot else path.with_name(f"{path.name}.{slot}")
+        db = sqlite3.connect(
+            slot_path, isolation_level=None, check_same_thread=False, timeout=0
+        )
+        try:
+            # Exclusive locking holds the file until the connection is closed
+            db.execute("PRAGMA locking_mode = EXCLUSIVE")
+            db.execute("PRAGMA journal_mode = WAL")
+            db.execute("PRAGMA synchronous = NORMAL")
+            db.execute("BEGIN EXCLUSIVE")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY,"
+                " size INTEGER NOT NULL, attempts INTEGER NOT NULL DEFAULT 0,"
+                " data BLOB NOT NULL)"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS dead_items (id INTEGER PRIMARY KEY"
+                " AUTOINCREMENT, item_id INTEGER NOT NULL, size INTEGER NOT NULL,"
+                " attempts INTEGER NOT NULL, data BLOB NOT NULL)"
+            )
+            db.execute("COMMIT")
+        except sqlite3.OperationalError as exc:
+            db.close()
+            if "locked" not in str(exc):
+                raise
+        else:
+            return slot_path, db
+
+    raise RuntimeError(f"All queue files at {path} are in use by other processes.")
+
+
+def _get_unit_size(item: T) -> int:
+    return 1
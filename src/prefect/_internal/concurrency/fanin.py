@@ -0,0 +1,325 @@
+"""
+Fan-in of service items from child processes to the parent process over a Unix socket.
+
+A parent process starts a `FanInServer`. Its direct child processes inherit the
+address of its socket through the environment, and items sent to services that set
+`_fan_in` are forwarded to the parent instead of being handled in the child. Each
+frame on the socket is a 4-byte length followed by a pickled batch of items for one
+service instance, so items are written in batches rather than one at a time.
+
+Frames are unpickled by the parent, so the socket is only accessible to its owner and
+connections from processes of other users are rejected.
+"""
+
+import asyncio
+import contextlib
+import importlib
+import os
+import pickle
+import socket
+import struct
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
+
+from prefect._internal.concurrency import logger
+from prefect._internal.concurrency.api import create_call, from_async, from_sync
+from prefect._internal.concurrency.services import BatchedQueueService, QueueService
+
+FAN_IN_SOCKET_ENV_VAR = "PREFECT_SERVICE_FAN_IN_SOCKET"
+"""The environment variable with the address of the fan-in server of the parent."""
+
+FAN_IN_PID_ENV_VAR = "PREFECT_SERVICE_FAN_IN_PID"
+"""The environment variable with the process id of the fan-in server."""
+
+_HEADER = struct.Struct("!I")
+_PEER_CREDENTIALS = struct.Struct("3i")
+
+_server: Optional["FanInServer"] = None
+
+# Set once the fan-in server could not be reached, to handle items in this process
+_fan_in_disabled = False
+
+
+def get_fan_in_address() -> Optional[str]:
+    """
+    Get the address to forward service items to, if this process should forward them.
+
+    Only direct children of the process running the fan-in server forward items.
+    Returns `None` in any other process, or once the server could not be reached.
+    """
+    if _fan_in_disabled:
+        return None
+
+    address = os.environ.get(FAN_IN_SOCKET_ENV_VAR)
+    if not address or os.environ.get(FAN_IN_PID_ENV_VAR) != str(os.getppid()):
+        return None
+    return address
+
+
+def get_service_path(service: Type[QueueService]) -> str:
+    return f"{service.__module__}:{service.__qualname__}"
+
+
+def import_service(service_path: str) -> Optional[Type[QueueService]]:
+    """
+    Import the service at a path from `get_service_path`.
+
+    Returns `None` if it is not a service that sets `_fan_in`.
+    """
+    module_name, _, qualname = service_path.partition(":")
+    try:
+        service = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            service = getattr(service, name)
+    except (ImportError, AttributeError):
+        return None
+
+    if not (
+        isinstance(service, type)
+        and issubclass(service, QueueService)
+        and service._fan_in
+    ):
+        return None
+    return service
+
+
+async def _send_to_instance(
+    service: Type[QueueService], args: Tuple, items: List[Any]
+) -> None:
+    # Getting an instance may wait on the loop thread that runs it, so it is not done
+    # on this event loop
+    instance = await from_async.wait_for_call_in_new_thread(
+        create_call(service.instance, *args)
+    )
+    for item in items:
+        await instance.send_async(item)
+
+
+def _get_peer_uid(sock: socket.socket) -> Optional[int]:
+    """
+    Get the user id of the process on the other end of a Unix socket, if supported
+    on this platform.
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+
+    credentials = sock.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, _PEER_CREDENTIALS.size
+    )
+    _, uid, _ = _PEER_CREDENTIALS.unpack(credentials)
+    return uid
+
+
+class FanInForwarder(BatchedQueueService[Any]):
+    """
+    Forwards items sent to a service in a child process to the fan-in server of the
+    parent process.
+
+    Draining the forwarder waits for its items to be written to the socket, not for
+    the items to be handled by the parent. If the server cannot be reached, e.g.
+    because it was stopped, fan-in is disabled for this process and the items are
+    handled by an instance of the service in this process instead.
+    """
+
+    _max_batch_size = 1000
+    _min_interval = 0.01
+
+    def __init__(self, address: str, service_path: str, *args) -> None:
+        super().__init__(address, service_path, *args)
+        self._address = address
+        self._service_path = service_path
+        self._args = args
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    def __repr__(self) -> str:
+        return f"<FanInForwarder for {self._service_path} at {self._address}>"
+
+    @classmethod
+    def for_service(cls, address: str, service: Type[QueueService], *args):
+        return cls.instance(address, get_service_path(service), *args)
+
+    async def _handle_batch(self, items: List[Any]):
+        global _fan_in_disabled
+
+        data = pickle.dumps(
+            (self._service_path, self._args, items), protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+        try:
+            await self._write(data)
+        except OSError as exc:
+            service = import_service(self._service_path)
+            if service is None:
+                raise
+
+            logger.warning(
+                "Fan-in server at %s could not be reached, handling items for %s in"
+                " this process instead: %s",
+                self._address,
+                self._service_path,
+                exc,
+            )
+            _fan_in_disabled = True
+            await _send_to_instance(service, self._args, items)
+
+    async def _write(self, data: bytes) -> None:
+        if self._writer is None:
+            _, self._writer = await asyncio.open_unix_connection(self._address)
+
+        try:
+            self._writer.write(_HEADER.pack(len(data)) + data)
+            await self._writer.drain()
+        except BaseException:
+            # Reconnect for the next batch
+            self._writer.close()
+            self._writer = None
+            raise
+
+    @contextlib.asynccontextmanager
+    async def _lifespan(self):
+        try:
+            yield
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+                await self._writer.wait_closed()
+                self._writer = None
+
+
+class FanInServer:
+    """
+    Receives service items from child processes on a Unix socket and sends them to
+    service instances in this process.
+
+    The socket is created in a private temporary directory unless a `path` is given,
+    and is only accessible to its owner. Connections from processes of other users are
+    rejected where the platform reports the user of a peer. While the server runs, its
+    address is set in the environment for child processes. Only services that set
+    `_fan_in` are accepted.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        self._tmpdir: Optional[tempfile.TemporaryDirectory] = None
+        if path is None:
+            self._tmpdir = tempfile.TemporaryDirectory(prefix="prefect-fan-in-")
+            path = Path(self._tmpdir.name) / "services.sock"
+
+        self.path = Path(path)
+        self.pid = os.getpid()
+        self.received_count = 0
+        self.connection_count = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: Set[asyncio.StreamWriter] = set()
+        self._services: Dict[str, Type[QueueService]] = {}
+
+    def start(self) -> "FanInServer":
+        global _server
+
+        if _server is not None and _server.pid == os.getpid():
+            raise RuntimeError("A fan-in server is already running in this process.")
+
+        from_sync.call_soon_in_loop_thread(create_call(self._start)).result()
+        _server = self
+        os.environ[FAN_IN_SOCKET_ENV_VAR] = str(self.path)
+        os.environ[FAN_IN_PID_ENV_VAR] = str(self.pid)
+        logger.debug("Fan-in server listening at %s", self.path)
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop accepting items and close open connections.
+
+        Items that were already received are left to the services to handle.
+        """
+        global _server
+
+        if _server is self:
+            _server = None
+            os.environ.pop(FAN_IN_SOCKET_ENV_VAR, None)
+            os.environ.pop(FAN_IN_PID_ENV_VAR, None)
+
+        if self._server is not None:
+            from_sync.call_soon_in_loop_thread(create_call(self._stop)).result()
+            self._server = None
+
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+
+    async def _start(self) -> None:
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=str(self.path)
+        )
+        os.chmod(self.path, 0o600)
+
+    async def _stop(self) -> None:
+        self._server.close()
+        for writer in tuple(self._writers):
+            writer.close()
+        await self._server.wait_closed()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        uid = _get_peer_uid(writer.get_extra_info("socket"))
+        if uid is not None and uid != os.getuid():
+            logger.warning("Rejecting fan-in connection from user %s", uid)
+            writer.close()
+            return
+
+        self._writers.add(writer)
+        self.connection_count += 1
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(_HEADER.size)
+                    data = await reader.readexactly(_HEADER.unpack(header)[0])
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break  # the child closed the connection
+
+                service_path, args, items = pickle.loads(data)
+                await self._send(service_path, args, items)
+        except Exception:
+            logger.error("Fan-in connection failed", exc_info=True)
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _send(self, service_path: str, args: Tuple, items: List[Any]) -> None:
+        service = self._get_service(service_path)
+        if service is None:
+            logger.warning(
+                "Dropping %s items for unknown service %r", len(items), service_path
+            )
+            return
+
+        await _send_to_instance(service, args, items)
+        self.received_count += len(items)
+
+    def _get_service(self, service_path: str) -> Optional[Type[QueueService]]:
+        if service_path not in self._services:
+            self._services[service_path] = import_service(service_path)
+
+        return self._services[service_path]
+
+    def __enter__(self) -> "FanInServer":
+        return self.start()
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+
+def _forget_forwarders_after_fork() -> None:
+    # Forwarders inherited by a forked child run on loop threads that only run in the
+    # parent; other service instances are left alone
+    for key, instance in tuple(FanInForwarder._instances.items()):
+        if isinstance(instance, FanInForwarder):
+            del FanInForwarder._instances[key]
+    # The lock may have been held by another thread of the parent
+    QueueService._instance_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_forwarders_after_fork)
@@ -0,0 +1,271 @@
+"""
+Lightweight metrics for queue services and exporters for them.
+"""
+
+import bisect
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from prefect._internal.concurrency import logger
+
+DURATION_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""The default histogram buckets for durations, in seconds."""
+
+SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+"""The default histogram buckets for batch sizes."""
+
+_SUMMED_STATS = {"depth", "size", "enqueue_rate"}
+
+
+class Histogram:
+    """
+    Counts observations in fixed buckets.
+
+    Updates are not synchronized; each histogram should only be updated from one
+    thread at a time.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = DURATION_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        # The last count is for observations larger than all of the buckets
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def merge(self, other: "Histogram") -> None:
+        """
+        Add the observations of another histogram with the same buckets.
+        """
+        if other.buckets != self.buckets:
+            raise ValueError("Cannot merge histograms with different buckets.")
+
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.sum += other.sum
+        self.count += other.count
+
+    def copy(self) -> "Histogram":
+        histogram = Histogram(self.buckets)
+        histogram.merge(self)
+        return histogram
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the observations as a dictionary, with cumulative counts for each bucket
+        keyed by its upper bound.
+        """
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets[_format_bound(bound)] = cumulative
+        buckets["+Inf"] = self.count
+
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+def merge_stats(stats: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine the stats of several service instances.
+
+    Histograms, counters (named with a `_count` suffix), queue depths and rates are
+    summed. Values that cannot be combined, such as the batch size of each instance,
+    are left out.
+    """
+    merged: Dict[str, Any] = {}
+    for instance_stats in stats:
+        for key, value in instance_stats.items():
+            if isinstance(value, Histogram):
+                if key in merged:
+                    merged[key].merge(value)
+                else:
+                    merged[key] = value.copy()
+            elif key.endswith("_count") or key in _SUMMED_STATS:
+                merged[key] = merged.get(key, 0) + value
+
+    merged["instances"] = len(stats)
+    return merged
+
+
+def stats_to_json(stats_by_service: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Format the stats of services as JSON.
+    """
+    return json.dumps(
+        {
+            service: {
+                key: value.to_dict() if isinstance(value, Histogram) else value
+                for key, value in stats.items()
+            }
+            for service, stats in stats_by_service.items()
+        },
+        indent=2,
+        sort_keys=True,
+    )
+
+
+def stats_to_openmetrics(
+    stats_by_service: Dict[str, Dict[str, Any]], prefix: str = "prefect_service"
+) -> str:
+    """
+    Format the stats of services in the OpenMetrics text format.
+
+    Values with a name ending in `_count` are reported as counters. Histograms are
+    reported as histograms and other numbers as gauges.
+    """
+    families: Dict[str, List[str]] = {}
+    types: Dict[str, str] = {}
+
+    for service, stats in sorted(stats_by_service.items()):
+        label = f'service="{_escape_label(service)}"'
+
+        for key, value in sorted(stats.items()):
+            if isinstance(value, Histogram):
+                name = f"{prefix}_{key}"
+                types[name] = "histogram"
+                lines = families.setdefault(name, [])
+                cumulative = 0
+                for bound, count in zip(value.buckets, value.counts):
+                    cumulative += count
+                    lines.append(
+                        f'{name}_bucket{{{label},le="{_format_bound(bound)}"}}'
+                        f" {cumulative}"
+                    )
+                lines.append(f'{name}_bucket{{{label},le="+Inf"}} {value.count}')
+                lines.append(f"{name}_sum{{{label}}} {value.sum}")
+                lines.append(f"{name}_count{{{label}}} {value.count}")
+
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                if key.endswith("_count"):
+                    name = f"{prefix}_{key[: -len('_count')]}"
+                    types[name] = "counter"
+                    sample = f"{name}_total"
+                else:
+                    name = f"{prefix}_{key}"
+                    types[name] = "gauge"
+                    sample = name
+                families.setdefault(name, []).append(f"{sample}{{{label}}} {value}")
+
+    lines = []
+    for name, samples in families.items():
+        lines.append(f"# TYPE {name} {types[name]}")
+        lines.extend(samples)
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsFileExporter:
+    """
+    Periodically writes the stats of services to a file, as JSON or in the
+    OpenMetrics text format.
+
+    The file is replaced atomically on each write, so readers never see a partial
+    file. A final write is made when the exporter is stopped.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        get_stats: Callable[[], Dict[str, Dict[str, Any]]],
+        interval: float = 10.0,
+        format: str = "openmetrics",
+    ) -> None:
+        if format not in ("json", "openmetrics"):
+            raise ValueError(f"Unknown metrics format {format!r}.")
+
+        self.path = Path(path)
+        self.interval = interval
+        self.format = format
+        self._get_stats = get_stats
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "MetricsFileExporter":
+        self._thread = threading.Thread(
+            target=self._run, name="MetricsFileExporter", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop the exporter after writing the stats one last time.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            stopped = self._stopped.wait(self.interval)
+            try:
+                self.write()
+            except Exception:
+                logger.error(
+                    "Failed to write service metrics to %s", self.path, exc_info=True
+                )
+            if stopped:
+                break
+
+    def write(self) -> None:
+        """
+        Write the current stats to the file.
+        """
+        stats = self._get_stats()
+        content = (
+            stats_to_json(stats)
+            if self.format == "json"
+            else stats_to_openmetrics(stats)
+        )
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name)
+        try:
+            with os.fdopen(fd, "w") as file:
+                file.write(content)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def __enter__(self) -> "MetricsFileExporter":
+        return self.start()
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
@@ -1,12 +1,29 @@
 """
 Thread-safe async synchronization primitives.
 """
+
 import asyncio
 import collections
+import enum
+import queue
 import threading
-from typing import TypeVar
+import time
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
-from prefect._internal.concurrency.event_loop import call_soon_in_loop
+from prefect._internal.concurrency.event_loop import call_soon_in_loop, get_running_loop
+from prefect._internal.concurrency.metrics import Histogram
 from typing_extensions import Literal
 
 T = TypeVar("T")
@@ -75,3 +92,611 @@ class Event:
             return True
         finally:
             self._waiters.remove(fut)
+
+
+class OverflowPolicy(str, enum.Enum):
+    """
+    Determines what happens to an item put in a full `Queue`.
+    """
+
+    BLOCK = "block"
+    """Wait for space in the queue."""
+
+    DROP_NEWEST = "drop_newest"
+    """Drop the new item."""
+
+    DROP_OLDEST = "drop_oldest"
+    """Drop the oldest items in the queue until the new item fits."""
+
+    COALESCE = "coalesce"
+    """Merge the new item into the newest item in the queue."""
+
+
+class Queue(Generic[T]):
+    """
+    A thread-safe queue with an async consumer.
+
+    Items can be put in the queue from any thread. Items are retrieved by a single
+    consumer, which waits on its own event loop instead of blocking a thread. The
+    consumer is only woken across threads when it is waiting for an item; putting an
+    item while the consumer is busy just appends it to the queue.
+
+    Once the queue is closed, the consumer receives the remaining items and then
+    `None` instead of waiting for more.
+
+    The queue is unbounded unless a `maxsize` is given. The size of each item is
+    given by `get_size`; by default, each item has a size of one. When an item does
+    not fit, the `overflow` policy is applied. An item is always accepted into an
+    empty queue, even if it is larger than `maxsize`.
+
+    If a `wait_times` histogram is given, the number of seconds each item spent in the
+    queue is observed in it when the item is removed.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        get_size: Optional[Callable[[T], int]] = None,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        coalesce: Optional[Callable[[T, T], T]] = None,
+        wait_times: Optional[Histogram] = None,
+    ) -> None:
+        self._items: Deque[T] = collections.deque()
+        # The sizes of items are only tracked when not all items have a size of one
+        self._sizes: Optional[Deque[int]] = (
+            collections.deque() if get_size is not None else None
+        )
+        # The times items were put are only tracked when they are observed
+        self._times: Optional[Deque[float]] = (
+            collections.deque() if wait_times is not None else None
+        )
+        self._wait_times = wait_times
+        self._size = 0
+        self._maxsize = maxsize
+        self._get_size = get_size
+        self._overflow = OverflowPolicy(overflow)
+        self._coalesce = coalesce or _replace_item
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._waiter: Optional[asyncio.Future] = None
+        self._sync_put_waiters = 0
+        self._put_waiters: Deque[asyncio.Future] = collections.deque()
+        self._closed = False
+
+        self.put_count = 0
+        """The number of items added to the queue."""
+
+        self.dropped_count = 0
+        """The number of items dropped because the queue was full."""
+
+        self.blocked_count = 0
+        """The number of puts that waited because the queue was full."""
+
+        self.coalesced_count = 0
+        """The number of items merged into a pending item."""
+
+    def put_nowait(self, item: T) -> None:
+        """
+        Put an item in the queue, waking the consumer if it is waiting.
+
+        Raises `queue.Full` if the queue is full and uses the `BLOCK` overflow policy.
+        """
+        size = self._get_size(item) if self._get_size else 1
+
+        with self._lock:
+            if not self._try_put(item, size):
+                raise queue.Full()
+            waiter, self._waiter = self._waiter, None
+
+        if waiter is not None:
+            _wake_waiter(waiter)
+
+    def put(self, item: T, timeout: Optional[float] = None) -> None:
+        """
+        Put an item in the queue, blocking until there is space if necessary.
+
+        Raises `queue.Full` if there is no space within the timeout. Not safe to call
+        from the consumer's event loop while the queue is full.
+        """
+        size = self._get_size(item) if self._get_size else 1
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        with self._not_full:
+            if not self._try_put(item, size):
+                self.blocked_count += 1
+                self._sync_put_waiters += 1
+                try:
+                    while not self._try_put(item, size):
+                        timeout = _get_remaining(deadline)
+                        if timeout == 0:
+                            raise queue.Full()
+                        self._not_full.wait(timeout)
+                finally:
+                    self._sync_put_waiters -= 1
+
+            waiter, self._waiter = self._waiter, None
+
+        if waiter is not None:
+            _wake_waiter(waiter)
+
+    async def aput(self, item: T, timeout: Optional[float] = None) -> None:
+        """
+        Put an item in the queue, waiting until there is space if necessary.
+
+        Raises `queue.Full` if there is no space within the timeout.
+        """
+        size = self._get_size(item) if self._get_size else 1
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        loop = asyncio.get_running_loop()
+        blocked = False
+
+        while True:
+            with self._lock:
+                if self._try_put(item, size):
+                    waiter, self._waiter = self._waiter, None
+                    break
+
+                if not blocked:
+                    self.blocked_count += 1
+                    blocked = True
+
+                timeout = _get_remaining(deadline)
+                if timeout == 0:
+                    raise queue.Full()
+
+                put_waiter = loop.create_future()
+                self._put_waiters.append(put_waiter)
+
+            await _wait_for_waiter(loop, put_waiter, timeout)
+
+            with self._lock:
+                if put_waiter in self._put_waiters:
+                    self._put_waiters.remove(put_waiter)
+
+        if waiter is not None:
+            _wake_waiter(waiter)
+
+    def _try_put(self, item: T, size: int) -> bool:
+        """
+        Put an item in the queue, applying the overflow policy if it does not fit.
+
+        Returns `False` if the caller must wait for space. Must be called while holding
+        the lock.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot put items in a closed queue.")
+
+        if (
+            self._maxsize is not None
+            and self._items
+            and self._size + size > self._maxsize
+        ):
+            if self._overflow == OverflowPolicy.BLOCK:
+                return False
+
+            elif self._overflow == OverflowPolicy.DROP_NEWEST:
+                self.dropped_count += 1
+                return True
+
+            elif self._overflow == OverflowPolicy.DROP_OLDEST:
+                while self._items and self._size + size > self._maxsize:
+                    self._drop_oldest()
+                    self.dropped_count += 1
+
+            elif self._overflow == OverflowPolicy.COALESCE:
+                self._merge_into_newest(item)
+                self.coalesced_count += 1
+                return True
+
+        self._append(item, size)
+        return True
+
+    def _append(self, item: T, size: int, put_time: Optional[float] = None) -> None:
+        """
+        Add an item to the end of the queue. Must be called while holding the lock.
+        """
+        self._items.append(item)
+        if self._sizes is not None:
+            self._sizes.append(size)
+        if self._times is not None:
+            self._times.append(put_time if put_time is not None else time.monotonic())
+        self._size += size
+        self.put_count += 1
+
+    def _popleft(self) -> T:
+        """
+        Remove the oldest item. Must be called while holding the lock.
+        """
+        item = self._items.popleft()
+        self._size -= self._sizes.popleft() if self._sizes is not None else 1
+        if self._times is not None:
+            self._wait_times.observe(time.monotonic() - self._times.popleft())
+        return item
+
+    def _drop_oldest(self) -> None:
+        """
+        Drop an item to make space. Must be called while holding the lock.
+        """
+        self._popleft()
+
+    def _merge_into_newest(self, item: T) -> None:
+        """
+        Merge an item into the newest item. Must be called while holding the lock.
+        """
+        merged = self._coalesce(self._items[-1], item)
+        self._items[-1] = merged
+        if self._sizes is not None:
+            size = self._get_size(merged)
+            self._size += size - self._sizes[-1]
+            self._sizes[-1] = size
+
+    def _peek_size(self) -> int:
+        """
+        Get the size of the oldest item. Must be called while holding the lock.
+        """
+        return self._sizes[0] if self._sizes is not None else 1
+
+    def _notify_not_full(self) -> Sequence[asyncio.Future]:
+        """
+        Notify senders waiting for space. Must be called while holding the lock.
+
+        Returns the futures of async senders, which must be woken after the lock is
+        released.
+        """
+        if self._sync_put_waiters:
+            self._not_full.notify_all()
+
+        if not self._put_waiters:
+            return ()
+
+        put_waiters = list(self._put_waiters)
+        self._put_waiters.clear()
+        return put_waiters
+
+    def close(self) -> None:
+        """
+        Close the queue, waking the consumer if it is waiting.
+
+        Items already in the queue can still be retrieved. Senders waiting for space
+        will fail.
+        """
+        with self._lock:
+            self._closed = True
+            waiter, self._waiter = self._waiter, None
+            put_waiters = self._notify_not_full()
+
+        if waiter is not None:
+            _wake_waiter(waiter)
+        for put_waiter in put_waiters:
+            _wake_waiter(put_waiter)
+
+    def closed(self) -> bool:
+        return self._closed
+
+    def get_nowait(self) -> T:
+        """
+        Remove and return an item from the queue.
+
+        Raises `queue.Empty` if there are no items in the queue.
+        """
+        with self._lock:
+            if not self._items:
+                raise queue.Empty()
+            item = self._popleft()
+            put_waiters = self._notify_not_full()
+
+        for put_waiter in put_waiters:
+            _wake_waiter(put_waiter)
+
+        return item
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[T]:
+        """
+        Remove and return an item from the queue, waiting for one if necessary.
+
+        Returns `None` if the queue is closed and empty. Raises `queue.Empty` if no item
+        is available within the timeout.
+        """
+        if self._items:
+            return self.get_nowait()
+
+        await self._wait_for_items(timeout)
+
+        return self.get_nowait() if self._items else None
+
+    async def get_batch(
+        self, max_size: int, timeout: Optional[float] = None
+    ) -> Tuple[List[T], int]:
+        """
+        Remove and return all of the items available in the queue, up to a total size
+        of `max_size`, waiting for an item only if the queue is empty.
+
+        As with a batch built from calls to `get`, the last item may take the total
+        size over `max_size`.
+
+        Returns the items and their total size. No items are returned if the queue is
+        closed and empty. Raises `queue.Empty` if no item is available within the
+        timeout.
+        """
+        await self._wait_for_items(timeout)
+
+        items = []
+        size = 0
+        with self._lock:
+            while self._items and size < max_size:
+                size += self._peek_size()
+                items.append(self._popleft())
+            put_waiters = self._notify_not_full()
+
+        for put_waiter in put_waiters:
+            _wake_waiter(put_waiter)
+
+        return items, size
+
+    def _has_pending_items(self) -> bool:
+        """
+        Whether there are items that are not available yet but will be, so a closed
+        queue is not done. Must be called while holding the lock.
+        """
+        return False
+
+    async def _wait_for_items(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until the queue has items or is closed.
+
+        Raises `queue.Empty` if the queue is still empty after the timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        while True:
+            with self._lock:
+                if self._items or (self._closed and not self._has_pending_items()):
+                    return
+
+                timeout = _get_remaining(deadline)
+                if timeout == 0:
+                    raise queue.Empty()
+
+                if self._waiter is not None:
+                    raise RuntimeError("Only one consumer may wait on a queue.")
+                waiter = self._waiter = loop.create_future()
+
+            try:
+                await _wait_for_waiter(loop, waiter, timeout)
+            finally:
+                with self._lock:
+                    if self._waiter is waiter:
+                        self._waiter = None
+
+    def qsize(self) -> int:
+        """
+        The number of items in the queue.
+        """
+        return len(self._items)
+
+    def size(self) -> int:
+        """
+        The total size of the items in the queue.
+        """
+        return self._size
+
+    def empty(self) -> bool:
+        return not self._items
+
+
+class CoalescingQueue(Queue[T]):
+    """
+    A `Queue` that merges each item into a pending item with the same key, if there
+    is one, instead of adding it.
+
+    Keys are given by `coalesce_key`; items with a key of `None` are always added. The
+    pending item is replaced with the result of `coalesce(pending, item)`, which is
+    the new item by default, and keeps its place in the queue. The queue grows with
+    the number of distinct keys rather than the number of items put.
+    """
+
+    def __init__(
+        self, coalesce_key: Callable[[T], Optional[Hashable]], **kwargs: Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self._coalesce_key = coalesce_key
+        # Items are stored as `[item, key, size]` so they can be merged in place; the
+        # sizes are kept there instead of in a separate queue
+        self._sizes = None
+        self._pending: Dict[Hashable, list] = {}
+
+    def _try_put(self, item: T, size: int) -> bool:
+        key = self._coalesce_key(item)
+
+        if key is not None and not self._closed:
+            pending = self._pending.get(key)
+            if pending is not None:
+                self._merge(pending, item)
+                self.coalesced_count += 1
+                return True
+
+        return super()._try_put([item, key, size], size)
+
+    def _append(self, item: list, size: int, put_time: Optional[float] = None) -> None:
+        super()._append(item, size, put_time)
+        if item[1] is not None:
+            self._pending[item[1]] = item
+
+    def _popleft(self) -> T:
+        entry = super()._popleft()
+        item, key, size = entry
+        # The base class removes a size of one for each item
+        self._size -= size - 1
+        if key is not None and self._pending.get(key) is entry:
+            del self._pending[key]
+        return item
+
+    def _merge_into_newest(self, item: list) -> None:
+        self._merge(self._items[-1], item[0])
+
+    def _merge(self, pending: list, item: T) -> None:
+        merged = self._coalesce(pending[0], item)
+        size = self._get_size(merged) if self._get_size is not None else 1
+        self._size += size - pending[2]
+        pending[0] = merged
+        pending[2] = size
+
+    def _peek_size(self) -> int:
+        return self._items[0][2]
+
+
+class PriorityQueue(Queue[T]):
+    """
+    A `Queue` with a lane for each priority, retrieved with weighted fair queuing.
+
+    The lane of each item is given by `get_priority`, where zero is the highest
+    priority and `None` is the lowest. Lanes are retrieved in rounds: in each round,
+    up to `weights[i]` items are taken from lane `i`, highest priority first, so lower
+    priority items still make progress while higher priority items are backing up.
+    Items within a lane are retrieved in order.
+
+    When the queue is full, the `DROP_OLDEST` overflow policy drops items from the
+    lowest priority lane first and the `COALESCE` policy merges into the newest item
+    of the new item's lane.
+    """
+
+    def __init__(
+        self,
+        get_priority: Callable[[T], Optional[int]],
+        weights: Sequence[int] = (8, 4, 1),
+        **kwargs: Any,
+    ) -> None:
+        if not weights or any(weight < 1 for weight in weights):
+            raise ValueError("Priority weights must be positive integers.")
+
+        super().__init__(**kwargs)
+        self._get_priority = get_priority
+        self.weights = tuple(weights)
+        self._credits = list(self.weights)
+        # Items are stored as `[item, size, put time]` in their lane; the sizes and
+        # put times are kept there instead of in separate queues
+        self._lanes: List[Deque[list]] = [collections.deque() for _ in self.weights]
+        self._items = _Lanes(self._lanes)
+        self._sizes = None
+
+    def get_lane(self, item: T) -> int:
+        """
+        Get the index of the lane for an item.
+        """
+        priority = self._get_priority(item)
+        if priority is None:
+            return len(self._lanes) - 1
+        return min(max(priority, 0), len(self._lanes) - 1)
+
+    def _append(self, item: T, size: int, put_time: Optional[float] = None) -> None:
+        if self._times is not None and put_time is None:
+            put_time = time.monotonic()
+        self._lanes[self.get_lane(item)].append([item, size, put_time])
+        self._items.count += 1
+        self._size += size
+        self.put_count += 1
+
+    def _select_lane(self) -> int:
+        """
+        Get the index of the lane to retrieve the next item from. Must be called while
+        holding the lock and while the queue is not empty.
+        """
+        for index, lane in enumerate(self._lanes):
+            if lane and self._credits[index]:
+                return index
+
+        # Every lane with items has used its share of this round; start a new round
+        self._credits[:] = self.weights
+        return next(index for index, lane in enumerate(self._lanes) if lane)
+
+    def _popleft(self) -> T:
+        index = self._select_lane()
+        self._credits[index] -= 1
+        return self._remove(self._lanes[index])
+
+    def _remove(self, lane: Deque[list]) -> T:
+        item, size, put_time = lane.popleft()
+        self._items.count -= 1
+        self._size -= size
+        if self._times is not None:
+            self._wait_times.observe(time.monotonic() - put_time)
+        return item
+
+    def _drop_oldest(self) -> None:
+        self._remove(next(lane for lane in reversed(self._lanes) if lane))
+
+    def _merge_into_newest(self, item: T) -> None:
+        lane = self._lanes[self.get_lane(item)]
+        if not lane:
+            # Merge into the newest item of the lowest priority instead
+            lane = next(lane for lane in reversed(self._lanes) if lane)
+
+        newest = lane[-1]
+        merged = self._coalesce(newest[0], item)
+        size = self._get_size(merged) if self._get_size is not None else 1
+        self._size += size - newest[1]
+        newest[0] = merged
+        newest[1] = size
+
+    def _peek_size(self) -> int:
+        return self._lanes[self._select_lane()][0][1]
+
+    def lane_sizes(self) -> List[int]:
+        """
+        The number of items in each lane.
+        """
+        return [len(lane) for lane in self._lanes]
+
+
+class _Lanes:
+    """
+    Stands in for the items of a `PriorityQueue` when checking how many there are.
+    """
+
+    __slots__ = ("lanes", "count")
+
+    def __init__(self, lanes: List[Deque[list]]) -> None:
+        self.lanes = lanes
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def _replace_item(pending: T, item: T) -> T:
+    return item
+
+
+def _get_remaining(deadline: Optional[float]) -> Optional[float]:
+    return max(0, deadline - time.monotonic()) if deadline is not None else None
+
+
+async def _wait_for_waiter(
+    loop: asyncio.AbstractEventLoop, waiter: asyncio.Future, timeout: Optional[float]
+) -> None:
+    """
+    Wait until a waiter is woken or the timeout expires.
+    """
+    handle = (
+        loop.call_later(timeout, _wake_waiter, waiter) if timeout is not None else None
+    )
+    try:
+        await waiter
+    finally:
+        if handle is not None:
+            handle.cancel()
+
+
+def _wake_waiter(waiter: asyncio.Future) -> None:
+    loop = waiter.get_loop()
+
+    if loop is get_running_loop():
+        if not waiter.done():
+            waiter.set_result(None)
+    else:
+        try:
+            loop.call_soon_threadsafe(_wake_waiter, waiter)
+        except RuntimeError:
+            # The consumer's loop is closed so there is nothing to wake
+            pass
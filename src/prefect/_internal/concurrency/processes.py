@@ -0,0 +1,358 @@
+"""
+A portal to a pool of worker processes, for CPU-bound calls.
+"""
+
+import asyncio
+import inspect
+import multiprocessing
+import multiprocessing.connection
+import os
+import pickle
+import struct
+import threading
+from typing import Any, Dict, List, Optional
+
+import cloudpickle
+
+from prefect._internal.concurrency import logger
+from prefect._internal.concurrency.calls import Call, Portal
+from prefect._internal.concurrency.cancellation import (
+    CancelledError,
+    CancelScope,
+    get_timeout,
+)
+from prefect._internal.concurrency.threads import WorkerThreadPool
+
+_HEADER = struct.Struct("!I")
+
+
+def _send(conn: multiprocessing.connection.Connection, obj: Any) -> None:
+    """
+    Send an object with cloudpickle, passing large buffers such as arrays out-of-band
+    so they are not copied into the pickle.
+    """
+    buffers: List[pickle.PickleBuffer] = []
+    data = cloudpickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    conn.send_bytes(_HEADER.pack(len(buffers)))
+    conn.send_bytes(data)
+    for buffer in buffers:
+        conn.send_bytes(buffer.raw())
+
+
+def _recv(conn: multiprocessing.connection.Connection) -> Any:
+    (count,) = _HEADER.unpack(conn.recv_bytes())
+    data = conn.recv_bytes()
+    buffers = [conn.recv_bytes() for _ in range(count)]
+    return pickle.loads(data, buffers=buffers)
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+def _worker_main(conn: multiprocessing.connection.Connection) -> None:
+    """
+    Entrypoint for worker processes; runs calls until the parent closes the pipe.
+    """
+    while True:
+        try:
+            message = _recv(conn)
+        except (EOFError, OSError):
+            break  # the parent is gone
+
+        if message is None:
+            break  # shutdown requested
+
+        fn, args, kwargs = message
+        del message
+        try:
+            result = fn(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = asyncio.run(_await(result))
+            response = (True, result)
+        except BaseException as exc:
+            response = (False, exc)
+        del fn, args, kwargs
+
+        try:
+            _send(conn, response)
+        except Exception as exc:
+            # The result or exception could not be pickled
+            _send(conn, (False, RuntimeError(f"Failed to send result: {exc!r}")))
+        del response
+
+
+class WorkerProcessExited(RuntimeError):
+    """
+    Raised when a worker process exits while running a call.
+    """
+
+
+class _WorkerProcess:
+    """
+    A process that runs calls sent to it over a pipe.
+    """
+
+    def __init__(self, context: multiprocessing.context.BaseContext, name: str):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn,), name=name, daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self._terminated = False
+
+    def run(self, call: Call, scope: CancelScope, deadline: Optional[float]) -> Any:
+        _send(self.conn, (call.fn, call.args, call.kwargs))
+
+        if not self.conn.poll(get_timeout(deadline)):
+            # Timed out
+            scope.cancel()
+
+        if scope.cancelled():
+            raise CancelledError()
+
+        try:
+            ok, result = _recv(self.conn)
+        except (EOFError, OSError):
+            if scope.cancelled():
+                raise CancelledError()
+            raise WorkerProcessExited(
+                f"Worker process {self.process.name} exited with code"
+                f" {self.process.exitcode} while running {call!r}."
+            ) from None
+
+        if not ok:
+            raise result
+        return result
+
+    def alive(self) -> bool:
+        return not self._terminated and self.process.is_alive()
+
+    def terminate(self) -> None:
+        # The pipe is left open for the thread waiting on it, which sees it close on
+        # the other end
+        self._terminated = True
+        self.process.terminate()
+        self.process.join()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        try:
+            _send(self.conn, None)
+        except OSError:
+            pass  # the process is already gone
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+
+class _ProcessCancelScope(CancelScope):
+    """
+    A cancel scope that terminates the worker process running the call.
+    """
+
+    def __init__(self, worker: _WorkerProcess, name: Optional[str] = None) -> None:
+        super().__init__(name=name)
+        self._worker = worker
+
+    def cancel(self, throw: bool = True) -> bool:
+        if not super().cancel():
+            return False
+
+        if throw:
+            self._worker.terminate()
+
+        return True
+
+
+class ProcessPoolPortal(Portal):
+    """
+    A portal to a pool of up to `size` worker processes.
+
+    The function and arguments of each call are serialized with cloudpickle, so they
+    do not need to be importable in the worker, and large buffers such as arrays are
+    sent out-of-band. Async functions are run to completion in the worker. Context
+    variables are not sent to the worker.
+
+    Worker processes are reused across calls. `warm` processes are started when the
+    portal is started instead of on demand. A call that is cancelled or times out
+    while running terminates its worker process, which is replaced by a new one.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        warm: int = 0,
+        mp_context: Optional[str] = "spawn",
+        name: str = "ProcessPoolPortal",
+    ) -> None:
+        self.size = size or os.cpu_count() or 1
+        if warm > self.size:
+            raise ValueError("Cannot start more warm workers than the pool size.")
+
+        self.name = name
+        self.warm = warm
+        self._context = multiprocessing.get_context(mp_context)
+        self._threads = WorkerThreadPool(max_size=self.size, name=f"{name}Thread")
+        self._idle: List[_WorkerProcess] = []
+        self._workers: List[_WorkerProcess] = []
+        self._lock = threading.Lock()
+        self._started = False
+        self._shutdown = False
+        self._counter = 0
+        self._terminated_count = 0
+
+    def start(self) -> "ProcessPoolPortal":
+        """
+        Start the warm worker processes.
+        """
+        with self._lock:
+            if not self._started:
+                self._started = True
+                for _ in range(self.warm):
+                    self._idle.append(self._start_worker())
+        return self
+
+    def submit(self, call: Call) -> Call:
+        if not self._started:
+            self.start()
+
+        if self._shutdown:
+            raise RuntimeError("Process pool is shutdown.")
+
+        # Track the portal running the call
+        call.set_runner(self)
+        self._threads.submit(Call.new_lightweight(self._run_call, call))
+        return call
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for submitted calls to finish, then stop the worker processes.
+
+        The timeout applies to stopping each worker process; it is terminated if it
+        does not exit in time.
+        """
+        self._shutdown = True
+        self._threads.wait_for_exit()
+
+        with self._lock:
+            workers, self._workers, self._idle = self._workers, [], []
+
+        for worker in workers:
+            if worker.alive():
+                worker.stop(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get metrics for the pool.
+        """
+        thread_stats = self._threads.stats()
+        with self._lock:
+            return {
+                "processes": len(self._workers),
+                "idle_processes": len(self._idle),
+                "depth": thread_stats["depth"],
+                "max_depth": thread_stats["max_depth"],
+                "submitted_count": thread_stats["submitted_count"],
+                "completed_count": thread_stats["completed_count"],
+                "started_process_count": self._counter,
+                "terminated_process_count": self._terminated_count,
+            }
+
+    def _start_worker(self) -> _WorkerProcess:
+        """
+        Start a worker process. Must be called while holding the lock.
+        """
+        self._counter += 1
+        worker = _WorkerProcess(self._context, name=f"{self.name}-{self._counter}")
+        self._workers.append(worker)
+        return worker
+
+    def _acquire_worker(self) -> _WorkerProcess:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive():
+                    return worker
+                self._workers.remove(worker)
+
+            return self._start_worker()
+
+    def _release_worker(self, worker: _WorkerProcess) -> None:
+        with self._lock:
+            if worker.alive():
+                self._idle.append(worker)
+            else:
+                worker.conn.close()
+                self._terminated_count += 1
+                if worker in self._workers:
+                    self._workers.remove(worker)
+
+    def _run_call(self, call: Call) -> None:
+        """
+        Run a call in a worker process and place the result on its future.
+        """
+        # Do not execute if the future is cancelled
+        if not call.future.set_running_or_notify_cancel(call.timeout):
+            logger.debug("Skipping execution of cancelled call %r", call)
+            return
+
+        worker = self._acquire_worker()
+        scope = None
+        try:
+            with call.future.enforce_deadline_with(
+                _ProcessCancelScope(worker, name=getattr(call.fn, "__name__", None))
+            ) as scope:
+                result = worker.run(call, scope, call.future._deadline)
+        except CancelledError:
+            # Report cancellation
+            if scope is not None and scope.timedout():
+                call.future._timed_out = True
+            call.future.cancel()
+        except BaseException as exc:
+            logger.debug("Encountered exception in call %r", call, exc_info=True)
+            call.future.set_exception(exc)
+        else:
+            call.future.set_result(result)
+            logger.debug("Finished call %r", call)
+        finally:
+            # Forget this call's arguments in order to free up any memory that may be
+            # referenced by them
+            call.args = None
+            call.kwargs = None
+            self._release_worker(worker)
+
+    def __enter__(self) -> "ProcessPoolPortal":
+        return self.start()
+
+    def __exit__(self, *_) -> None:
+        self.shutdown()
+
+
+PROCESS_POOL: Optional[ProcessPoolPortal] = None
+_PROCESS_POOL_LOCK = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolPortal:
+    """
+    Get the global pool of worker processes.
+
+    Creates a new one if there is not one available.
+    """
+    global PROCESS_POOL
+
+    with _PROCESS_POOL_LOCK:
+        if PROCESS_POOL is None or PROCESS_POOL._shutdown:
+            PROCESS_POOL = ProcessPoolPortal(name="GlobalWorkerProcess")
+
+        return PROCESS_POOL
+
+
+def shutdown_process_pool(timeout: Optional[float] = None) -> None:
+    """
+    Shutdown the global pool of worker processes.
+    """
+    if PROCESS_POOL is not None:
+        PROCESS_POOL.shutdown(timeout)
@@ -3,28 +3,210 @@ import asyncio
 import atexit
 import concurrent.futures
 import contextlib
+import enum
 import logging
 import queue
+import sqlite3
 import sys
 import threading
-from typing import Awaitable, Dict, Generic, List, Optional, Type, TypeVar, Union
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from prefect._internal.concurrency import logger
-from prefect._internal.concurrency.api import create_call, from_sync
+from prefect._internal.concurrency.api import create_call, create_lightweight_call
 from prefect._internal.concurrency.cancellation import get_deadline, get_timeout
+from prefect._internal.concurrency.durable import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_MEMORY_SIZE,
+    DurableQueue,
+    get_default_queue_dir,
+)
 from prefect._internal.concurrency.event_loop import get_running_loop
-from prefect._internal.concurrency.threads import WorkerThread, get_global_loop
+from prefect._internal.concurrency.metrics import (
+    DURATION_BUCKETS,
+    SIZE_BUCKETS,
+    Histogram,
+    MetricsFileExporter,
+    merge_stats,
+)
+from prefect._internal.concurrency.primitives import (
+    CoalescingQueue,
+    OverflowPolicy,
+    PriorityQueue,
+    Queue,
+)
+from prefect._internal.concurrency.threads import (
+    EventLoopThread,
+    get_global_loop,
+    get_loop_thread_pool,
+)
+from prefect.utilities.hashing import stable_hash
 from typing_extensions import Self
 
 T = TypeVar("T")
 
 
+class LoopThreadAssignment(str, enum.Enum):
+    """
+    Determines which loop thread runs a new instance of a service.
+    """
+
+    HASH = "hash"
+    """Use the thread picked by a hash of the service and its arguments."""
+
+    LOAD = "load"
+    """Use the thread running the fewest service instances."""
+
+
 class QueueService(abc.ABC, Generic[T]):
+    """
+    A service that handles items sent to it on the global loop thread.
+
+    The queue of items is unbounded unless `_max_queue_size` is set, in units of
+    `_get_size`. When the queue is full, the `_overflow_policy` is applied to new items.
+    With the `BLOCK` policy, `send` waits up to `_send_timeout` seconds for space and
+    `send_async` waits without blocking the event loop.
+
+    If `_durable` is set, items are persisted to a queue file in the Prefect home
+    directory and only removed once they have been handled successfully. Items that
+    were not handled, because the handler failed or the process exited first, are
+    replayed when the service is next started; items that failed
+    `_durable_max_attempts` times are moved to a dead letter table instead. At most
+    `_memory_queue_size` items are held in memory. Items must be picklable, and only
+    the `BLOCK` and `DROP_NEWEST` overflow policies are supported.
+
+    If `_coalesce_key` is implemented, an item sent while an item with the same key is
+    pending is merged into the pending item instead, e.g. to only handle the latest
+    state of an entity. This is not supported for durable services.
+
+    If `_priority_weights` is set, items are placed in a lane for each weight by
+    `_priority`, and handled in weighted rounds that take up to `weight` items from
+    each lane, highest priority first. Priority lanes cannot be combined with durable
+    or coalescing services.
+
+    Items are handled one at a time unless `_max_concurrency` is set. Then, up to that
+    many items are handled at once, except that items with the same `_ordering_key`
+    are handled in order. An item waiting on an earlier item with the same key still
+    takes up one of the slots.
+
+    If `_loop_threads` is set, instances run on that many dedicated loop threads from
+    a pool shared by all services instead of the global loop thread, so a service with
+    a slow handler does not hold up other work. Instances are spread over the threads
+    according to the `_loop_thread_assignment`. Each instance is drained when its loop
+    thread is shut down.
+
+    If `_fan_in` is set and a `FanInServer` is running in a parent process, instances
+    in child processes forward their items to an instance in the parent instead. The
+    items must be picklable and are not passed through `_prepare_item` in the child.
+    """
+
     _instances: Dict[int, Self] = {}
     _instance_lock = threading.Lock()
+    _max_queue_size: Optional[int] = None
+    _overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK
+    _send_timeout: Optional[float] = None
+    _durable: bool = False
+    _memory_queue_size: int = DEFAULT_MEMORY_SIZE
+    _durable_max_attempts: Optional[int] = DEFAULT_MAX_ATTEMPTS
+    _max_concurrency: int = 1
+    _priority_weights: Optional[Sequence[int]] = None
+    _loop_threads: int = 0
+    _loop_thread_assignment: LoopThreadAssignment = LoopThreadAssignment.HASH
+    _fan_in: bool = False
 
     def __init__(self, *args) -> None:
-        self._queue: queue.Queue = queue.Queue()
+        if self._priority_weights is not None and (
+            self._durable or type(self)._coalesce_key is not QueueService._coalesce_key
+        ):
+            raise ValueError(
+                "Priority lanes cannot be combined with durable or coalescing services."
+            )
+
+        # Avoid calling the default size function for every item
+        get_size = (
+            self._get_size
+            if type(self)._get_size is not QueueService._get_size
+            else None
+        )
+        self._time_in_queue = Histogram(DURATION_BUCKETS)
+        self._handle_duration = Histogram(DURATION_BUCKETS)
+        self._handled_count = 0
+        self._failed_count = 0
+        self._created_at = time.monotonic()
+        self._stopped_at: Optional[float] = None
+        self._drain_duration: Optional[float] = None
+
+        self._durable_queue: Optional[DurableQueue] = None
+        if self._durable:
+            path = self._get_durable_queue_path(*args)
+            try:
+                self._durable_queue = DurableQueue(
+                    path,
+                    memory_size=self._memory_queue_size,
+                    maxsize=self._max_queue_size,
+                    get_size=get_size,
+                    overflow=self._overflow_policy,
+                    max_attempts=self._durable_max_attempts,
+                    wait_times=self._time_in_queue,
+                )
+            except (OSError, RuntimeError, sqlite3.Error) as exc:
+                logger.warning(
+                    "Service %r could not open queue file %s, items will only be held"
+                    " in memory: %s",
+                    type(self).__name__,
+                    path,
+                    exc,
+                )
+
+        self._queue: Queue
+        if self._durable_queue is not None:
+            self._queue = self._durable_queue
+        elif self._priority_weights is not None:
+            self._queue = PriorityQueue(
+                self._priority,
+                weights=self._priority_weights,
+                maxsize=self._max_queue_size,
+                get_size=get_size,
+                overflow=self._overflow_policy,
+                coalesce=self._coalesce,
+                wait_times=self._time_in_queue,
+            )
+        elif type(self)._coalesce_key is not QueueService._coalesce_key:
+            self._queue = CoalescingQueue(
+                self._coalesce_key,
+                maxsize=self._max_queue_size,
+                get_size=get_size,
+                overflow=self._overflow_policy,
+                coalesce=self._coalesce,
+                wait_times=self._time_in_queue,
+            )
+        else:
+            self._queue = Queue(
+                maxsize=self._max_queue_size,
+                get_size=get_size,
+                overflow=self._overflow_policy,
+                coalesce=self._coalesce,
+                wait_times=self._time_in_queue,
+            )
+        self._loop_thread: Optional[EventLoopThread] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._done_event: Optional[asyncio.Event] = None
         self._task: Optional[asyncio.Task] = None
@@ -32,28 +214,23 @@ class QueueService(abc.ABC, Generic[T]):
         self._started: bool = False
         self._key = hash(args)
         self._lock = threading.Lock()
-        self._queue_get_thread = WorkerThread(
-            # TODO: This thread should not need to be a daemon but when it is not, it
-            #       can prevent the interpreter from exiting.
-            daemon=True,
-            name=f"{type(self).__name__}Thread",
-        )
 
     def start(self):
         logger.debug("Starting service %r", self)
-        loop_thread = get_global_loop()
+        if self._loop_thread is None:
+            self._loop_thread = get_global_loop()
+        loop_thread = self._loop_thread
 
         if not asyncio.get_running_loop() == loop_thread._loop:
-            raise RuntimeError("Services must run on the global loop thread.")
+            raise RuntimeError("Services must run on their loop thread.")
 
         self._loop = loop_thread._loop
         self._done_event = asyncio.Event()
         self._task = self._loop.create_task(self._run())
-        self._queue_get_thread.start()
         self._started = True
 
         # Ensure that we wait for worker completion before loop thread shutdown
-        loop_thread.add_shutdown_call(create_call(self.drain))
+        loop_thread.add_shutdown_call(create_lightweight_call(self.drain))
 
         # Stop at interpreter exit by default
         if sys.version_info < (3, 9):
@@ -89,6 +266,7 @@ class QueueService(abc.ABC, Generic[T]):
             # Stop sending work to this instance
             self._remove_instance()
             self._stopped = True
+            self._stopped_at = time.monotonic()
 
             # Allow asyncio task to be garbage-collected. Its context may contain
             # references to all Prefect Task calls made during a flow run, through
@@ -96,18 +274,165 @@ class QueueService(abc.ABC, Generic[T]):
             self._task = None
 
             # Signal completion to the loop
-            self._queue.put_nowait(None)
+            self._queue.close()
 
     def send(self, item: T):
         """
         Send an item to this instance of the service.
+
+        If the queue is full and the overflow policy is `BLOCK`, waits for space for up
+        to `_send_timeout` seconds, then raises `queue.Full`. When called from the
+        global loop thread, raises `queue.Full` without waiting; use `send_async`.
         """
-        with self._lock:
-            if self._stopped:
-                raise RuntimeError("Cannot put items in a stopped service instance.")
+        self._check_not_stopped()
+        logger.debug("Service %r enqueuing item %r", self, item)
+        item = self._prepare_item(item)
+
+        try:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                # Waiting for space here would block the loop that frees space
+                if self._loop is not None and get_running_loop() is self._loop:
+                    raise
+                self._queue.put(item, timeout=self._send_timeout)
+        except RuntimeError:
+            self._check_not_stopped()
+            raise
+
+    async def send_async(self, item: T):
+        """
+        Send an item to this instance of the service from an async context.
+
+        If the queue is full and the overflow policy is `BLOCK`, waits for space for up
+        to `_send_timeout` seconds without blocking the event loop, then raises
+        `queue.Full`.
+        """
+        self._check_not_stopped()
+        logger.debug("Service %r enqueuing item %r", self, item)
+        item = self._prepare_item(item)
+
+        try:
+            await self._queue.aput(item, timeout=self._send_timeout)
+        except RuntimeError:
+            self._check_not_stopped()
+            raise
 
-            logger.debug("Service %r enqueuing item %r", self, item)
-            self._queue.put_nowait(self._prepare_item(item))
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get metrics for this instance of the service.
+
+        Counters are named with a `_count` suffix and durations are in seconds. The
+        histograms are copies and are not updated after they are returned. The handle
+        duration is observed per batch for batched services.
+        """
+        uptime = time.monotonic() - self._created_at
+        return {
+            "depth": self._queue.qsize(),
+            "size": self._queue.size(),
+            "enqueued_count": self._queue.put_count,
+            "enqueue_rate": self._queue.put_count / uptime if uptime else 0.0,
+            "handled_count": self._handled_count,
+            "failed_count": self._failed_count,
+            "dropped_count": self._queue.dropped_count,
+            "blocked_count": self._queue.blocked_count,
+            "coalesced_count": self._queue.coalesced_count,
+            "time_in_queue_seconds": self._time_in_queue.copy(),
+            "handle_duration_seconds": self._handle_duration.copy(),
+            "drain_duration_seconds": self._drain_duration,
+            "uptime_seconds": uptime,
+        }
+
+    @classmethod
+    def aggregate_stats(cls) -> Dict[str, Any]:
+        """
+        Get metrics for all running instances of the service combined.
+
+        See `merge_stats` for how the metrics of each instance are combined.
+        """
+        with cls._instance_lock:
+            instances = [
+                instance
+                for instance in cls._instances.values()
+                if isinstance(instance, cls)
+            ]
+
+        return merge_stats([instance.stats() for instance in instances])
+
+    @classmethod
+    def all_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the combined metrics of the running instances of each type of service,
+        keyed by the name of the type.
+        """
+        with cls._instance_lock:
+            instances = [
+                instance
+                for instance in cls._instances.values()
+                if isinstance(instance, cls)
+            ]
+
+        stats_by_type: Dict[str, List[Dict[str, Any]]] = {}
+        for instance in instances:
+            stats_by_type.setdefault(type(instance).__name__, []).append(
+                instance.stats()
+            )
+
+        return {
+            name: merge_stats(stats) for name, stats in sorted(stats_by_type.items())
+        }
+
+    @classmethod
+    def export_metrics(
+        cls,
+        path: Union[str, Path],
+        interval: float = 10.0,
+        format: str = "openmetrics",
+    ) -> MetricsFileExporter:
+        """
+        Start writing the metrics of running services to a file every `interval`
+        seconds, as JSON or in the OpenMetrics text format.
+
+        Returns the exporter, which must be stopped with `stop()`.
+        """
+        return MetricsFileExporter(
+            path, cls.all_stats, interval=interval, format=format
+        ).start()
+
+    def _get_durable_queue_path(self, *args) -> Path:
+        """
+        Get the path of the queue file for a durable instance with the given arguments.
+        """
+        cls = type(self)
+        key = stable_hash(cls.__module__, cls.__qualname__, repr(args))
+        return get_default_queue_dir() / f"{cls.__name__}-{key[:16]}.db"
+
+    def _take_row_ids(self, count: int) -> List[int]:
+        """
+        Take the row ids of the items just retrieved from the queue, if durable, to
+        acknowledge or release them once they are handled.
+        """
+        if self._durable_queue is None:
+            return []
+        return self._durable_queue.take_row_ids(count)
+
+    def _ack(self, row_ids: List[int]) -> None:
+        """
+        Mark items as handled, removing them from the queue file if durable.
+        """
+        if self._durable_queue is not None and row_ids:
+            self._durable_queue.ack(row_ids)
+
+    def _release(self, row_ids: List[int]) -> None:
+        """
+        Mark items as failed, keeping them in the queue file to be replayed if durable.
+        """
+        if self._durable_queue is not None and row_ids:
+            self._durable_queue.release(row_ids)
+
+    def _check_not_stopped(self):
+        if self._stopped or self._queue.closed():
+            raise RuntimeError("Cannot put items in a stopped service instance.")
 
     def _prepare_item(self, item: T) -> T:
         """
@@ -118,6 +443,40 @@ class QueueService(abc.ABC, Generic[T]):
         """
         return item
 
+    def _get_size(self, item: T) -> int:
+        """
+        Calculate the size of a single item.
+        """
+        # By default, the size is just the number of items
+        return 1
+
+    def _priority(self, item: T) -> Optional[int]:
+        """
+        Get the priority of an item when `_priority_weights` is set. Zero is the
+        highest priority; priorities past the number of lanes use the lowest lane.
+
+        The default implementation returns `None`, which is the lowest priority.
+        """
+        return None
+
+    def _coalesce_key(self, item: T) -> Optional[Hashable]:
+        """
+        Get the key of an item for coalescing. A new item is merged into a pending item
+        with the same key with `_coalesce` instead of being added to the queue.
+
+        The default implementation returns `None`, which never coalesces the item.
+        """
+        return None
+
+    def _coalesce(self, pending: T, item: T) -> T:
+        """
+        Merge a new item into a pending item, for items with the same `_coalesce_key`
+        and for the `COALESCE` overflow policy.
+
+        The default implementation replaces the pending item with the new item.
+        """
+        return item
+
     async def _run(self):
         try:
             async with self._lifespan():
@@ -136,33 +495,76 @@ class QueueService(abc.ABC, Generic[T]):
         finally:
             self._remove_instance()
 
-            # Shutdown the worker thread
-            self._queue_get_thread.shutdown()
-
             self._stopped = True
+            if self._stopped_at is not None:
+                self._drain_duration = time.monotonic() - self._stopped_at
+            if self._durable_queue is not None:
+                self._durable_queue.dispose()
             self._done_event.set()
 
     async def _main_loop(self):
+        if self._max_concurrency > 1:
+            return await self._concurrent_main_loop()
+
         while True:
-            item: T = await self._queue_get_thread.submit(
-                create_call(self._queue.get)
-            ).aresult()
+            item: T = await self._queue.get()
 
             if item is None:
                 logger.debug("Exiting service %r", self)
                 break
 
-            try:
-                logger.debug("Service %r handling item %r", self, item)
-                await self._handle(item)
-            except Exception:
-                log_traceback = logger.isEnabledFor(logging.DEBUG)
-                logger.error(
-                    "Service %r failed to process item %r",
-                    type(self).__name__,
-                    item,
-                    exc_info=log_traceback,
-                )
+            await self._handle_item(item, self._take_row_ids(1))
+
+    async def _concurrent_main_loop(self):
+        handlers = _OrderedTaskGroup(self._max_concurrency)
+
+        while True:
+            await handlers.wait_for_slot()
+            item: T = await self._queue.get()
+
+            if item is None:
+                handlers.release_slot()
+                logger.debug("Exiting service %r", self)
+                break
+
+            handlers.start(
+                self._handle_item(item, self._take_row_ids(1)),
+                [self._ordering_key(item)],
+            )
+
+        # Wait for in-flight items so draining the service waits for them too
+        await handlers.join()
+
+    async def _handle_item(self, item: T, row_ids: List[int]):
+        start = time.monotonic()
+        try:
+            logger.debug("Service %r handling item %r", self, item)
+            await self._handle(item)
+        except Exception:
+            self._failed_count += 1
+            self._release(row_ids)
+            log_traceback = logger.isEnabledFor(logging.DEBUG)
+            logger.error(
+                "Service %r failed to process item %r",
+                type(self).__name__,
+                item,
+                exc_info=log_traceback,
+            )
+        else:
+            self._ack(row_ids)
+        finally:
+            self._handled_count += 1
+            self._handle_duration.observe(time.monotonic() - start)
+
+    def _ordering_key(self, item: T) -> Optional[Hashable]:
+        """
+        Get the key of an item for ordering when `_max_concurrency` is greater than
+        one. Items with the same key are handled in the order they were sent.
+
+        The default implementation returns `None`, which places no restrictions on
+        the order of the item.
+        """
+        return None
 
     @abc.abstractmethod
     async def _handle(self, item: T):
@@ -241,6 +643,16 @@ class QueueService(abc.ABC, Generic[T]):
 
         If an instance already exists with the given arguments, it will be returned.
         """
+        if cls._fan_in:
+            from prefect._internal.concurrency.fanin import (
+                FanInForwarder,
+                get_fan_in_address,
+            )
+
+            address = get_fan_in_address()
+            if address is not None:
+                return FanInForwarder.for_service(address, cls, *args)
+
         with cls._instance_lock:
             key = hash(args)
             if key not in cls._instances:
@@ -257,17 +669,42 @@ class QueueService(abc.ABC, Generic[T]):
         Create and start a new instance of the service.
         """
         instance = cls(*args)
+        instance._loop_thread = loop_thread = instance._select_loop_thread()
 
-        # If already on the global loop, just start it here to avoid deadlock
-        if threading.get_ident() == get_global_loop().thread.ident:
+        # If already on the loop thread, just start it here to avoid deadlock
+        if threading.get_ident() == loop_thread.thread.ident:
             instance.start()
 
-        # Otherwise, bind the service to the global loop
+        # Otherwise, bind the service to the loop thread
         else:
-            from_sync.call_soon_in_loop_thread(create_call(instance.start)).result()
+            loop_thread.submit(create_call(instance.start)).result()
 
         return instance
 
+    def _select_loop_thread(self) -> EventLoopThread:
+        """
+        Pick the loop thread to run this instance on.
+
+        Must be called while holding the instance lock.
+        """
+        if self._loop_threads <= 0:
+            return get_global_loop()
+
+        pool = get_loop_thread_pool()
+        if self._loop_thread_assignment == LoopThreadAssignment.LOAD:
+            loop_threads = [pool.get(index) for index in range(self._loop_threads)]
+            loads = [
+                sum(
+                    instance._loop_thread is loop_thread
+                    for instance in self._instances.values()
+                )
+                for loop_thread in loop_threads
+            ]
+            return loop_threads[loads.index(min(loads))]
+
+        index = hash((type(self).__qualname__, self._key)) % self._loop_threads
+        return pool.get(index)
+
 
 class BatchedQueueService(QueueService[T]):
     """
@@ -275,62 +712,186 @@ class BatchedQueueService(QueueService[T]):
 
     Items will be processed when the batch reaches the configured `_max_batch_size`
     or after an interval of `_min_interval` seconds (if set).
+
+    With priority lanes, batches are filled in the weighted order of the lanes, and
+    a batch with an item from the highest priority lane is handled without waiting
+    for the rest of the interval.
+
+    With `_max_concurrency`, up to that many batches are handled at once. A batch
+    waits for earlier batches that contain items with the same `_ordering_key`.
+
+    If `_adaptive_batching` is set, the batch size and interval are tuned by an
+    `AdaptiveBatchController` from the outcome of each batch instead. The batch size
+    stays between `_min_batch_size` and `_max_batch_size`; the interval stays within
+    `_interval_bounds`, which defaults to between zero and `_min_interval`. Batches
+    that take longer than `_target_batch_duration` seconds are treated as slow.
+    The current values are available as `current_batch_size` and
+    `current_interval`.
     """
 
     _max_batch_size: int
     _min_interval: Optional[float] = None
+    _adaptive_batching: bool = False
+    _min_batch_size: int = 1
+    _interval_bounds: Optional[Tuple[float, float]] = None
+    _target_batch_duration: float = 1.0
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self._batch_sizes = Histogram(SIZE_BUCKETS)
+        self._batch_weights = Histogram(SIZE_BUCKETS)
+        self._batch_controller: Optional[AdaptiveBatchController] = None
+        if self._adaptive_batching:
+            self._batch_controller = AdaptiveBatchController(
+                min_batch_size=self._min_batch_size,
+                max_batch_size=self._max_batch_size,
+                interval_bounds=(
+                    self._interval_bounds
+                    if self._interval_bounds is not None or self._min_interval is None
+                    else (0.0, self._min_interval)
+                ),
+                target_duration=self._target_batch_duration,
+            )
+
+    @property
+    def current_batch_size(self) -> int:
+        """
+        The maximum size of the next batch.
+        """
+        if self._batch_controller is not None:
+            return self._batch_controller.batch_size
+        return self._max_batch_size
+
+    @property
+    def current_interval(self) -> Optional[float]:
+        """
+        The number of seconds to wait for the next batch to fill before it is handled.
+        """
+        if self._batch_controller is not None:
+            return self._batch_controller.interval
+        return self._min_interval
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["batch_size"] = self._batch_sizes.copy()
+        stats["batch_weight"] = self._batch_weights.copy()
+        stats["current_batch_size"] = self.current_batch_size
+        stats["current_interval_seconds"] = self.current_interval
+        return stats
 
     async def _main_loop(self):
+        handlers = (
+            _OrderedTaskGroup(self._max_concurrency)
+            if self._max_concurrency > 1
+            else None
+        )
         done = False
 
         while not done:
+            if handlers is not None:
+                await handlers.wait_for_slot()
+
             batch = []
             batch_size = 0
+            row_ids = []
+            max_batch_size = self.current_batch_size
 
-            # Pull items from the queue until we reach the batch size
-            deadline = get_deadline(self._min_interval)
-            while batch_size < self._max_batch_size:
+            # Pull items from the queue until we reach the batch size, taking all of
+            # the items available at once and only waiting when the queue is empty
+            deadline = get_deadline(self.current_interval)
+            while batch_size < max_batch_size:
                 try:
-                    item = await self._queue_get_thread.submit(
-                        create_call(self._queue.get, timeout=get_timeout(deadline))
-                    ).aresult()
-
-                    if item is None:
-                        done = True
-                        break
-
-                    batch.append(item)
-                    batch_size += self._get_size(item)
-                    logger.debug(
-                        "Service %r added item %r to batch (size %s/%s)",
-                        self,
-                        item,
-                        batch_size,
-                        self._max_batch_size,
+                    items, size = await self._queue.get_batch(
+                        max_batch_size - batch_size,
+                        timeout=get_timeout(deadline),
                     )
                 except queue.Empty:
                     # Process the batch after `min_interval` even if it is smaller than
                     # the batch size
                     break
 
+                if not items:
+                    # The queue is closed and all items have been retrieved
+                    done = True
+                    break
+
+                batch.extend(items)
+                batch_size += size
+                row_ids.extend(self._take_row_ids(len(items)))
+                logger.debug(
+                    "Service %r added %s items to batch (size %s/%s)",
+                    self,
+                    len(items),
+                    batch_size,
+                    max_batch_size,
+                )
+
+                if self._has_urgent_item(items):
+                    # Do not wait for the batch to fill
+                    break
+
             if not batch:
+                if handlers is not None:
+                    handlers.release_slot()
                 continue
 
-            logger.debug(
-                "Service %r processing batch of size %s",
+            if handlers is not None:
+                handlers.start(
+                    self._process_batch(batch, batch_size, row_ids),
+                    [self._ordering_key(item) for item in batch],
+                )
+            else:
+                await self._process_batch(batch, batch_size, row_ids)
+
+        if handlers is not None:
+            # Wait for in-flight batches so draining the service waits for them too
+            await handlers.join()
+
+    def _has_urgent_item(self, items: List[T]) -> bool:
+        """
+        Check if any of the items are in the highest of several priority lanes.
+        """
+        if not isinstance(self._queue, PriorityQueue) or len(self._queue.weights) < 2:
+            return False
+        return any(self._queue.get_lane(item) == 0 for item in items)
+
+    async def _process_batch(self, batch: List[T], batch_size: int, row_ids: List[int]):
+        logger.debug(
+            "Service %r processing batch of size %s",
+            self,
+            batch_size,
+        )
+        failed = False
+        start = time.monotonic()
+        try:
+            await self._handle_batch(batch)
+        except Exception:
+            failed = True
+            self._failed_count += len(batch)
+            self._release(row_ids)
+            log_traceback = logger.isEnabledFor(logging.DEBUG)
+            logger.error(
+                "Service %r failed to process batch of size %s",
                 self,
                 batch_size,
+                exc_info=log_traceback,
+            )
+        else:
+            self._ack(row_ids)
+
+        duration = time.monotonic() - start
+        self._handled_count += len(batch)
+        self._handle_duration.observe(duration)
+        self._batch_sizes.observe(len(batch))
+        self._batch_weights.observe(batch_size)
+
+        if self._batch_controller is not None:
+            self._batch_controller.record(
+                batch_size,
+                duration=duration,
+                failed=failed,
+                backlog=self._queue.size(),
             )
-            try:
-                await self._handle_batch(batch)
-            except Exception:
-                log_traceback = logger.isEnabledFor(logging.DEBUG)
-                logger.error(
-                    "Service %r failed to process batch of size %s",
-                    self,
-                    batch_size,
-                    exc_info=log_traceback,
-                )
 
     @abc.abstractmethod
     async def _handle_batch(self, items: List[T]):
@@ -341,12 +902,131 @@ class BatchedQueueService(QueueService[T]):
     async def _handle(self, item: T):
         assert False, "`_handle` should never be called for batched queue services"
 
-    def _get_size(self, item: T) -> int:
+
+class AdaptiveBatchController:
+    """
+    Tunes the size and interval of batches from the outcome of each batch.
+
+    The batch size is adjusted with additive increase, multiplicative decrease
+    (AIMD): it grows by a step while batches are handled within `target_duration` and
+    items are backing up, and is cut by `decrease_factor` when a batch fails or is
+    slow. The interval is shortened when batches are handled before they fill with
+    no items waiting, so items are not held under light load. It is lengthened while
+    items are backing up, and backs off when a batch fails.
+
+    Both values start at their upper bounds. The interval is `None`, i.e. batches
+    wait until they are full, if `interval_bounds` is `None`.
+    """
+
+    def __init__(
+        self,
+        min_batch_size: int,
+        max_batch_size: int,
+        interval_bounds: Optional[Tuple[float, float]] = None,
+        target_duration: float = 1.0,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        self.min_batch_size = max(1, min(min_batch_size, max_batch_size))
+        self.max_batch_size = max_batch_size
+        self.interval_bounds = interval_bounds
+        self.target_duration = target_duration
+        self.decrease_factor = decrease_factor
+
+        self.batch_size = max_batch_size
+        """The current maximum size of a batch."""
+
+        self.interval = interval_bounds[1] if interval_bounds is not None else None
+        """The current number of seconds to wait for a batch to fill."""
+
+        self._batch_size_step = max(1, (max_batch_size - self.min_batch_size) // 10)
+        self._interval_step = (
+            (interval_bounds[1] - interval_bounds[0]) / 10
+            if interval_bounds is not None
+            else 0.0
+        )
+
+    def record(self, size: int, duration: float, failed: bool, backlog: int) -> None:
         """
-        Calculate the size of a single item.
+        Record the outcome of a batch of the given `size`, with the total size of
+        items still in the queue as the `backlog`.
         """
-        # By default, batch size is just the number of items
-        return 1
+        if failed or duration > self.target_duration:
+            self.batch_size = max(
+                self.min_batch_size, int(self.batch_size * self.decrease_factor)
+            )
+            if failed:
+                self._update_interval(lambda interval: interval / self.decrease_factor)
+
+        elif size >= self.batch_size or backlog:
+            self.batch_size = min(
+                self.max_batch_size, self.batch_size + self._batch_size_step
+            )
+            self._update_interval(lambda interval: interval + self._interval_step)
+
+        else:
+            self._update_interval(lambda interval: interval * self.decrease_factor)
+
+    def _update_interval(self, update: Callable[[float], float]) -> None:
+        if self.interval_bounds is not None:
+            lower, upper = self.interval_bounds
+            self.interval = min(max(update(self.interval), lower), upper)
+
+
+class _OrderedTaskGroup:
+    """
+    Runs up to `max_concurrency` coroutines at once, in the order they were started
+    for coroutines that share a key.
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._tasks: Set[asyncio.Task] = set()
+        self._last_task_by_key: Dict[Hashable, asyncio.Task] = {}
+
+    async def wait_for_slot(self) -> None:
+        await self._slots.acquire()
+
+    def release_slot(self) -> None:
+        self._slots.release()
+
+    def start(self, coro: Coroutine, keys: Iterable[Optional[Hashable]]) -> None:
+        """
+        Run a coroutine in a slot from `wait_for_slot`, after all earlier coroutines
+        with any of the same keys.
+        """
+        keys = {key for key in keys if key is not None}
+        previous = {
+            self._last_task_by_key[key] for key in keys if key in self._last_task_by_key
+        }
+
+        task = asyncio.ensure_future(self._run(coro, previous))
+        self._tasks.add(task)
+        for key in keys:
+            self._last_task_by_key[key] = task
+        task.add_done_callback(lambda task: self._on_done(task, keys))
+
+    async def _run(self, coro: Coroutine, previous: Set[asyncio.Task]) -> None:
+        try:
+            if previous:
+                await asyncio.wait(previous)
+            await coro
+        finally:
+            # Avoid a warning if the task was cancelled before the coroutine started
+            coro.close()
+            self._slots.release()
+
+    def _on_done(self, task: asyncio.Task, keys: Set[Hashable]) -> None:
+        self._tasks.discard(task)
+        for key in keys:
+            if self._last_task_by_key.get(key) is task:
+                del self._last_task_by_key[key]
+
+    async def join(self) -> None:
+        """
+        Wait for all started coroutines to finish.
+        """
+        while self._tasks:
+            await asyncio.wait(set(self._tasks))
 
 
 @contextlib.contextmanager
@@ -0,0 +1,297 @@
+"""
+A bounded buffer for carrying the items of an async iterator across threads.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from collections import deque
+from typing import (
+    AsyncIterator,
+    Callable,
+    Deque,
+    Generic,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from prefect._internal.concurrency.cancellation import CancelledError
+from prefect._internal.concurrency.event_loop import get_running_loop
+
+T = TypeVar("T")
+
+DEFAULT_STREAM_BUFFER_SIZE = 64
+"""The default number of items to buffer between a producer and its consumer."""
+
+_EMPTY = object()
+_DONE = object()
+
+
+def _set_wakeup(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _wake_in_loop(loop: asyncio.AbstractEventLoop, future: asyncio.Future) -> None:
+    try:
+        loop.call_soon_threadsafe(_set_wakeup, future)
+    except RuntimeError:
+        pass  # The event loop is closed
+
+
+class StreamBuffer(Generic[T]):
+    """
+    A bounded buffer that carries the items of an async iterator running in an event
+    loop to a consumer in another thread or event loop.
+
+    The producer waits while the buffer is full, so a slow consumer holds back the
+    iterator instead of items accumulating in memory. The consumer takes all of the
+    buffered items at once, so the threads do not hand off control for every item.
+
+    The consumer can close the buffer to stop the producer early. A producer that is
+    waiting for space stops and closes the iterator; one that is waiting within the
+    iterator is cancelled.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_STREAM_BUFFER_SIZE) -> None:
+        if max_size < 1:
+            raise ValueError("`max_size` must be at least 1.")
+
+        self.max_size = max_size
+        self._items: Deque[T] = deque()
+        self._lock = threading.Lock()
+        self._done = False
+        self._closed = False
+        self._exception: Optional[BaseException] = None
+        self._consumer_waker: Optional[Callable[[], None]] = None
+        self._producer_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._producer_task: Optional[asyncio.Task] = None
+        self._producer_wakeup: Optional[asyncio.Future] = None
+        self._producer_exited = concurrent.futures.Future()
+
+    async def produce(self, get_iterator: Callable[[], AsyncIterator[T]]) -> None:
+        """
+        Put the items of an async iterator in the buffer until it is exhausted or the
+        buffer is closed.
+
+        Exceptions raised while getting or iterating over the iterator are passed on to
+        the consumer.
+        """
+        with self._lock:
+            self._producer_loop = asyncio.get_running_loop()
+            self._producer_task = asyncio.current_task()
+            closed = self._closed
+
+        try:
+            if not closed:
+                await self._produce(get_iterator)
+        finally:
+            self._set_producer_exited()
+
+    async def _produce(self, get_iterator: Callable[[], AsyncIterator[T]]) -> None:
+        try:
+            iterator = get_iterator()
+        except BaseException as exc:
+            self.finish(exc)
+            raise
+
+        try:
+            async for item in iterator:
+                added = self._put(item)
+                while isinstance(added, asyncio.Future):
+                    await added
+                    added = self._put(item)
+                if not added:
+                    break
+        except BaseException as exc:
+            self.finish(exc)
+            raise
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        self.finish()
+
+    def _put(self, item: T) -> Union[bool, asyncio.Future]:
+        """
+        Add an item to the buffer.
+
+        Returns `False` if the buffer is closed, or a future to wait on before trying
+        again if the buffer is full.
+        """
+        with self._lock:
+            if self._closed:
+                return False
+
+            if len(self._items) >= self.max_size:
+                wakeup = self._producer_wakeup = self._producer_loop.create_future()
+                return wakeup
+
+            self._items.append(item)
+            waker, self._consumer_waker = self._consumer_waker, None
+
+        if waker is not None:
+            # Wake the consumer once the producer yields to the event loop, so items
+            # produced without waiting are handed off together
+            self._producer_loop.call_soon(waker)
+        return True
+
+    def finish(self, exception: Optional[BaseException] = None) -> None:
+        """
+        Mark the end of the stream. The consumer raises `exception` once it has
+        retrieved the buffered items, if one is given.
+
+        Only the first call has an effect.
+        """
+        with self._lock:
+            if self._done:
+                return
+            self._done = True
+            self._exception = exception
+            waker, self._consumer_waker = self._consumer_waker, None
+
+        if waker is not None:
+            waker()
+
+    def close(self) -> None:
+        """
+        Stop consuming items; buffered items are discarded and the producer stops.
+
+        See `wait_for_producer` to wait for the producer to exit.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._items.clear()
+            wakeup, self._producer_wakeup = self._producer_wakeup, None
+            task = self._producer_task if not self._producer_exited.done() else None
+
+        if wakeup is not None:
+            # The producer is waiting for space and will stop cleanly
+            _wake_in_loop(self._producer_loop, wakeup)
+        elif task is not None:
+            # The producer may be waiting within the iterator
+            try:
+                self._producer_loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # The event loop is closed
+
+    def cancel_if_not_started(self) -> None:
+        """
+        End the stream with a cancelled error if the producer never started, e.g.
+        because the call running it was cancelled before it ran.
+        """
+        with self._lock:
+            if self._producer_task is not None:
+                return
+
+        self.finish(CancelledError())
+        self._set_producer_exited()
+
+    def _set_producer_exited(self) -> None:
+        with self._lock:
+            if self._producer_exited.done():
+                return
+            self._producer_exited.set_result(None)
+
+    def in_producer_loop(self) -> bool:
+        """
+        Check if called from the event loop running the producer, where waiting for
+        the producer would deadlock.
+        """
+        loop = self._producer_loop
+        return loop is not None and get_running_loop() is loop
+
+    def wait_for_producer(self) -> None:
+        """
+        Block until the producer has exited.
+        """
+        self._producer_exited.result()
+
+    async def await_producer(self) -> None:
+        """
+        Wait until the producer has exited.
+        """
+        await asyncio.wrap_future(self._producer_exited)
+
+    def _take(self, waker: Callable[[], Callable[[], None]]):
+        """
+        Take the buffered items, or register a waker from the given factory if there
+        are none yet. Must be called while holding the lock.
+        """
+        if self._items:
+            items = list(self._items)
+            self._items.clear()
+            if self._producer_wakeup is not None:
+                wakeup, self._producer_wakeup = self._producer_wakeup, None
+                _wake_in_loop(self._producer_loop, wakeup)
+            return items
+
+        if self._done:
+            return _DONE
+
+        self._consumer_waker = waker()
+        return _EMPTY
+
+    def _raise_for_done(self, stop: BaseException):
+        exc = self._exception
+        if exc is None:
+            raise stop
+        if isinstance(exc, asyncio.CancelledError):
+            # Raise Prefect cancelled error instead of `asyncio.CancelledError`
+            raise CancelledError() from exc
+        raise exc
+
+    def get_batch(self) -> List[T]:
+        """
+        Get the buffered items, blocking until there is at least one.
+
+        Raises `StopIteration` at the end of the stream.
+        """
+        parked = None
+
+        def park():
+            nonlocal parked
+            parked = threading.Lock()
+            parked.acquire()
+            return parked.release
+
+        while True:
+            with self._lock:
+                items = self._take(park)
+
+            if items is _EMPTY:
+                parked.acquire()
+            elif items is _DONE:
+                self._raise_for_done(StopIteration())
+            else:
+                return items
+
+    async def aget_batch(self) -> List[T]:
+        """
+        Get the buffered items, waiting until there is at least one.
+
+        Raises `StopAsyncIteration` at the end of the stream.
+        """
+        loop = asyncio.get_running_loop()
+        wakeup = None
+
+        def park():
+            nonlocal wakeup
+            wakeup = loop.create_future()
+            return lambda: _wake_in_loop(loop, wakeup)
+
+        while True:
+            with self._lock:
+                items = self._take(park)
+
+            if items is _EMPTY:
+                await wakeup
+            elif items is _DONE:
+                self._raise_for_done(StopAsyncIteration())
+            else:
+                return items
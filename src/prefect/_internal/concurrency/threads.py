@@ -1,13 +1,14 @@
 """
 Utilities for managing worker threads.
 """
+
 import asyncio
 import atexit
 import concurrent.futures
 import itertools
 import queue
 import threading
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from prefect._internal.concurrency import logger
 from prefect._internal.concurrency.calls import Call, Portal
@@ -15,6 +16,12 @@ from prefect._internal.concurrency.cancellation import CancelledError
 from prefect._internal.concurrency.event_loop import get_running_loop
 from prefect._internal.concurrency.primitives import Event
 
+DEFAULT_MAX_POOL_SIZE = 64
+"""The default maximum number of threads in a `WorkerThreadPool`."""
+
+DEFAULT_POOL_IDLE_TIMEOUT = 1.0
+"""The default number of seconds before an idle thread in a `WorkerThreadPool` exits."""
+
 
 class WorkerThread(Portal):
     """
@@ -114,6 +121,204 @@ class WorkerThread(Portal):
         self.shutdown()
 
 
+class WorkerThreadPool(Portal):
+    """
+    A portal to a pool of reusable worker threads.
+
+    Threads are started as calls are submitted, up to `max_size`, and reused for later
+    calls. Threads beyond `min_size` exit after `idle_timeout` seconds without work.
+    When all of the threads are busy and the pool is full, calls wait in a queue.
+    Calls submitted from a thread of a full pool start an extra thread instead, since
+    the submitting thread may be waiting for them.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 0,
+        max_size: int = DEFAULT_MAX_POOL_SIZE,
+        idle_timeout: float = DEFAULT_POOL_IDLE_TIMEOUT,
+        name: str = "WorkerThreadPool",
+    ):
+        if max_size < 1 or min_size > max_size:
+            raise ValueError(
+                "The pool must allow at least one thread and no more than `max_size`."
+            )
+
+        self.name = name
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._counter = itertools.count().__next__
+        self._queue = queue.SimpleQueue()
+        self._threads: Set[threading.Thread] = set()
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+        # The number of threads waiting for work that has not been submitted yet
+        self._idle = 0
+        # The number of calls waiting for a thread
+        self._depth = 0
+        self._max_depth = 0
+        self._submitted_count = 0
+        self._completed_count = 0
+        self._started_count = 0
+
+        # Let idle threads exit before the interpreter waits for non-daemon threads
+        threading._register_atexit(self.shutdown)
+
+    def submit(self, call: Call) -> Call:
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Worker pool is shutdown.")
+
+            # Track the portal running the call
+            call.set_runner(self)
+
+            if self._idle:
+                self._idle -= 1
+            elif (
+                len(self._threads) < self.max_size
+                or threading.current_thread() in self._threads
+            ):
+                self._start_thread()
+            else:
+                self._depth += 1
+                self._max_depth = max(self._depth, self._max_depth)
+
+            self._queue.put(call)
+            self._submitted_count += 1
+
+        return call
+
+    def shutdown(self) -> None:
+        """
+        Shutdown the worker threads once they finish their current calls. Does not wait
+        for the threads to stop.
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+
+            self._shutdown = True
+            for _ in self._threads:
+                self._queue.put(None)
+
+    def wait_for_exit(self, timeout: Optional[float] = None) -> None:
+        """
+        Shutdown the worker threads and wait for them to exit.
+
+        The timeout applies to each thread.
+        """
+        self.shutdown()
+        with self._lock:
+            threads = tuple(self._threads)
+
+        if threading.current_thread() in threads:
+            raise RuntimeError(
+                "Cannot wait for the pool from inside one of its threads."
+            )
+
+        for thread in threads:
+            thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get metrics for the pool.
+        """
+        with self._lock:
+            return {
+                "threads": len(self._threads),
+                "idle_threads": self._idle,
+                "depth": self._depth,
+                "max_depth": self._max_depth,
+                "submitted_count": self._submitted_count,
+                "completed_count": self._completed_count,
+                "started_thread_count": self._started_count,
+            }
+
+    def _start_thread(self) -> None:
+        """
+        Start a thread for a call that is about to be submitted. Must be called while
+        holding the lock.
+        """
+        thread = threading.Thread(
+            name=f"{self.name}-{self._counter()}", target=self._entrypoint
+        )
+        self._threads.add(thread)
+        self._started_count += 1
+        thread.start()
+
+    def _entrypoint(self):
+        """
+        Entrypoint for the threads.
+        """
+        try:
+            self._run_until_shutdown()
+        except BaseException:
+            # Log exceptions that crash the thread
+            logger.exception("%s encountered exception", threading.current_thread())
+            raise
+        finally:
+            with self._lock:
+                self._threads.discard(threading.current_thread())
+
+    def _run_until_shutdown(self):
+        while True:
+            call = self._get_call()
+            if call is None:
+                break  # shutdown requested or idle for too long
+
+            try:
+                task = call.run()
+                assert task is None  # calls should never return a coroutine here
+            except CancelledError:
+                # A cancellation injected into this thread can arrive after the call
+                # it was meant for has finished
+                logger.debug("Ignoring late cancellation of call %r", call)
+            del call
+
+            self._update_idle(completed=True)
+
+    def _get_call(self) -> Optional[Call]:
+        while True:
+            try:
+                return self._queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                if self._update_idle(completed=False):
+                    return None
+
+    def _update_idle(self, completed: bool) -> bool:
+        """
+        Update the idle and queued call counts after this thread completes a call or
+        times out waiting for one. Returns `True` if the thread should exit.
+
+        All changes to the counts made by the threads are made here, under the lock,
+        so they cannot interleave with a submission.
+        """
+        with self._lock:
+            if completed:
+                self._completed_count += 1
+                if self._depth:
+                    # Take a queued call
+                    self._depth -= 1
+                else:
+                    self._idle += 1
+                return False
+
+            # Only exit if another thread has not claimed this one
+            if self._idle and len(self._threads) > self.min_size:
+                self._idle -= 1
+                self._threads.discard(threading.current_thread())
+                return True
+            return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.shutdown()
+
+
 class EventLoopThread(Portal):
     """
     A portal to a worker running on a thread with an event loop.
@@ -165,15 +370,60 @@ class EventLoopThread(Portal):
             # Track the portal running the call
             call.set_runner(self)
 
-            # Submit the call to the event loop
-            asyncio.run_coroutine_threadsafe(self._run_call(call), self._loop)
+            # Submit the call to the event loop; async calls schedule their own task
+            # so the call does not need to be wrapped in another one
+            self._loop.call_soon_threadsafe(call.run)
 
             self._submitted_count += 1
-            if self._run_once:
-                call.future.add_done_callback(lambda _: self.shutdown())
+
+        # The call may already be done, in which case the callback runs immediately and
+        # must not be added while holding the lock
+        if self._run_once:
+            call.future.add_done_callback(lambda _: self.shutdown())
 
         return call
 
+    def submit_many(
+        self, calls: Iterable[Call], max_concurrency: Optional[int] = None
+    ) -> List[Call]:
+        """
+        Submit many calls to the event loop at once.
+
+        The calls are handed to the loop together and started in order. If
+        `max_concurrency` is set, at most that many of the calls run at a time.
+
+        Returns the submitted calls.
+        """
+        calls = list(calls)
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be at least 1.")
+
+        if self._loop is None:
+            self.start()
+
+        with self._lock:
+            if self._run_once:
+                raise RuntimeError(
+                    "Worker configured to only run once. Calls cannot be submitted in"
+                    " bulk."
+                )
+
+            if self._shutdown_event.is_set():
+                raise RuntimeError("Worker is shutdown.")
+
+            # Track the portal running the calls
+            for call in calls:
+                call.set_runner(self)
+
+            # Submit the calls to the event loop with a single handoff
+            asyncio.run_coroutine_threadsafe(
+                self._run_calls(calls, max_concurrency), self._loop
+            )
+
+            self._submitted_count += len(calls)
+
+        return calls
+
     def shutdown(self) -> None:
         """
         Shutdown the worker thread. Does not wait for the thread to stop.
@@ -222,6 +472,24 @@ class EventLoopThread(Portal):
         if task is not None:
             await task
 
+    async def _run_calls(self, calls: List[Call], max_concurrency: Optional[int]):
+        if max_concurrency is None:
+            tasks = [task for task in map(Call.run, calls) if task is not None]
+            if tasks:
+                await asyncio.wait(tasks)
+            return
+
+        # Each runner takes the next call once its previous call is done
+        pending = iter(calls)
+
+        async def run_pending():
+            for call in pending:
+                await self._run_call(call)
+
+        await asyncio.gather(
+            *(run_pending() for _ in range(min(max_concurrency, len(calls))))
+        )
+
     def add_shutdown_call(self, call: Call) -> None:
         self._on_shutdown.append(call)
 
@@ -256,6 +524,114 @@ def get_global_loop() -> EventLoopThread:
     return GLOBAL_LOOP
 
 
+class EventLoopThreadPool:
+    """
+    A pool of dedicated event loop threads.
+
+    Threads are started when they are first requested and replaced if they have
+    exited or been shut down.
+    """
+
+    def __init__(self, name: str = "EventLoopThreadPool", daemon: bool = True):
+        self.name = name
+        self._daemon = daemon
+        self._threads: List[Optional[EventLoopThread]] = []
+        self._lock = threading.Lock()
+
+    def get(self, index: int) -> EventLoopThread:
+        """
+        Get the loop thread at the given index, starting it if needed.
+        """
+        with self._lock:
+            if index >= len(self._threads):
+                self._threads.extend([None] * (index + 1 - len(self._threads)))
+
+            loop_thread = self._threads[index]
+            if (
+                loop_thread is None
+                or not loop_thread.thread.is_alive()
+                or loop_thread._shutdown_event.is_set()
+            ):
+                loop_thread = EventLoopThread(
+                    daemon=self._daemon, name=f"{self.name}-{index}"
+                )
+                loop_thread.start()
+                self._threads[index] = loop_thread
+
+            return loop_thread
+
+    def threads(self) -> List[EventLoopThread]:
+        """
+        The loop threads that have been started.
+        """
+        with self._lock:
+            return [thread for thread in self._threads if thread is not None]
+
+    def shutdown(self) -> None:
+        """
+        Shutdown all of the loop threads. Does not wait for the threads to stop.
+        """
+        for loop_thread in self.threads():
+            loop_thread.shutdown()
+
+    def wait_for_exit(self, timeout: Optional[float] = None) -> None:
+        """
+        Shutdown all of the loop threads and wait for them to exit.
+
+        The timeout applies to each thread.
+        """
+        loop_threads = self.threads()
+        if any(
+            threading.get_ident() == loop_thread.thread.ident
+            for loop_thread in loop_threads
+        ):
+            raise RuntimeError("Cannot wait for the loop thread from inside itself.")
+
+        self.shutdown()
+        for loop_thread in loop_threads:
+            loop_thread.thread.join(timeout)
+
+
+LOOP_THREAD_POOL = EventLoopThreadPool(name="ServiceEventLoopThread")
+"""
+A pool of loop threads that services can run on instead of the global loop.
+"""
+
+
+def get_loop_thread_pool() -> EventLoopThreadPool:
+    """
+    Get the pool of dedicated loop threads for services.
+    """
+    return LOOP_THREAD_POOL
+
+
+WORKER_POOL: Optional[WorkerThreadPool] = None
+_WORKER_POOL_LOCK = threading.Lock()
+
+
+def get_worker_pool() -> WorkerThreadPool:
+    """
+    Get the global pool of worker threads.
+
+    Creates a new one if there is not one available.
+    """
+    global WORKER_POOL
+
+    with _WORKER_POOL_LOCK:
+        if WORKER_POOL is None or WORKER_POOL._shutdown:
+            WORKER_POOL = WorkerThreadPool(name="GlobalWorkerThread")
+
+        return WORKER_POOL
+
+
+def wait_for_worker_pool_exit(timeout: Optional[float] = None) -> None:
+    """
+    Shutdown the global pool of worker threads and wait for its threads to exit.
+    """
+    if WORKER_POOL is not None:
+        WORKER_POOL.wait_for_exit(timeout)
+
+
 def in_global_loop() -> bool:
     """
     Check if called from the global loop.
@@ -7,25 +7,21 @@ import abc
 import asyncio
 import contextlib
 import inspect
-import queue
 import threading
-import weakref
 from collections import deque
-from typing import Awaitable, Generic, List, Optional, TypeVar, Union
+from typing import Awaitable, Deque, Dict, Generic, List, Optional, TypeVar, Union
 
 import anyio
 from prefect._internal.concurrency import logger
 from prefect._internal.concurrency.calls import Call, Portal
-from prefect._internal.concurrency.event_loop import call_soon_in_loop
-from prefect._internal.concurrency.primitives import Event
 
 T = TypeVar("T")
 
 
-# Waiters are stored in a stack for each thread
-_WAITERS_BY_THREAD: "weakref.WeakKeyDictionary[threading.Thread, deque[Waiter]]" = (
-    weakref.WeakKeyDictionary()
-)
+# Waiters are stored in a stack for each thread that is waiting. Only the owner thread
+# changes its stack, and removes it once its last waiter is closed, so threads are not
+# kept alive by the registry.
+_WAITERS_BY_THREAD: Dict[threading.Thread, List["Waiter"]] = {}
 
 
 def get_waiter_for_thread(thread: threading.Thread) -> Optional["Waiter"]:
@@ -45,7 +41,7 @@ def get_waiter_for_thread(thread: threading.Thread) -> Optional["Waiter"]:
                     return waiter
                 idx = idx - 1
             # It is possible that items are being added or removed
-            # from the deque, so the index we're using may not always
+            # from the stack, so the index we're using may not always
             # be valid.
             except IndexError:
                 break
@@ -57,10 +53,22 @@ def add_waiter_for_thread(waiter: "Waiter", thread: threading.Thread):
     """
     Add a waiter for a thread.
     """
-    if thread not in _WAITERS_BY_THREAD:
-        _WAITERS_BY_THREAD[thread] = deque()
+    waiters = _WAITERS_BY_THREAD.get(thread)
+    if waiters is None:
+        _WAITERS_BY_THREAD[thread] = [waiter]
+    else:
+        waiters.append(waiter)
 
-    _WAITERS_BY_THREAD[thread].append(waiter)
+
+def remove_waiter_for_thread(waiter: "Waiter", thread: threading.Thread):
+    """
+    Remove a waiter for a thread.
+    """
+    waiters = _WAITERS_BY_THREAD[thread]
+    if len(waiters) == 1:
+        del _WAITERS_BY_THREAD[thread]
+    else:
+        waiters.remove(waiter)
 
 
 class Waiter(Portal, abc.ABC, Generic[T]):
@@ -80,11 +88,23 @@ class Waiter(Portal, abc.ABC, Generic[T]):
 
         # Set the waiter for the current thread
         add_waiter_for_thread(self, self._owner_thread)
+        self._registered = True
         super().__init__()
 
     def call_is_done(self) -> bool:
         return self._call.future.done()
 
+    def close(self) -> None:
+        """
+        Remove the waiter from its thread, so callbacks can no longer be sent to it.
+
+        Waiters are closed when they are done waiting. Close a waiter explicitly if
+        waiting may not be reached, e.g. when submitting its call fails.
+        """
+        if self._registered:
+            self._registered = False
+            remove_waiter_for_thread(self, self._owner_thread)
+
     @abc.abstractmethod
     def wait(self) -> Union[Awaitable[None], None]:
         """
@@ -112,12 +132,16 @@ class Waiter(Portal, abc.ABC, Generic[T]):
 
 class SyncWaiter(Waiter[T]):
     # Implementation of `Waiter` for use in synchronous contexts
+    #
+    # Most calls never send work back to the waiting thread, so the waiter only parks
+    # on a private lock until the call is done or a callback is submitted; callbacks
+    # are drained from a deque when the waiter wakes.
 
     def __init__(self, call: Call[T]) -> None:
         super().__init__(call=call)
-        self._queue: queue.Queue = queue.Queue()
+        self._callbacks: Deque[Call] = deque()
         self._done_callbacks = []
-        self._done_event = threading.Event()
+        self._parked: Optional[threading.Lock] = None
 
     def submit(self, call: Call):
         """
@@ -126,22 +150,35 @@ class SyncWaiter(Waiter[T]):
         if self.call_is_done():
             raise RuntimeError(f"The call {self._call} is already done.")
 
-        self._queue.put_nowait(call)
         call.set_runner(self)
+        self._callbacks.append(call)
+        self._unpark()
         return call
 
+    def _unpark(self):
+        parked = self._parked
+        if parked is not None:
+            try:
+                parked.release()
+            except RuntimeError:
+                pass  # The waiter has already been woken
+
     def _handle_waiting_callbacks(self):
         logger.debug("Waiter %r watching for callbacks", self)
         while True:
-            callback: Call = self._queue.get()
-            if callback is None:
+            while self._callbacks:
+                callback: Call = self._callbacks.popleft()
+
+                # Ensure that callbacks are cancelled if the parent call is cancelled
+                # so waiting never runs longer than the call
+                self._call.future.add_cancel_callback(callback.future.cancel)
+                callback.run()
+                del callback
+
+            if self.call_is_done() and not self._callbacks:
                 break
 
-            # Ensure that callbacks are cancelled if the parent call is cancelled so
-            # waiting never runs longer than the call
-            self._call.future.add_cancel_callback(callback.future.cancel)
-            callback.run()
-            del callback
+            self._parked.acquire()
 
     @contextlib.contextmanager
     def _handle_done_callbacks(self):
@@ -155,38 +192,42 @@ class SyncWaiter(Waiter[T]):
                     callback.run()
 
     def add_done_callback(self, callback: Call):
-        if self._done_event.is_set():
+        if self.call_is_done():
             raise RuntimeError("Cannot add done callbacks to done waiters.")
         else:
             self._done_callbacks.append(callback)
 
     def wait(self) -> T:
-        # Stop watching for work once the future is done
-        self._call.future.add_done_callback(lambda _: self._queue.put_nowait(None))
-        self._call.future.add_done_callback(lambda _: self._done_event.set())
-
-        with self._handle_done_callbacks():
-            self._handle_waiting_callbacks()
+        # The lock is held until the call is done or a callback is submitted
+        self._parked = threading.Lock()
+        self._parked.acquire()
 
-            # Wait for the future to be done
-            self._done_event.wait()
+        # Stop watching for work once the future is done
+        self._call.future.add_done_callback(lambda _: self._unpark())
 
-        _WAITERS_BY_THREAD[self._owner_thread].remove(self)
+        try:
+            with self._handle_done_callbacks():
+                self._handle_waiting_callbacks()
+        finally:
+            self.close()
         return self._call
 
 
 class AsyncWaiter(Waiter[T]):
     # Implementation of `Waiter` for use in asynchronous contexts
+    #
+    # Like `SyncWaiter`, the waiter only awaits a wakeup future until the call is done
+    # or a callback is submitted. Callbacks submitted before the waiter has an event
+    # loop are held in the deque until it starts waiting.
 
     def __init__(self, call: Call[T]) -> None:
         super().__init__(call=call)
 
-        # Delay instantiating loop and queue as there may not be a loop present yet
+        # Delay retrieving the loop as there may not be a loop present yet
         self._loop: Optional[asyncio.AbstractEventLoop] = None
-        self._queue: Optional[asyncio.Queue] = None
-        self._early_submissions: List[Call] = []
+        self._wakeup: Optional[asyncio.Future] = None
+        self._callbacks: Deque[Call] = deque()
         self._done_callbacks = []
-        self._done_event = Event()
         self._done_waiting = False
 
     def submit(self, call: Call):
@@ -197,22 +238,22 @@ class AsyncWaiter(Waiter[T]):
             raise RuntimeError(f"The call {self._call} is already done.")
 
         call.set_runner(self)
-
-        if not self._queue:
-            # If the loop is not yet available, just push the call to a stack
-            self._early_submissions.append(call)
-            return call
-
-        # We must put items in the queue from the event loop that owns it
-        call_soon_in_loop(self._loop, self._queue.put_nowait, call)
+        self._callbacks.append(call)
+        self._unpark()
         return call
 
-    def _resubmit_early_submissions(self):
-        assert self._queue
-        for call in self._early_submissions:
-            # We must put items in the queue from the event loop that owns it
-            call_soon_in_loop(self._loop, self._queue.put_nowait, call)
-        self._early_submissions = []
+    def _unpark(self):
+        # Only wake the waiter if it is still waiting. Otherwise, it's possible that
+        # the event loop is stopped.
+        if self._loop is not None and not self._done_waiting:
+            try:
+                self._loop.call_soon_threadsafe(self._set_wakeup)
+            except RuntimeError:
+                pass  # The event loop is closed
+
+    def _set_wakeup(self):
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
 
     async def _handle_waiting_callbacks(self):
         logger.debug("Waiter %r watching for callbacks", self)
@@ -220,24 +261,33 @@ class AsyncWaiter(Waiter[T]):
 
         try:
             while True:
-                callback: Call = await self._queue.get()
-                if callback is None:
-                    break
+                # Create the wakeup before draining so submissions that arrive after
+                # the deque is empty are not missed
+                self._wakeup = self._loop.create_future()
 
-                # Ensure that callbacks are cancelled if the parent call is cancelled so
-                # waiting never runs longer than the call
-                self._call.future.add_cancel_callback(callback.future.cancel)
-                retval = callback.run()
-                if inspect.isawaitable(retval):
-                    tasks.append(retval)
+                while self._callbacks:
+                    callback: Call = self._callbacks.popleft()
 
-                del callback
+                    # Ensure that callbacks are cancelled if the parent call is
+                    # cancelled so waiting never runs longer than the call
+                    self._call.future.add_cancel_callback(callback.future.cancel)
+                    retval = callback.run()
+                    if inspect.isawaitable(retval):
+                        tasks.append(retval)
+
+                    del callback
+
+                if self.call_is_done() and not self._callbacks:
+                    break
+
+                await self._wakeup
 
             # Tasks are collected and awaited as a group; if each task was awaited in
             # the above loop, async work would not be executed concurrently
             await asyncio.gather(*tasks)
         finally:
             self._done_waiting = True
+            self._wakeup = None
 
     @contextlib.asynccontextmanager
     async def _handle_done_callbacks(self):
@@ -258,32 +308,21 @@ class AsyncWaiter(Waiter[T]):
             await coro
 
     def add_done_callback(self, callback: Call):
-        if self._done_event.is_set():
+        if self.call_is_done():
             raise RuntimeError("Cannot add done callbacks to done waiters.")
         else:
             self._done_callbacks.append(callback)
 
-    def _signal_stop_waiting(self):
-        # Only send a `None` to the queue if the waiter is still blocked reading from
-        # the queue. Otherwise, it's possible that the event loop is stopped.
-        if not self._done_waiting:
-            call_soon_in_loop(self._loop, self._queue.put_nowait, None)
-
     async def wait(self) -> Call[T]:
         # Assign the loop
         self._loop = asyncio.get_running_loop()
-        self._queue = asyncio.Queue()
-        self._resubmit_early_submissions()
 
         # Stop watching for work once the future is done
-        self._call.future.add_done_callback(lambda _: self._signal_stop_waiting())
-        self._call.future.add_done_callback(lambda _: self._done_event.set())
+        self._call.future.add_done_callback(lambda _: self._unpark())
 
-        async with self._handle_done_callbacks():
-            await self._handle_waiting_callbacks()
-
-            # Wait for the future to be done
-            await self._done_event.wait()
-
-        _WAITERS_BY_THREAD[self._owner_thread].remove(self)
+        try:
+            async with self._handle_done_callbacks():
+                await self._handle_waiting_callbacks()
+        finally:
+            self.close()
         return self._call
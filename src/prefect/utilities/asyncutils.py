@@ -216,6 +216,11 @@ def sync_compatible(async_fn: T) -> T:
         will submit the async method to the event loop.
     - If we cannot find an event loop, we will create a new one and run the async method
         then tear down the loop.
+
+    Async generator functions are supported as well. In an async context, the async
+    generator is returned. Otherwise, the generator is run in the global event loop
+    thread and an iterator over its items is returned; items are produced as they are
+    consumed and ending iteration early closes the generator.
     """
 
     @wraps(async_fn)
@@ -257,12 +262,45 @@ def sync_compatible(async_fn: T) -> T:
             call = create_call(async_fn, *args, **kwargs)
             return call()
 
+    @wraps(async_fn)
+    def async_generator_wrapper(*args, **kwargs):
+        from prefect._internal.concurrency.api import create_call, from_sync
+        from prefect._internal.concurrency.calls import get_current_call, logger
+        from prefect._internal.concurrency.threads import get_global_loop
+
+        global_thread_portal = get_global_loop()
+        current_thread = threading.current_thread()
+        current_call = get_current_call()
+
+        if current_thread.ident == global_thread_portal.thread.ident:
+            logger.debug(
+                f"{async_fn} --> return async generator for internal iteration"
+            )
+            return async_fn(*args, **kwargs)
+        elif in_async_main_thread() and (
+            not current_call or is_async_fn(current_call.fn)
+        ):
+            logger.debug(f"{async_fn} --> return async generator for user iteration")
+            return async_fn(*args, **kwargs)
+        else:
+            logger.debug(
+                f"{async_fn} --> iterate async generator in global loop portal"
+            )
+            # In a sync context; pull the items from Prefect's event loop thread
+            return from_sync.iter_in_loop_thread(create_call(async_fn, *args, **kwargs))
+
     # TODO: This is breaking type hints on the callable... mypy is behind the curve
     #       on argument annotations. We can still fix this for editors though.
     if is_async_fn(async_fn):
         wrapper = coroutine_wrapper
+    elif inspect.isasyncgenfunction(async_fn):
+        wrapper = async_generator_wrapper
     elif is_async_gen_fn(async_fn):
-        raise ValueError("Async generators cannot yet be marked as `sync_compatible`")
+        # e.g. an async context manager, which does not return an async iterator
+        raise ValueError(
+            "Functions wrapping async generators cannot yet be marked as"
+            " `sync_compatible`"
+        )
     else:
         raise TypeError("The decorated function must be async.")
 
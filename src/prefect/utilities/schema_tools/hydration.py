@@ -1,7 +1,12 @@
+import copy
 import json
-from typing import Any, Callable, Dict, Optional
+import marshal
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
-from pydantic import BaseModel, Field
+import orjson
+from cachetools import LRUCache
+from pydantic import BaseModel, Field, PrivateAttr
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import TypeAlias
 
@@ -10,6 +15,10 @@ class HydrationContext(BaseModel):
     workspace_variables: Dict[str, str] = Field(default_factory=dict)
     raise_on_error: bool = Field(default=False)
 
+    # Parsed `json` values keyed by their source string; only set when hydrating a
+    # batch of payloads with `hydrate_many`
+    _parsed_json: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
     @classmethod
     async def build(
         cls,
@@ -29,9 +38,20 @@ class HydrationContext(BaseModel):
 
 Handler: TypeAlias = Callable[[Dict, HydrationContext], Any]
 PrefectKind: TypeAlias = Optional[str]
+JSONParser: TypeAlias = Callable[[str], Any]
 
 _handlers: Dict[PrefectKind, Handler] = {}
 
+# Values shorter than this are cheaper to parse than to look up in the cache
+JSON_CACHE_MIN_LENGTH = 1024
+# The cache is bounded by the total length of the cached source strings
+JSON_CACHE_MAX_SIZE = 32 * 1024 * 1024
+
+_json_cache: LRUCache = LRUCache(
+    maxsize=JSON_CACHE_MAX_SIZE, getsizeof=lambda parsed: parsed.size
+)
+_json_cache_lock = threading.Lock()
+
 
 class Placeholder:
     def __eq__(self, other):
@@ -145,10 +165,15 @@ def json_handler(obj: Dict, ctx: HydrationContext):
             dehydrated_json = _hydrate(obj["value"], ctx)
         else:
             dehydrated_json = obj["value"]
-        try:
-            return json.loads(dehydrated_json)
-        except (json.decoder.JSONDecodeError, TypeError) as e:
-            return InvalidJSON(detail=str(e))
+
+        parsed_json = ctx._parsed_json
+        if parsed_json is None or not isinstance(dehydrated_json, str):
+            return _parse_json(dehydrated_json)
+
+        if dehydrated_json not in parsed_json:
+            parsed_json[dehydrated_json] = _get_parsed_json(dehydrated_json)
+
+        return parsed_json[dehydrated_json].get()
     else:
         # If `value` is not in the object, we need special handling to help
         # the UI. For now if an object looks like {"__prefect_kind": "json"}
@@ -159,6 +184,106 @@ def json_handler(obj: Dict, ctx: HydrationContext):
         return RemoveValue()
 
 
+def _loads(value) -> Any:
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        # `orjson` rejects some input the standard library accepts, such as `NaN` and
+        # integers wider than 64 bits. Defer to `json` for those, which also keeps its
+        # error messages for invalid input.
+        return json.loads(value)
+
+
+_json_parser: JSONParser = _loads
+
+
+def set_json_parser(parser: Optional[JSONParser] = None) -> None:
+    """
+    Set the parser used for `json` values. Resets to the default `orjson` based
+    parser if `None`.
+
+    Parsers should raise a `ValueError` or `TypeError` on invalid input.
+    """
+    global _json_parser
+
+    _json_parser = parser or _loads
+    with _json_cache_lock:
+        _json_cache.clear()
+
+
+def _parse_json(value) -> Any:
+    if isinstance(value, str) and len(value) >= JSON_CACHE_MIN_LENGTH:
+        return _get_parsed_json(value).get()
+
+    return _parse_json_uncached(value)
+
+
+def _parse_json_uncached(value) -> Any:
+    try:
+        return _json_parser(value)
+    except (ValueError, TypeError) as e:
+        return InvalidJSON(detail=str(e))
+
+
+def _get_parsed_json(value: str) -> "_ParsedJSON":
+    """
+    Parse a `json` value, using the shared cache for long values.
+    """
+    if len(value) < JSON_CACHE_MIN_LENGTH:
+        return _ParsedJSON(value)
+
+    with _json_cache_lock:
+        parsed = _json_cache.get(value)
+
+    if parsed is None:
+        parsed = _ParsedJSON(value)
+        with _json_cache_lock:
+            try:
+                _json_cache[value] = parsed
+            except ValueError:
+                # The value is larger than the entire cache
+                pass
+
+    return parsed
+
+
+class _ParsedJSON:
+    """
+    The result of parsing a `json` value.
+
+    Each read returns a new copy of the result so that parsed values can be shared
+    without callers seeing each other's mutations. Containers are kept as a `marshal`
+    snapshot, which is faster to load than the source is to parse.
+    """
+
+    __slots__ = ("size", "_value", "_snapshot", "_deepcopy")
+
+    def __init__(self, source: str) -> None:
+        self.size = len(source)
+        self._value = _parse_json_uncached(source)
+        self._snapshot = None
+        self._deepcopy = False
+
+        if isinstance(self._value, (dict, list)):
+            try:
+                self._snapshot = marshal.dumps(self._value)
+                self._value = None
+            except ValueError:
+                # Custom parsers may produce types `marshal` does not support
+                self._deepcopy = True
+
+    def get(self) -> Any:
+        if self._snapshot is not None:
+            return marshal.loads(self._snapshot)
+        elif isinstance(self._value, HydrationError):
+            # Errors may be raised, which mutates them, so they are not shared either
+            return type(self._value)(detail=self._value.detail)
+        elif self._deepcopy:
+            return copy.deepcopy(self._value)
+        else:
+            return self._value
+
+
 @handler("workspace_variable")
 def workspace_variable_handler(obj: Dict, ctx: HydrationContext):
     if "variable_name" in obj:
@@ -192,6 +317,92 @@ def hydrate(obj: Dict, ctx: Optional[HydrationContext] = None):
     return res
 
 
+def hydrate_many(
+    objs: Iterable[Dict], ctx: Optional[HydrationContext] = None
+) -> List[Tuple[Any, Optional[HydrationError]]]:
+    """
+    Hydrate many payloads with a single shared context.
+
+    The `json` values referenced across all payloads are collected up front and each
+    distinct value is parsed once, no matter how many payloads contain it. Workspace
+    variables are resolved from the shared context.
+
+    Returns a `(result, error)` pair for each payload in input order. If hydration of
+    a payload fails, its result is `None` and its error is the `HydrationError`
+    raised (when `ctx.raise_on_error` is set) or the first one found in the hydrated
+    payload.
+    """
+    ctx = ctx or HydrationContext()
+    objs = list(objs)
+
+    json_values: Set[str] = set()
+    for obj in objs:
+        _collect_json_values(obj, json_values)
+
+    batch_ctx = ctx.model_copy()
+    batch_ctx._parsed_json = {value: _get_parsed_json(value) for value in json_values}
+
+    results = []
+    for obj in objs:
+        try:
+            result = hydrate(obj, batch_ctx)
+        except HydrationError as exc:
+            results.append((None, exc))
+        else:
+            error = _find_error(result)
+            if error is not None:
+                results.append((None, error))
+            else:
+                results.append((result, None))
+
+    return results
+
+
+def _find_error(obj) -> Optional[HydrationError]:
+    """
+    Find the first `HydrationError` placeholder in a hydrated value.
+    """
+    if isinstance(obj, HydrationError):
+        return obj
+    elif isinstance(obj, dict):
+        values = obj.values()
+    elif isinstance(obj, list):
+        values = obj
+    else:
+        return None
+
+    for value in values:
+        error = _find_error(value)
+        if error is not None:
+            return error
+    return None
+
+
+def _collect_json_values(obj, json_values: Set[str]) -> None:
+    """
+    Collect the static `json` values that hydrating `obj` would parse.
+
+    Values built from nested prefect objects are only known during hydration; they
+    are parsed on first use instead.
+    """
+    if isinstance(obj, dict):
+        if "__prefect_kind" not in obj:
+            for value in obj.values():
+                _collect_json_values(value, json_values)
+            return
+
+        prefect_kind = obj["__prefect_kind"]
+        if prefect_kind == "json" and isinstance(obj.get("value"), str):
+            json_values.add(obj["value"])
+        elif prefect_kind in ("none", "json"):
+            _collect_json_values(obj.get("value"), json_values)
+        elif prefect_kind == "workspace_variable":
+            _collect_json_values(obj.get("variable_name"), json_values)
+    elif isinstance(obj, list):
+        for element in obj:
+            _collect_json_values(element, json_values)
+
+
 def _hydrate(obj, ctx: Optional[HydrationContext] = None):
     if ctx is None:
         ctx = HydrationContext()
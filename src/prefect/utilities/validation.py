@@ -1,5 +1,65 @@
+import copy
+import dataclasses
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import unquote
+
+import jsonpatch
+import jsonpointer
 import jsonschema
+import orjson
+from cachetools import LRUCache
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from prefect.utilities.collections import remove_nested_keys
+from prefect.utilities.hashing import stable_hash
+
+# The maximum number of compiled validators to keep
+VALIDATOR_CACHE_MAX_SIZE = 256
+
+_validators: LRUCache = LRUCache(maxsize=VALIDATOR_CACHE_MAX_SIZE)
+_validators_lock = threading.Lock()
+
+# Keywords that constrain a value by looking at its children together; a change to one
+# child cannot be checked against the schema for that child alone
+_NON_LOCAL_KEYWORDS = frozenset(
+    {
+        "allOf",
+        "anyOf",
+        "oneOf",
+        "not",
+        "if",
+        "then",
+        "else",
+        "dependencies",
+        "dependentRequired",
+        "dependentSchemas",
+        "const",
+        "enum",
+        "uniqueItems",
+        "contains",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+        "$dynamicRef",
+        "$recursiveRef",
+        "$id",
+    }
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class ValidationErrorDetail:
+    """
+    A single failure of some values to conform to a schema.
+    """
+
+    path: str
+    """The JSON path of the failing field, e.g. `$.name`; `$` for the values."""
+
+    message: str
+    """The reason for the failure."""
 
 
 def validate_schema(schema: dict):
@@ -40,23 +100,408 @@ def validate_values_conform_to_schema(
         ValueError: If the parameters do not conform to the schema.
 
     """
-    if ignore_required:
-        schema = remove_nested_keys(["required"], schema)
+    if schema is None or values is None:
+        return
 
     try:
-        if schema is not None and values is not None:
-            jsonschema.validate(values, schema)
+        validator = get_validator(schema, ignore_required=ignore_required)
+        error = best_match(validator.iter_errors(values))
+        if error is not None:
+            raise error
     except jsonschema.ValidationError as exc:
-        if exc.json_path == "$":
-            error_message = "Validation failed."
+        raise ValueError(_get_validation_error_message(exc)) from exc
+    except jsonschema.SchemaError as exc:
+        raise ValueError(
+            "The provided schema is not a valid json schema. Schema error:"
+            f" {exc.message}"
+        ) from exc
+
+
+def validate_patched_values_conform_to_schema(
+    values: dict,
+    patch: Union[jsonpatch.JsonPatch, Sequence[dict]],
+    schema: dict,
+    ignore_required: bool = False,
+) -> dict:
+    """
+    Apply a JSON patch to values that already conform to the provided json schema and
+    validate that the result still conforms.
+
+    Only the parts of the values changed by the patch are validated, against the
+    matching parts of the schema. If the schema checks a changed part together with
+    its siblings, e.g. with `oneOf` or `dependencies`, all of the values are validated
+    instead.
+
+    Args:
+        values: The values to patch, which must conform to the schema.
+        patch: The JSON patch to apply.
+        schema: The schema to validate against.
+        ignore_required: Whether to ignore the required fields in the schema. Should be
+            used when a partial set of values is acceptable.
+
+    Returns:
+        The patched values. The provided values are not modified.
+
+    Raises:
+        ValueError: If the patch cannot be applied or the patched values do not
+            conform to the schema.
+
+    """
+    try:
+        if not isinstance(patch, jsonpatch.JsonPatch):
+            patch = jsonpatch.JsonPatch(patch)
+        patched = patch.apply(values)
+    except (jsonpatch.JsonPatchException, jsonpointer.JsonPointerException) as exc:
+        raise ValueError(f"The provided patch could not be applied: {exc}") from exc
+
+    if schema is None or patched is None:
+        return patched
+
+    try:
+        validator = get_validator(schema, ignore_required=ignore_required)
+        errors = _iter_patch_errors(validator, patched, patch)
+        if errors is None:
+            errors = validator.iter_errors(patched)
+        error = best_match(errors)
+        if error is not None:
+            raise error
+    except jsonschema.ValidationError as exc:
+        raise ValueError(_get_validation_error_message(exc)) from exc
+    except jsonschema.SchemaError as exc:
+        raise ValueError(
+            "The provided schema is not a valid json schema. Schema error:"
+            f" {exc.message}"
+        ) from exc
+
+    return patched
+
+
+def _get_validation_error_message(exc: jsonschema.ValidationError) -> str:
+    if exc.json_path == "$":
+        error_message = "Validation failed."
+    else:
+        error_message = (
+            f"Validation failed for field {exc.json_path.replace('$.', '')!r}."
+        )
+    return error_message + f" Failure reason: {exc.message}"
+
+
+def _iter_patch_errors(
+    validator, document: Any, patch: jsonpatch.JsonPatch
+) -> Optional[Iterator[jsonschema.ValidationError]]:
+    """
+    Get the errors for the parts of a patched document changed by the patch.
+
+    Returns `None` if the changes cannot be validated without the rest of the
+    document.
+    """
+    targets = []
+    for parts in _get_patched_paths(patch):
+        if not parts:
+            return None
+
+        target = _get_patch_target(validator, document, parts)
+        if target is None:
+            return None
+        targets.append(target)
+
+    def iter_errors():
+        for value, schema, path in targets:
+            for error in validator.descend(value, schema):
+                error.path.extendleft(reversed(path))
+                yield error
+
+    return iter_errors()
+
+
+def _get_patched_paths(patch: jsonpatch.JsonPatch) -> List[Tuple[str, ...]]:
+    """
+    Get the paths of the smallest parts of a document that contain all of the changes
+    made by a patch.
+    """
+    paths = set()
+    for operation in patch.patch:
+        op = operation["op"]
+        parts = tuple(jsonpointer.JsonPointer(operation["path"]).parts)
+
+        if op == "replace":
+            paths.add(parts)
+        elif op in ("add", "remove", "copy"):
+            # Keys or items are added or removed, so the container changes
+            paths.add(parts[:-1])
+        elif op == "move":
+            paths.add(tuple(jsonpointer.JsonPointer(operation["from"]).parts)[:-1])
+            paths.add(parts[:-1])
+
+    # Changes inside of another change are validated with it
+    result = []
+    for parts in sorted(paths, key=len):
+        if not any(parts[: len(ancestor)] == ancestor for ancestor in result):
+            result.append(parts)
+    return result
+
+
+def _get_patch_target(
+    validator, document: Any, parts: Tuple[str, ...]
+) -> Optional[Tuple[Any, Any, List[Union[str, int]]]]:
+    """
+    Find the value at a path in a document and the schema for it.
+
+    Returns `None` if the value cannot be validated without the rest of the document.
+    """
+    value, schema, path = document, validator.schema, []
+
+    for part in parts:
+        schema = _resolve_local_schema(validator, schema)
+        if schema is None or (
+            isinstance(schema, dict) and _NON_LOCAL_KEYWORDS.intersection(schema)
+        ):
+            return None
+
+        if isinstance(value, dict) and part in value:
+            key = part
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            key = int(part)
+        else:
+            return None
+
+        schema = _get_child_schema(schema, key)
+        if schema is None:
+            return None
+
+        value = value[key]
+        path.append(key)
+
+    return value, schema, path
+
+
+def _resolve_local_schema(validator, schema: Any) -> Any:
+    """
+    Follow local `$ref`s and single schema `allOf`s to the schema they wrap.
+
+    Returns `None` if the schema cannot be resolved or applies other keywords
+    alongside the wrapped schema.
+    """
+    # Guard against reference cycles
+    for _ in range(32):
+        if not isinstance(schema, dict):
+            return schema
+
+        if "$ref" in schema:
+            keyword = "$ref"
+        elif "allOf" in schema and len(schema["allOf"]) == 1:
+            keyword = "allOf"
         else:
-            error_message = (
-                f"Validation failed for field {exc.json_path.replace('$.', '')!r}."
-            )
-        error_message += f" Failure reason: {exc.message}"
-        raise ValueError(error_message) from exc
+            return schema
+
+        if any(key != keyword and key in validator.VALIDATORS for key in schema.keys()):
+            return None
+
+        if keyword == "allOf":
+            schema = schema["allOf"][0]
+        elif schema["$ref"].startswith("#"):
+            try:
+                schema = jsonpointer.resolve_pointer(
+                    validator.schema, unquote(schema["$ref"][1:])
+                )
+            except jsonpointer.JsonPointerException:
+                return None
+        else:
+            return None
+
+    return None
+
+
+def _get_child_schema(schema: Any, key: Union[str, int]) -> Any:
+    """
+    Get the schema for an object property or array item.
+
+    Returns `None` if more than one schema may apply.
+    """
+    if schema is True or schema is False:
+        # Boolean schemas apply to all children; a false schema rejects all children
+        return schema
+    elif not isinstance(schema, dict):
+        return None
+
+    if isinstance(key, int):
+        prefix_items = schema.get("prefixItems")
+        if prefix_items is not None:
+            if key < len(prefix_items):
+                return prefix_items[key]
+            return schema.get("items", True)
+
+        items = schema.get("items", True)
+        if isinstance(items, list):
+            if key < len(items):
+                return items[key]
+            return schema.get("additionalItems", True)
+        return items
+
+    if any(re.search(pattern, key) for pattern in schema.get("patternProperties", {})):
+        return None
+
+    properties = schema.get("properties", {})
+    if key in properties:
+        return properties[key]
+    return schema.get("additionalProperties", True)
+
+
+def validate_many(
+    values_list: Iterable[dict],
+    schema: dict,
+    ignore_required: bool = False,
+    max_workers: Optional[int] = None,
+    fail_fast: bool = False,
+) -> List[List[ValidationErrorDetail]]:
+    """
+    Validate that each of the provided values conform to the provided json schema.
+
+    Unlike `validate_values_conform_to_schema`, all errors are collected for each set
+    of values instead of raising on the first.
+
+    Args:
+        values_list: The sets of values to validate.
+        schema: The schema to validate against.
+        ignore_required: Whether to ignore the required fields in the schema. Should be
+            used when a partial set of values is acceptable.
+        max_workers: If greater than one, validate on a pool of this many threads.
+        fail_fast: Whether to stop at the first set of values that does not conform.
+            If set, no results are returned for the values after it.
+
+    Returns:
+        A list of errors for each set of values, in input order. Values that conform
+        to the schema have an empty list.
+
+    Raises:
+        ValueError: If the provided schema is not a valid json schema.
+
+    """
+    values_list = list(values_list)
+
+    if schema is None:
+        return [[] for _ in values_list]
+
+    try:
+        validator = _get_cached_validator(schema, ignore_required=ignore_required)
     except jsonschema.SchemaError as exc:
         raise ValueError(
             "The provided schema is not a valid json schema. Schema error:"
             f" {exc.message}"
         ) from exc
+
+    results = []
+
+    if not max_workers or max_workers <= 1:
+        for values in values_list:
+            errors = _collect_errors(validator.get(), values)
+            results.append(errors)
+            if fail_fast and errors:
+                break
+
+        return results
+
+    def validate(values) -> List[ValidationErrorDetail]:
+        return _collect_errors(validator.get(), values)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(validate, values) for values in values_list]
+        for future in futures:
+            errors = future.result()
+            results.append(errors)
+            if fail_fast and errors:
+                for future in futures:
+                    future.cancel()
+                break
+
+    return results
+
+
+def _collect_errors(validator, values) -> List[ValidationErrorDetail]:
+    if values is None:
+        return []
+
+    return [
+        ValidationErrorDetail(path=error.json_path, message=error.message)
+        for error in validator.iter_errors(values)
+    ]
+
+
+class _CachedValidator:
+    """
+    A checked schema and the validators built from it.
+
+    Validators may hold reference resolution state that is not safe to share across
+    threads, such as the scope stack of the `RefResolver` in older versions of
+    `jsonschema`, so each thread gets its own validator.
+    """
+
+    __slots__ = ("_cls", "_schema", "_local")
+
+    def __init__(self, cls: type, schema: dict) -> None:
+        self._cls = cls
+        self._schema = schema
+        self._local = threading.local()
+
+    def get(self):
+        validator = getattr(self._local, "validator", None)
+        if validator is None:
+            validator = self._local.validator = self._cls(self._schema)
+        return validator
+
+
+def get_validator(schema: dict, ignore_required: bool = False):
+    """
+    Get a validator for the provided json schema.
+
+    Checking the schema, removing required fields and building the validator only
+    happens once per schema; validators are cached by a hash of the schema contents.
+    Validators are not shared across threads; each thread gets its own validator for
+    a schema.
+
+    Args:
+        schema: The schema to validate against.
+        ignore_required: Whether to ignore the required fields in the schema.
+
+    Raises:
+        jsonschema.SchemaError: If the provided schema is not a valid json schema.
+
+    """
+    return _get_cached_validator(schema, ignore_required).get()
+
+
+def _get_cached_validator(schema: dict, ignore_required: bool) -> _CachedValidator:
+    key = _get_validator_key(schema, ignore_required)
+
+    if key is not None:
+        with _validators_lock:
+            validator = _validators.get(key)
+        if validator is not None:
+            return validator
+
+    if key is not None:
+        # The cached validator must not see later changes to the caller's schema
+        schema = copy.deepcopy(schema)
+
+    if ignore_required:
+        schema = remove_nested_keys(["required"], schema)
+
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    validator = _CachedValidator(cls, schema)
+
+    if key is not None:
+        with _validators_lock:
+            _validators[key] = validator
+
+    return validator
+
+
+def _get_validator_key(schema: dict, ignore_required: bool) -> Optional[Tuple]:
+    try:
+        schema_hash = stable_hash(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS))
+    except TypeError:
+        # The schema is not serializable so it cannot be cached
+        return None
+
+    return (schema_hash, ignore_required)
@@ -5,6 +5,7 @@ from typing import List
 import pytest
 
 from prefect._internal.concurrency.inspection import stack_for_threads
+from prefect._internal.concurrency.threads import wait_for_worker_pool_exit
 
 
 @pytest.fixture(autouse=True)
@@ -16,6 +17,9 @@ def check_thread_leak():
 
     yield
 
+    # Threads in the worker pool are reused across calls until they are idle
+    wait_for_worker_pool_exit(timeout=5)
+
     start = time.time()
     while True:
         bad_threads = [
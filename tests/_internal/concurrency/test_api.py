@@ -359,3 +359,275 @@ async def test_from_async_call_in_loop_thread_from_loop_thread():
     assert result == 2
 
     wait_for_global_loop_exit()
+
+
+async def asleep_then_return(seconds, x):
+    await asyncio.sleep(seconds)
+    return x
+
+
+@pytest.mark.parametrize("work", [identity, aidentity])
+def test_from_sync_call_many_in_loop_thread(work):
+    results = from_sync.call_many_in_loop_thread(
+        [create_call(work, i) for i in range(10)]
+    )
+    assert results == list(range(10))
+
+    wait_for_global_loop_exit()
+
+
+@pytest.mark.parametrize("work", [identity, aidentity])
+async def test_from_async_call_many_in_loop_thread(work):
+    results = await from_async.call_many_in_loop_thread(
+        [create_call(work, i) for i in range(10)]
+    )
+    assert results == list(range(10))
+
+    wait_for_global_loop_exit()
+
+
+def test_from_sync_call_many_in_loop_thread_raises_first_exception_in_order():
+    def fail(x):
+        raise ValueError(x)
+
+    with pytest.raises(ValueError, match="1"):
+        from_sync.call_many_in_loop_thread(
+            [
+                create_call(asleep_then_return, 0.1, 0),
+                create_call(asleep_then_return, 0.1, 1),
+                create_call(fail, 1),
+                create_call(fail, 2),
+            ]
+        )
+
+    wait_for_global_loop_exit()
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+def test_from_sync_call_many_in_loop_thread_max_concurrency(max_concurrency):
+    running = 0
+    max_running = 0
+
+    async def work(x):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(running, max_running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return x
+
+    results = from_sync.call_many_in_loop_thread(
+        [create_call(work, i) for i in range(10)], max_concurrency=max_concurrency
+    )
+    assert results == list(range(10))
+    assert max_running == max_concurrency
+
+    wait_for_global_loop_exit()
+
+
+def test_from_sync_call_many_in_loop_thread_invalid_max_concurrency():
+    with pytest.raises(ValueError, match="at least 1"):
+        from_sync.call_many_in_loop_thread(
+            [create_call(identity, 1)], max_concurrency=0
+        )
+
+    wait_for_global_loop_exit()
+
+
+def test_from_sync_call_many_in_loop_thread_timeout():
+    calls = [
+        create_call(asleep_then_return, 1, 1),
+        create_call(asleep_then_return, 0, 2),
+    ]
+    with pytest.raises(CancelledError):
+        from_sync.call_many_in_loop_thread(calls, timeout=0.1)
+
+    assert calls[0].future.cancelled()
+    assert calls[1].result() == 2
+
+    wait_for_global_loop_exit()
+
+
+@pytest.mark.parametrize("fn", [identity, aidentity])
+def test_from_sync_call_many_in_loop_thread_from_loop_thread(fn):
+    def worker():
+        # Unlike `call_in_loop_thread`, the calls are not run inline since coroutine
+        # calls could not finish while the loop waits for them
+        with pytest.raises(RuntimeError, match="global event loop thread"):
+            from_sync.call_many_in_loop_thread([create_call(fn, 1)])
+
+        with pytest.raises(RuntimeError, match="global event loop thread"):
+            from_sync.call_many_in_loop_thread_as_completed([create_call(fn, 1)])
+        return 2
+
+    assert from_sync.call_in_loop_thread(worker) == 2
+
+    wait_for_global_loop_exit()
+
+
+def test_from_sync_call_many_in_loop_thread_as_completed():
+    calls = from_sync.call_many_in_loop_thread_as_completed(
+        [create_call(asleep_then_return, 0.3 - i / 10, i) for i in range(3)]
+    )
+    assert [call.result() for call in calls] == [2, 1, 0]
+
+    wait_for_global_loop_exit()
+
+
+async def test_from_async_call_many_in_loop_thread_as_completed():
+    calls = from_async.call_many_in_loop_thread_as_completed(
+        [create_call(asleep_then_return, 0.3 - i / 10, i) for i in range(3)]
+    )
+    assert [call.result() async for call in calls] == [2, 1, 0]
+
+    wait_for_global_loop_exit()
+
+
+async def agen(n):
+    for i in range(n):
+        await asyncio.sleep(0)
+        yield i
+
+
+def test_from_sync_iter_in_loop_thread():
+    assert list(from_sync.iter_in_loop_thread(create_call(agen, 100))) == list(
+        range(100)
+    )
+
+    wait_for_global_loop_exit()
+
+
+async def test_from_async_iter_in_loop_thread():
+    items = [i async for i in from_async.iter_in_loop_thread(create_call(agen, 100))]
+    assert items == list(range(100))
+
+    wait_for_global_loop_exit()
+
+
+def test_from_sync_iter_in_loop_thread_is_lazy():
+    started = threading.Event()
+
+    async def numbers():
+        started.set()
+        yield 1
+
+    iterator = from_sync.iter_in_loop_thread(numbers)
+    time.sleep(0.1)
+    assert not started.is_set()
+    assert list(iterator) == [1]
+
+    wait_for_global_loop_exit()
+
+
+@pytest.mark.parametrize("buffer_size", [1, 4])
+def test_from_sync_iter_in_loop_thread_applies_backpressure(buffer_size):
+    produced = 0
+
+    async def numbers():
+        nonlocal produced
+        while True:
+            produced += 1
+            yield produced
+
+    iterator = from_sync.iter_in_loop_thread(numbers, buffer_size=buffer_size)
+    for i, item in enumerate(iterator, 1):
+        assert item == i
+        time.sleep(0.01)
+        # The producer is at most one item ahead of a full buffer, and the consumer
+        # holds the rest of the batch it took from the buffer
+        assert produced <= i + 2 * buffer_size
+        if i == 10:
+            break
+
+    wait_for_global_loop_exit()
+
+
+def test_from_sync_iter_in_loop_thread_early_break_cancels_producer():
+    closed = threading.Event()
+
+    async def slow_numbers():
+        try:
+            yield 1
+            # The producer is waiting here when iteration ends
+            await asyncio.sleep(10)
+            yield 2
+        finally:
+            closed.set()
+
+    t0 = time.time()
+    for _ in from_sync.iter_in_loop_thread(slow_numbers):
+        break
+
+    assert closed.is_set()
+    assert time.time() - t0 < 5
+
+    wait_for_global_loop_exit()
+
+
+def test_from_sync_iter_in_loop_thread_finalized_in_loop_thread():
+    closed = threading.Event()
+
+    async def slow_numbers():
+        try:
+            yield 1
+            await asyncio.sleep(10)
+            yield 2
+        finally:
+            closed.set()
+
+    iterators = [from_sync.iter_in_loop_thread(slow_numbers)]
+    assert next(iterators[0]) == 1
+
+    # Dropping the last reference finalizes the iterator in the loop thread, which
+    # must not wait for the producer running on the same loop
+    from_sync.call_in_loop_thread(iterators.clear)
+
+    assert closed.wait(5)
+
+    wait_for_global_loop_exit()
+
+
+@pytest.mark.parametrize("from_", ["sync", "async"])
+async def test_iter_in_loop_thread_raises_producer_exception(from_):
+    async def fails():
+        yield 1
+        raise ValueError("test")
+
+    items = []
+    with pytest.raises(ValueError, match="test"):
+        if from_ == "sync":
+            for item in from_sync.iter_in_loop_thread(fails):
+                items.append(item)
+        else:
+            async for item in from_async.iter_in_loop_thread(fails):
+                items.append(item)
+
+    assert items == [1]
+
+    wait_for_global_loop_exit()
+
+
+def test_from_sync_iter_in_loop_thread_timeout():
+    async def slow_numbers():
+        yield 1
+        await asyncio.sleep(10)
+        yield 2
+
+    items = []
+    with pytest.raises(CancelledError):
+        for item in from_sync.iter_in_loop_thread(slow_numbers, timeout=0.1):
+            items.append(item)
+
+    assert items == [1]
+
+    wait_for_global_loop_exit()
+
+
+def test_from_sync_iter_in_loop_thread_from_loop_thread():
+    def worker():
+        with pytest.raises(RuntimeError, match="global event loop thread"):
+            from_sync.iter_in_loop_thread(create_call(agen, 1))
+
+    from_sync.call_in_loop_thread(worker)
+
+    wait_for_global_loop_exit()
@@ -1,9 +1,10 @@
 import asyncio
+import contextvars
 import time
 
 import pytest
 
-from prefect._internal.concurrency.calls import Call
+from prefect._internal.concurrency.calls import Call, get_current_call
 from prefect._internal.concurrency.cancellation import CancelledError
 
 
@@ -89,3 +90,48 @@ def test_call_future_cancelled():
     with pytest.raises(CancelledError):
         call.result()
     assert call.cancelled()
+
+
+@pytest.mark.parametrize("fn", [identity, aidentity])
+def test_lightweight_call(fn):
+    call = Call.new_lightweight(fn, 1)
+    assert call() == 1
+
+
+@pytest.mark.parametrize("fn", [raises, araises])
+def test_lightweight_call_result_exception(fn):
+    call = Call.new_lightweight(fn, ValueError("test"))
+    call.run()
+    with pytest.raises(ValueError, match="test"):
+        call.result()
+
+
+@pytest.mark.parametrize("fn", [time.sleep, asyncio.sleep], ids=["sync", "async"])
+def test_lightweight_call_timeout(fn):
+    call = Call.new_lightweight(fn, 2)
+    call.set_timeout(1)
+    call.run()
+    with pytest.raises(CancelledError):
+        call.result()
+    assert call.timedout()
+
+
+def test_lightweight_call_does_not_capture_context():
+    var = contextvars.ContextVar("var", default="default")
+
+    token = var.set("captured")
+    default_call = Call.new(var.get)
+    lightweight_call = Call.new_lightweight(var.get)
+    var.reset(token)
+
+    assert default_call() == "captured"
+    assert lightweight_call() == "default"
+
+
+def test_lightweight_call_is_not_tracked_as_current_call():
+    assert Call.new(get_current_call)() is not None
+    assert Call.new_lightweight(get_current_call)() is None
+
+
+def test_call_has_no_instance_dict():
+    assert not hasattr(Call.new(identity, 1), "__dict__")
@@ -1,25 +1,37 @@
 import asyncio
 import concurrent.futures
+import contextvars
+import gc
+import os
 import signal
 import threading
 import time
+import weakref
 from unittest.mock import MagicMock
 
 import anyio
 import pytest
 
+from prefect._internal.concurrency.calls import Call
 from prefect._internal.concurrency.cancellation import (
+    _ALARMS,
     AlarmCancelScope,
     AsyncCancelScope,
     CancelledError,
+    CooperativeCancelScope,
+    DeadlineScheduler,
     WatcherThreadCancelScope,
     cancel_async_after,
     cancel_async_at,
     cancel_sync_after,
     cancel_sync_at,
+    check_cancelled,
+    get_current_cancel_scope,
     get_deadline,
+    get_deadline_scheduler,
     shield,
 )
+from prefect._internal.concurrency.threads import WorkerThread
 
 
 @pytest.fixture
@@ -594,3 +606,329 @@ def test_shield_sync_in_worker_thread_nested():
     assert not completed
     assert completed_shieldA
     assert completed_shieldB
+
+
+def test_deadline_scheduler_runs_callbacks_in_order():
+    scheduler = DeadlineScheduler(idle_timeout=0.1)
+    results = []
+    done = threading.Event()
+
+    now = time.monotonic()
+    scheduler.schedule(now + 0.2, lambda: (results.append(2), done.set()))
+    scheduler.schedule(now + 0.1, lambda: results.append(1))
+    # Already expired
+    scheduler.schedule(now - 1, lambda: results.append(0))
+
+    assert done.wait(5)
+    assert results == [0, 1, 2]
+    assert scheduler.pending() == 0
+
+
+def test_deadline_scheduler_cancel():
+    scheduler = DeadlineScheduler(idle_timeout=0.1)
+    callback = MagicMock()
+
+    entry = scheduler.schedule(time.monotonic() + 0.1, callback)
+    later = scheduler.schedule(time.monotonic() + 10, callback)
+    assert scheduler.pending() == 2
+
+    assert scheduler.cancel(entry)
+    assert scheduler.cancel(later)
+    assert scheduler.pending() == 0
+
+    time.sleep(0.2)
+    callback.assert_not_called()
+
+
+def test_deadline_scheduler_cancel_waits_for_running_callback():
+    scheduler = DeadlineScheduler(idle_timeout=0.1)
+    started = threading.Event()
+    finished = threading.Event()
+
+    def callback():
+        started.set()
+        time.sleep(0.2)
+        finished.set()
+
+    entry = scheduler.schedule(time.monotonic(), callback)
+    assert started.wait(5)
+
+    assert not scheduler.cancel(entry)
+    assert finished.is_set()
+
+
+def test_deadline_scheduler_thread_exits_when_idle():
+    scheduler = DeadlineScheduler(idle_timeout=0.1)
+    entry = scheduler.schedule(time.monotonic() + 10, MagicMock())
+    thread = scheduler._thread
+    assert thread.is_alive()
+
+    scheduler.cancel(entry)
+    thread.join(5)
+    assert not thread.is_alive()
+
+    # A new thread is started for the next deadline
+    done = threading.Event()
+    scheduler.schedule(time.monotonic(), done.set)
+    assert done.wait(5)
+
+
+def test_watcher_thread_cancel_scopes_share_scheduler_thread():
+    def on_worker_thread():
+        with pytest.raises(CancelledError):
+            with WatcherThreadCancelScope(timeout=0.1) as scope:
+                threads_in_scope = threading.active_count()
+                for _ in range(20):
+                    with WatcherThreadCancelScope(timeout=10):
+                        pass
+                assert threading.active_count() == threads_in_scope
+                for _ in range(10):
+                    time.sleep(0.1)
+
+        return scope
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        scope = executor.submit(on_worker_thread).result()
+
+    assert scope.cancelled()
+    assert get_deadline_scheduler().pending() == 0
+
+
+@pytest.mark.timeout(method="thread")  # alarm-based pytest-timeout will interfere
+def test_cancel_sync_nested_in_main_thread_uses_alarms():
+    threads = threading.active_count()
+
+    with pytest.raises(CancelledError):
+        with cancel_sync_after(0.2) as outer:
+            with cancel_sync_after(5) as inner:
+                with cancel_sync_after(10) as innermost:
+                    assert threading.active_count() == threads
+                    t0 = time.monotonic()
+                    # The alarm interrupts the sleep
+                    time.sleep(2)
+
+    assert time.monotonic() - t0 < 1
+    assert all(
+        isinstance(scope, AlarmCancelScope) for scope in (outer, inner, innermost)
+    )
+    assert outer.cancelled()
+    assert not inner.cancelled()
+    assert not innermost.cancelled()
+
+    # The handler and timer are restored once all scopes exit
+    assert signal.getsignal(signal.SIGALRM) == signal.SIG_DFL
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+
+@pytest.mark.timeout(method="thread")  # alarm-based pytest-timeout will interfere
+def test_cancel_sync_nested_alarms_rearm_after_inner_exits():
+    with pytest.raises(CancelledError):
+        with cancel_sync_after(0.3) as outer:
+            with cancel_sync_after(0.1) as inner:
+                pass
+            # The timer is armed for the outer deadline again
+            time.sleep(2)
+
+    assert outer.cancelled()
+    assert not inner.cancelled()
+
+
+@pytest.mark.timeout(method="thread")  # alarm-based pytest-timeout will interfere
+def test_cancel_sync_nested_alarms_inner_cancelled_manually():
+    completed = False
+    with cancel_sync_after(5) as outer:
+        with pytest.raises(CancelledError):
+            with cancel_sync_after(10) as inner:
+                threading.Timer(0.1, inner.cancel).start()
+                time.sleep(2)
+
+        completed = True
+
+    assert inner.cancelled()
+    assert not outer.cancelled()
+    assert completed
+
+
+@pytest.mark.timeout(method="thread")  # alarm-based pytest-timeout will interfere
+def test_alarm_cancel_scope_restores_existing_alarm_handler(
+    mock_alarm_signal_handler,
+):
+    previous_handler = signal.getsignal(signal.SIGALRM)
+
+    with pytest.raises(CancelledError):
+        with AlarmCancelScope(timeout=0.1):
+            time.sleep(1)
+
+    assert signal.getsignal(signal.SIGALRM) == previous_handler
+    mock_alarm_signal_handler.assert_not_called()
+
+
+def test_check_cancelled_outside_of_scope():
+    assert get_current_cancel_scope() is None
+    check_cancelled()
+
+
+@pytest.mark.parametrize("cls", [CooperativeCancelScope, WatcherThreadCancelScope])
+def test_check_cancelled_in_nested_scopes(cls):
+    with pytest.raises(CancelledError):
+        with CooperativeCancelScope() as outer:
+            with cls() as inner:
+                assert get_current_cancel_scope() is inner
+                check_cancelled()
+
+                outer.cancel()
+                check_cancelled()
+
+    assert get_current_cancel_scope() is None
+    assert outer.cancelled()
+    assert not inner.cancelled()
+
+
+def test_check_cancelled_in_context_copied_in_scope():
+    with pytest.raises(CancelledError):
+        with CooperativeCancelScope() as scope:
+            context = contextvars.copy_context()
+            scope.cancel()
+
+    # The scope has exited so its cancellation no longer applies to the copy
+    assert context.run(get_current_cancel_scope) is None
+    context.run(check_cancelled)
+
+
+def test_context_copied_in_scope_does_not_keep_scope_alive():
+    with CooperativeCancelScope() as outer:
+        with CooperativeCancelScope() as inner:
+            context = contextvars.copy_context()
+
+    outer_ref, inner_ref = weakref.ref(outer), weakref.ref(inner)
+    del outer, inner
+    gc.collect()
+
+    assert outer_ref() is None
+    assert inner_ref() is None
+    assert context.run(get_current_cancel_scope) is None
+
+
+def test_check_cancelled_in_shield():
+    with pytest.raises(CancelledError):
+        with CooperativeCancelScope() as scope:
+            scope.cancel()
+            with shield():
+                assert get_current_cancel_scope() is None
+                check_cancelled()
+            check_cancelled()
+
+
+async def test_check_cancelled_in_async_scope():
+    with pytest.raises(CancelledError):
+        with cancel_async_after(None) as scope:
+            scope.cancel(throw=False)
+            check_cancelled()
+
+
+def test_cooperative_cancel_scope_timeout():
+    iterations = 0
+    with pytest.raises(CancelledError):
+        with CooperativeCancelScope(timeout=0.1) as scope:
+            while True:
+                check_cancelled()
+                iterations += 1
+
+    assert scope.cancelled()
+    assert scope.timedout()
+    assert iterations > 0
+
+
+def test_cooperative_cancel_scope_raises_on_exit_without_checkpoint():
+    completed = False
+    with pytest.raises(CancelledError):
+        with CooperativeCancelScope(timeout=0.1):
+            time.sleep(0.3)
+            completed = True
+
+    # The code in the scope is not interrupted
+    assert completed
+
+
+def test_cooperative_cancel_scope_not_cancelled():
+    with CooperativeCancelScope(timeout=10) as scope:
+        check_cancelled()
+
+    assert scope.completed()
+    assert not scope.cancelled()
+    assert get_deadline_scheduler().pending() == 0
+
+
+def test_check_cancelled_in_call_cancelled_from_another_thread():
+    def on_worker_thread(started: threading.Event):
+        started.set()
+        while True:
+            check_cancelled()
+            time.sleep(0.01)
+
+    started = threading.Event()
+    call = Call.new(on_worker_thread, started)
+    with WorkerThread(run_once=True) as runner:
+        runner.submit(call)
+        assert started.wait(5)
+        call.cancel()
+
+    with pytest.raises(CancelledError):
+        call.result(timeout=5)
+
+
+def test_alarm_cancel_scope_outside_main_thread_is_not_entered():
+    def enter_in_thread():
+        with pytest.raises(ValueError, match="main thread"):
+            with AlarmCancelScope():
+                pass
+        return get_current_cancel_scope()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(enter_in_thread).result() is None
+
+
+@pytest.mark.timeout(method="thread")  # alarm-based pytest-timeout will interfere
+def test_alarm_cancel_scope_alarm_is_delayed_while_scopes_change():
+    interrupted_change = False
+    with pytest.raises(CancelledError):
+        with AlarmCancelScope() as scope:
+            with _ALARMS._changes():
+                scope.cancel(throw=False)
+                os.kill(os.getpid(), signal.SIGALRM)
+                # The blocked alarm does not interrupt the change
+                time.sleep(0.1)
+                interrupted_change = True
+
+            time.sleep(2)
+
+    assert interrupted_change
+    assert scope.cancelled()
+
+
+@pytest.mark.timeout(method="thread")  # alarm-based pytest-timeout will interfere
+def test_alarm_cancel_scope_handler_is_deferred_while_scopes_change():
+    with pytest.raises(CancelledError):
+        with AlarmCancelScope() as scope:
+            with _ALARMS._changes():
+                scope.cancel(throw=False)
+                # As if the signal was delivered to another thread
+                _ALARMS.handle_alarm()
+
+            time.sleep(2)
+
+    assert scope.cancelled()
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+
+@pytest.mark.timeout(method="thread")  # alarm-based pytest-timeout will interfere
+def test_alarm_cancel_scope_discards_alarm_blocked_while_last_scope_exits():
+    previous_handler = signal.getsignal(signal.SIGALRM)
+
+    with _ALARMS._changes():
+        with AlarmCancelScope():
+            os.kill(os.getpid(), signal.SIGALRM)
+
+    # The alarm is not delivered to the restored handler
+    assert signal.getsignal(signal.SIGALRM) == previous_handler
+    assert signal.SIGALRM not in signal.sigpending()
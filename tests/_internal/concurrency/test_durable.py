@@ -0,0 +1,217 @@
+import pickle
+import queue
+import sqlite3
+import threading
+
+import pytest
+
+from prefect._internal.concurrency.durable import DurableQueue
+from prefect._internal.concurrency.primitives import OverflowPolicy
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "queue.db"
+
+
+@pytest.fixture
+def open_queue(path):
+    queues = []
+
+    def open_queue(**kwargs):
+        q = DurableQueue(path, **kwargs)
+        queues.append(q)
+        return q
+
+    yield open_queue
+
+    for q in queues:
+        q.dispose()
+
+
+async def test_durable_queue_get_in_order(open_queue):
+    q = open_queue()
+    for i in range(5):
+        q.put_nowait(i)
+
+    assert q.qsize() == 5
+    assert [await q.get() for _ in range(5)] == list(range(5))
+
+
+async def test_durable_queue_spills_to_disk(open_queue):
+    q = open_queue(memory_size=3)
+    for i in range(10):
+        q.put_nowait(i)
+
+    assert q.qsize() == 10
+    assert q.memory_qsize() == 3
+
+    items = []
+    for _ in range(10):
+        items.append(await q.get())
+        assert q.memory_qsize() <= 3
+
+    assert items == list(range(10))
+    assert q.qsize() == 0
+
+
+async def test_durable_queue_replays_unacknowledged_items(open_queue):
+    q = open_queue(memory_size=3)
+    for i in range(6):
+        q.put_nowait(i)
+
+    for _ in range(4):
+        await q.get()
+    row_ids = q.take_row_ids(4)
+    q.ack(row_ids[:2])
+    q.release(row_ids[2:3])
+    q.dispose()
+
+    q = open_queue(memory_size=3)
+    assert q.qsize() == 4
+    assert [await q.get() for _ in range(4)] == [2, 3, 4, 5]
+
+
+async def test_durable_queue_acks_duplicate_items(open_queue):
+    item = {"a": 1}
+    q = open_queue()
+    q.put_nowait(item)
+    q.put_nowait(item)
+    q.put_nowait(1)
+    q.put_nowait(1)
+
+    assert await q.get() is item
+    assert await q.get() is item
+    assert await q.get_batch(2) == ([1, 1], 2)
+    row_ids = q.take_row_ids(4)
+    q.ack([row_ids[1], row_ids[2]])
+    q.dispose()
+
+    q = open_queue()
+    assert q.qsize() == 2
+    assert await q.get_batch(2) == ([item, 1], 2)
+
+
+async def test_durable_queue_writes_items_in_the_background(open_queue):
+    threads = []
+
+    def dumps(item):
+        threads.append(threading.current_thread())
+        return pickle.dumps(item)
+
+    q = open_queue(dumps=dumps)
+    for i in range(3):
+        q.put_nowait(i)
+    q.dispose()
+
+    assert len(threads) == 3
+    assert threading.current_thread() not in threads
+
+    q = open_queue()
+    assert q.qsize() == 3
+
+
+async def test_durable_queue_dead_letters_items_after_max_attempts(open_queue, path):
+    q = open_queue(max_attempts=2)
+    q.put_nowait(1)
+    q.dispose()
+
+    for attempt in range(3):
+        q = open_queue(max_attempts=2)
+        if attempt == 2:
+            break
+        assert await q.get() == 1
+        q.release(q.take_row_ids(1))
+        q.dispose()
+
+    assert q.qsize() == 0
+    q.dispose()
+
+    db = sqlite3.connect(path)
+    try:
+        assert db.execute("SELECT attempts, data FROM dead_items").fetchall() == [
+            (2, pickle.dumps(1))
+        ]
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize(
+    "overflow", [OverflowPolicy.DROP_OLDEST, OverflowPolicy.COALESCE]
+)
+def test_durable_queue_unsupported_overflow_policy(path, overflow):
+    with pytest.raises(ValueError, match="only support"):
+        DurableQueue(path, overflow=overflow)
+
+
+async def test_durable_queue_maxsize(open_queue):
+    q = open_queue(memory_size=1, maxsize=2)
+    q.put_nowait(1)
+    q.put_nowait(2)
+
+    with pytest.raises(queue.Full):
+        q.put_nowait(3)
+
+    assert await q.get() == 1
+    q.put_nowait(3)
+    assert q.qsize() == 2
+
+
+async def test_durable_queue_maxsize_drop_newest(open_queue):
+    q = open_queue(maxsize=2, overflow=OverflowPolicy.DROP_NEWEST)
+    for i in range(3):
+        q.put_nowait(i)
+
+    assert q.dropped_count == 1
+    assert await q.get_batch(10) == ([0, 1], 2)
+
+
+async def test_durable_queue_get_batch_with_get_size(open_queue):
+    q = open_queue(memory_size=2, get_size=len)
+    for item in ["a", "bb", "ccc", "d"]:
+        q.put_nowait(item)
+    q.dispose()
+
+    q = open_queue(memory_size=2, get_size=len)
+    assert q.size() == 7
+    assert await q.get_batch(2) == (["a", "bb"], 3)
+    assert await q.get_batch(10) == (["ccc", "d"], 4)
+
+
+async def test_durable_queue_discards_items_that_cannot_be_loaded(open_queue):
+    def loads(data):
+        item = pickle.loads(data)
+        if item == 1:
+            raise ValueError("Bad item")
+        return item
+
+    q = open_queue()
+    for i in range(3):
+        q.put_nowait(i)
+    q.dispose()
+
+    q = open_queue(loads=loads)
+    assert q.qsize() == 2
+    assert [await q.get() for _ in range(2)] == [0, 2]
+
+
+def test_durable_queue_uses_another_file_when_in_use(open_queue, path):
+    q1 = open_queue()
+    q2 = open_queue()
+    assert q1.path == path
+    assert q2.path != path
+
+    q1.put_nowait(1)
+    assert q2.qsize() == 0
+
+
+async def test_durable_queue_close(open_queue):
+    q = open_queue()
+    q.put_nowait(1)
+    q.close()
+
+    with pytest.raises(RuntimeError, match="closed queue"):
+        q.put_nowait(2)
+
+    assert await q.get() == 1
+    assert await q.get() is None
@@ -0,0 +1,159 @@
+import multiprocessing
+import os
+import socket
+import stat
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from prefect._internal.concurrency import fanin
+from prefect._internal.concurrency.fanin import (
+    FAN_IN_PID_ENV_VAR,
+    FAN_IN_SOCKET_ENV_VAR,
+    FanInForwarder,
+    FanInServer,
+    get_fan_in_address,
+)
+from prefect._internal.concurrency.services import QueueService
+from prefect._internal.concurrency.threads import wait_for_global_loop_exit
+
+
+class FanInMockService(QueueService[int]):
+    _fan_in = True
+    mock = MagicMock()
+
+    async def _handle(self, item: int):
+        self.mock(self, item)
+
+
+def produce(start: int, count: int, *args):
+    instance = FanInMockService.instance(*args)
+    assert isinstance(instance, FanInForwarder)
+    for i in range(start, start + count):
+        instance.send(i)
+    QueueService.drain_all()
+
+
+def check_not_forwarding():
+    assert get_fan_in_address() is None
+    assert not isinstance(FanInMockService.instance(), FanInForwarder)
+    QueueService.drain_all()
+
+
+def run_grandchild():
+    run_children((), target=check_not_forwarding)
+
+
+def run_children(*children, target=produce):
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=target, args=args) for args in children]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+
+def wait_for_received(server: FanInServer, count: int):
+    deadline = time.monotonic() + 10
+    while server.received_count < count:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def server():
+    with FanInServer() as server:
+        yield server
+
+    FanInMockService.mock.reset_mock()
+    FanInMockService.drain_all()
+    wait_for_global_loop_exit()
+
+
+def test_fan_in_from_child_processes(server):
+    run_children((0, 10), (10, 10), (20, 10))
+    wait_for_received(server, 30)
+
+    instance = FanInMockService.instance()
+    assert not isinstance(instance, FanInForwarder)
+    instance.drain()
+
+    assert server.connection_count == 3
+    assert {args[0][0] for args in FanInMockService.mock.call_args_list} == {instance}
+    assert sorted(args[0][1] for args in FanInMockService.mock.call_args_list) == list(
+        range(30)
+    )
+
+
+def test_fan_in_preserves_instance_arguments(server):
+    run_children((0, 2, "a"), (2, 2, "b"))
+    wait_for_received(server, 4)
+
+    a, b = FanInMockService.instance("a"), FanInMockService.instance("b")
+    FanInMockService.drain_all()
+
+    items = {a: [], b: []}
+    for args in FanInMockService.mock.call_args_list:
+        items[args[0][0]].append(args[0][1])
+    assert items == {a: [0, 1], b: [2, 3]}
+
+
+def test_fan_in_address_is_only_used_in_child_processes(server):
+    assert get_fan_in_address() is None
+
+    # Items are handled in this process
+    FanInMockService.instance().send(1)
+    FanInMockService.drain_all()
+    FanInMockService.mock.assert_called_once()
+
+
+def test_fan_in_socket_is_only_accessible_to_its_owner(server):
+    assert stat.S_IMODE(os.stat(server.path).st_mode) == 0o600
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, "SO_PEERCRED"), reason="Peer credentials are not supported"
+)
+def test_fan_in_reads_user_of_peer():
+    left, right = socket.socketpair(socket.AF_UNIX)
+    with left, right:
+        assert fanin._get_peer_uid(left) == os.getuid()
+
+
+def test_fan_in_address_is_not_used_in_grandchild_processes(server):
+    run_children((), target=run_grandchild)
+    assert server.connection_count == 0
+
+
+def test_fan_in_handles_items_locally_when_server_is_unreachable(monkeypatch, tmp_path):
+    monkeypatch.setenv(FAN_IN_SOCKET_ENV_VAR, str(tmp_path / "missing.sock"))
+    monkeypatch.setenv(FAN_IN_PID_ENV_VAR, str(os.getppid()))
+    monkeypatch.setattr(fanin, "_fan_in_disabled", False)
+
+    try:
+        forwarder = FanInMockService.instance()
+        assert isinstance(forwarder, FanInForwarder)
+        forwarder.send(1)
+        forwarder.drain()
+
+        assert get_fan_in_address() is None
+        instance = FanInMockService.instance()
+        assert not isinstance(instance, FanInForwarder)
+        instance.drain()
+        FanInMockService.mock.assert_called_once_with(instance, 1)
+    finally:
+        FanInMockService.mock.reset_mock()
+        FanInMockService.drain_all()
+        wait_for_global_loop_exit()
+
+
+def test_fan_in_server_only_accepts_fan_in_services(server):
+    class NotFanInMockService(FanInMockService):
+        _fan_in = False
+
+    assert server._get_service(f"{__name__}:FanInMockService") is FanInMockService
+    assert server._get_service(f"{__name__}:NotFanInMockService") is None
+    assert server._get_service("builtins:int") is None
+    assert server._get_service("unknown.module:Service") is None
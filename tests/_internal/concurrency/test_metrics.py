@@ -0,0 +1,126 @@
+import json
+
+import pytest
+
+from prefect._internal.concurrency.metrics import (
+    Histogram,
+    MetricsFileExporter,
+    merge_stats,
+    stats_to_json,
+    stats_to_openmetrics,
+)
+
+
+def test_histogram_observe():
+    histogram = Histogram([1, 5, 10])
+    for value in [0.5, 1, 3, 7, 20]:
+        histogram.observe(value)
+
+    assert histogram.count == 5
+    assert histogram.sum == 31.5
+    assert histogram.to_dict()["buckets"] == {
+        "1.0": 2,
+        "5.0": 3,
+        "10.0": 4,
+        "+Inf": 5,
+    }
+
+
+def test_histogram_merge():
+    a = Histogram([1, 5])
+    b = Histogram([1, 5])
+    a.observe(1)
+    b.observe(3)
+    b.observe(10)
+
+    a.merge(b)
+    assert a.counts == [1, 1, 1]
+    assert a.count == 3
+    assert a.sum == 14
+
+
+def test_histogram_merge_different_buckets():
+    with pytest.raises(ValueError, match="different buckets"):
+        Histogram([1]).merge(Histogram([2]))
+
+
+def test_histogram_copy_is_independent():
+    histogram = Histogram([1])
+    copy = histogram.copy()
+    histogram.observe(1)
+    assert copy.count == 0
+
+
+def test_merge_stats():
+    a = {"depth": 1, "handled_count": 2, "latency": Histogram([1]), "batch_size": 5}
+    b = {"depth": 3, "handled_count": 4, "latency": Histogram([1]), "batch_size": 10}
+    a["latency"].observe(1)
+    b["latency"].observe(2)
+
+    merged = merge_stats([a, b])
+    assert merged["depth"] == 4
+    assert merged["handled_count"] == 6
+    assert merged["latency"].count == 2
+    assert merged["instances"] == 2
+    assert "batch_size" not in merged
+    # The inputs are not modified
+    assert a["latency"].count == 1
+
+
+def test_stats_to_json():
+    histogram = Histogram([1])
+    histogram.observe(0.5)
+    result = json.loads(
+        stats_to_json({"MyService": {"depth": 1, "latency": histogram, "x": None}})
+    )
+    assert result == {
+        "MyService": {
+            "depth": 1,
+            "latency": {"count": 1, "sum": 0.5, "buckets": {"1.0": 1, "+Inf": 1}},
+            "x": None,
+        }
+    }
+
+
+def test_stats_to_openmetrics():
+    histogram = Histogram([1])
+    histogram.observe(0.5)
+    histogram.observe(2)
+    result = stats_to_openmetrics(
+        {
+            "A": {"depth": 1, "handled_count": 2, "latency": histogram, "x": None},
+            "B": {"depth": 3},
+        }
+    )
+    assert result == (
+        "# TYPE prefect_service_depth gauge\n"
+        'prefect_service_depth{service="A"} 1\n'
+        'prefect_service_depth{service="B"} 3\n'
+        "# TYPE prefect_service_handled counter\n"
+        'prefect_service_handled_total{service="A"} 2\n'
+        "# TYPE prefect_service_latency histogram\n"
+        'prefect_service_latency_bucket{service="A",le="1.0"} 1\n'
+        'prefect_service_latency_bucket{service="A",le="+Inf"} 2\n'
+        'prefect_service_latency_sum{service="A"} 2.5\n'
+        'prefect_service_latency_count{service="A"} 2\n'
+        "# EOF\n"
+    )
+
+
+@pytest.mark.parametrize("format", ["json", "openmetrics"])
+def test_metrics_file_exporter(tmp_path, format):
+    path = tmp_path / "metrics" / "services.txt"
+    stats = {"MyService": {"depth": 1}}
+
+    with MetricsFileExporter(path, lambda: stats, interval=0.01, format=format):
+        pass
+
+    content = path.read_text()
+    assert ("prefect_service_depth" in content) == (format == "openmetrics")
+    assert ('"depth": 1' in content) == (format == "json")
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_metrics_file_exporter_unknown_format(tmp_path):
+    with pytest.raises(ValueError, match="Unknown metrics format"):
+        MetricsFileExporter(tmp_path / "metrics", dict, format="csv")
@@ -1,6 +1,19 @@
+import asyncio
+import queue
+import threading
+import time
+
 import anyio
+import pytest
 
-from prefect._internal.concurrency.primitives import Event
+from prefect._internal.concurrency.metrics import Histogram
+from prefect._internal.concurrency.primitives import (
+    CoalescingQueue,
+    Event,
+    OverflowPolicy,
+    PriorityQueue,
+    Queue,
+)
 
 
 def test_event_set_in_sync_context_before_wait():
@@ -163,3 +176,421 @@ async def test_event_is_set():
     assert not event.is_set()
     event.set()
     assert event.is_set()
+
+
+async def test_queue_get_item_put_before_get():
+    q = Queue()
+    q.put_nowait(1)
+    q.put_nowait(2)
+    assert await q.get() == 1
+    assert await q.get() == 2
+    assert q.empty()
+
+
+async def test_queue_get_item_put_from_async_task():
+    q = Queue()
+
+    async def put():
+        await asyncio.sleep(0)
+        q.put_nowait(1)
+
+    with anyio.fail_after(1):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(put)
+            assert await q.get() == 1
+
+
+async def test_queue_get_item_put_from_sync_thread():
+    q = Queue()
+
+    with anyio.fail_after(1):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(anyio.to_thread.run_sync, q.put_nowait, 1)
+            assert await q.get() == 1
+
+
+async def test_queue_many_items_from_many_threads():
+    q = Queue()
+
+    def put_many(start):
+        for i in range(start, start + 100):
+            q.put_nowait(i)
+
+    threads = [threading.Thread(target=put_many, args=(i * 100,)) for i in range(10)]
+    for thread in threads:
+        thread.start()
+
+    with anyio.fail_after(5):
+        items = [await q.get() for _ in range(1000)]
+
+    for thread in threads:
+        thread.join()
+
+    assert sorted(items) == list(range(1000))
+
+
+async def test_queue_get_timeout():
+    q = Queue()
+
+    t0 = time.monotonic()
+    with pytest.raises(queue.Empty):
+        await q.get(timeout=0.1)
+    assert time.monotonic() - t0 >= 0.1
+
+    # The queue can still be used after a timeout
+    q.put_nowait(1)
+    assert await q.get(timeout=0.1) == 1
+
+
+async def test_queue_get_cancelled_does_not_lose_items():
+    q = Queue()
+
+    task = asyncio.ensure_future(q.get())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    q.put_nowait(1)
+    assert await q.get() == 1
+
+
+def test_queue_get_nowait():
+    q = Queue()
+    with pytest.raises(queue.Empty):
+        q.get_nowait()
+
+    q.put_nowait(1)
+    assert q.qsize() == 1
+    assert q.get_nowait() == 1
+    assert q.qsize() == 0
+
+
+async def test_queue_get_returns_none_when_closed_and_empty():
+    q = Queue()
+    q.put_nowait(1)
+    q.close()
+
+    assert await q.get() == 1
+    assert await q.get() is None
+
+    with pytest.raises(RuntimeError, match="closed queue"):
+        q.put_nowait(2)
+
+
+async def test_queue_close_wakes_consumer_from_sync_thread():
+    q = Queue()
+
+    with anyio.fail_after(1):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(anyio.to_thread.run_sync, q.close)
+            assert await q.get() is None
+
+
+async def test_queue_get_batch_returns_available_items():
+    q = Queue()
+    for i in range(5):
+        q.put_nowait(i)
+
+    assert await q.get_batch(10) == ([0, 1, 2, 3, 4], 5)
+
+
+async def test_queue_get_batch_respects_max_size():
+    q = Queue()
+    for i in range(5):
+        q.put_nowait(i)
+
+    assert await q.get_batch(2) == ([0, 1], 2)
+    assert await q.get_batch(2) == ([2, 3], 2)
+    assert await q.get_batch(2) == ([4], 1)
+
+
+async def test_queue_get_batch_with_get_size():
+    q = Queue(get_size=len)
+    for item in ["a", "bb", "ccc", "d"]:
+        q.put_nowait(item)
+
+    # The last item may take the batch over the maximum size
+    assert await q.get_batch(2) == (["a", "bb"], 3)
+    assert await q.get_batch(10) == (["ccc", "d"], 4)
+
+
+async def test_queue_get_batch_waits_for_item():
+    q = Queue()
+
+    with anyio.fail_after(1):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(anyio.to_thread.run_sync, q.put_nowait, 1)
+            assert await q.get_batch(10) == ([1], 1)
+
+
+async def test_queue_get_batch_timeout():
+    q = Queue()
+    with pytest.raises(queue.Empty):
+        await q.get_batch(10, timeout=0.01)
+
+
+async def test_queue_get_batch_returns_no_items_when_closed_and_empty():
+    q = Queue()
+    q.put_nowait(1)
+    q.close()
+
+    assert await q.get_batch(10) == ([1], 1)
+    assert await q.get_batch(10) == ([], 0)
+
+
+def test_bounded_queue_put_nowait_when_full():
+    q = Queue(maxsize=2)
+    q.put_nowait(1)
+    q.put_nowait(2)
+    with pytest.raises(queue.Full):
+        q.put_nowait(3)
+    assert q.qsize() == 2
+
+
+def test_bounded_queue_accepts_large_item_when_empty():
+    q = Queue(maxsize=2, get_size=len)
+    q.put_nowait("abc")
+    assert q.size() == 3
+    with pytest.raises(queue.Full):
+        q.put_nowait("d")
+
+
+def test_bounded_queue_put_timeout():
+    q = Queue(maxsize=1)
+    q.put_nowait(1)
+    with pytest.raises(queue.Full):
+        q.put(2, timeout=0.01)
+    assert q.blocked_count == 1
+
+
+async def test_bounded_queue_put_waits_for_get():
+    q = Queue(maxsize=1)
+    q.put_nowait(1)
+
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(anyio.to_thread.run_sync, q.put, 2)
+            while not q.blocked_count:
+                await asyncio.sleep(0.01)
+            assert await q.get() == 1
+
+    assert await q.get() == 2
+    assert q.blocked_count == 1
+
+
+async def test_bounded_queue_aput_waits_for_get():
+    q = Queue(maxsize=1)
+    q.put_nowait(1)
+
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(q.aput, 2)
+            await asyncio.sleep(0.01)
+            assert q.blocked_count == 1
+            assert await q.get() == 1
+
+    assert await q.get() == 2
+
+
+async def test_bounded_queue_aput_timeout():
+    q = Queue(maxsize=1)
+    q.put_nowait(1)
+    with pytest.raises(queue.Full):
+        await q.aput(2, timeout=0.01)
+
+
+async def test_bounded_queue_close_fails_waiting_put():
+    q = Queue(maxsize=1)
+    q.put_nowait(1)
+
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+
+            async def put():
+                with pytest.raises(RuntimeError, match="closed queue"):
+                    await q.aput(2)
+
+            tg.start_soon(put)
+            await asyncio.sleep(0.01)
+            q.close()
+
+
+def test_bounded_queue_drop_newest():
+    q = Queue(maxsize=2, overflow=OverflowPolicy.DROP_NEWEST)
+    for i in range(4):
+        q.put_nowait(i)
+
+    assert [q.get_nowait(), q.get_nowait()] == [0, 1]
+    assert q.dropped_count == 2
+
+
+def test_bounded_queue_drop_oldest():
+    q = Queue(maxsize=5, get_size=len, overflow=OverflowPolicy.DROP_OLDEST)
+    for item in ["a", "bb", "cc", "ddd"]:
+        q.put_nowait(item)
+
+    assert [q.get_nowait(), q.get_nowait()] == ["cc", "ddd"]
+    assert q.dropped_count == 2
+    assert q.size() == 0
+
+
+def test_bounded_queue_coalesce():
+    q = Queue(
+        maxsize=2,
+        overflow=OverflowPolicy.COALESCE,
+        coalesce=lambda pending, item: pending + item,
+    )
+    for i in [1, 2, 3, 4]:
+        q.put_nowait(i)
+
+    assert [q.get_nowait(), q.get_nowait()] == [1, 9]
+    assert q.coalesced_count == 2
+
+
+def test_coalescing_queue_replaces_pending_item():
+    q = CoalescingQueue(coalesce_key=lambda item: item[0])
+    for item in [("a", 1), ("b", 1), ("a", 2), ("a", 3), ("c", 1)]:
+        q.put_nowait(item)
+
+    assert q.qsize() == 3
+    assert q.coalesced_count == 2
+    # The merged item keeps the place of the pending item
+    assert [q.get_nowait() for _ in range(3)] == [("a", 3), ("b", 1), ("c", 1)]
+
+
+def test_coalescing_queue_adds_item_after_pending_item_is_retrieved():
+    q = CoalescingQueue(coalesce_key=lambda item: item[0])
+    q.put_nowait(("a", 1))
+    assert q.get_nowait() == ("a", 1)
+
+    q.put_nowait(("a", 2))
+    assert q.qsize() == 1
+    assert q.coalesced_count == 0
+
+
+def test_coalescing_queue_does_not_coalesce_items_without_key():
+    q = CoalescingQueue(coalesce_key=lambda item: None)
+    q.put_nowait(1)
+    q.put_nowait(1)
+    assert q.qsize() == 2
+
+
+async def test_coalescing_queue_merges_items_with_sizes():
+    q = CoalescingQueue(
+        coalesce_key=lambda item: item[0],
+        coalesce=lambda pending, item: pending + item[1:],
+        get_size=len,
+    )
+    q.put_nowait("a1")
+    q.put_nowait("bb")
+    q.put_nowait("a23")
+
+    assert q.size() == 6
+    assert await q.get_batch(5) == (["a123", "bb"], 6)
+    assert q.size() == 0
+
+
+def test_coalescing_queue_with_overflow_policy():
+    q = CoalescingQueue(
+        coalesce_key=lambda item: item[0],
+        maxsize=2,
+        overflow=OverflowPolicy.DROP_OLDEST,
+    )
+    for item in ["a1", "b1", "c1", "a2"]:
+        q.put_nowait(item)
+
+    # "a1" was dropped, so "a2" is added instead of merged
+    assert [q.get_nowait(), q.get_nowait()] == ["c1", "a2"]
+    assert q.dropped_count == 2
+
+
+def test_priority_queue_weighted_fair_dequeue():
+    q = PriorityQueue(get_priority=lambda item: item[0], weights=(3, 1))
+    for i in range(6):
+        q.put_nowait((1, i))
+    for i in range(6):
+        q.put_nowait((0, i))
+
+    assert q.lane_sizes() == [6, 6]
+    assert [q.get_nowait() for _ in range(12)] == [
+        (0, 0),
+        (0, 1),
+        (0, 2),
+        (1, 0),
+        (0, 3),
+        (0, 4),
+        (0, 5),
+        (1, 1),
+        (1, 2),
+        (1, 3),
+        (1, 4),
+        (1, 5),
+    ]
+
+
+def test_priority_queue_lanes():
+    q = PriorityQueue(get_priority=lambda item: item, weights=(1, 1, 1))
+    assert [q.get_lane(priority) for priority in [None, -1, 0, 1, 2, 3]] == [
+        2,
+        0,
+        0,
+        1,
+        2,
+        2,
+    ]
+
+
+@pytest.mark.parametrize("weights", [(), (1, 0)])
+def test_priority_queue_invalid_weights(weights):
+    with pytest.raises(ValueError, match="positive integers"):
+        PriorityQueue(get_priority=lambda item: 0, weights=weights)
+
+
+async def test_priority_queue_get_batch_with_get_size():
+    q = PriorityQueue(get_priority=lambda item: len(item) - 1, get_size=len)
+    for item in ["ccc", "a", "bb", "a"]:
+        q.put_nowait(item)
+
+    assert q.size() == 7
+    assert await q.get_batch(3) == (["a", "a", "bb"], 4)
+    assert await q.get_batch(3) == (["ccc"], 3)
+    assert q.qsize() == 0
+    assert q.empty()
+
+
+def test_priority_queue_drop_oldest_drops_lowest_priority():
+    q = PriorityQueue(
+        get_priority=lambda item: item[0],
+        weights=(1, 1),
+        maxsize=2,
+        overflow=OverflowPolicy.DROP_OLDEST,
+    )
+    for item in [(1, "a"), (0, "b"), (0, "c")]:
+        q.put_nowait(item)
+
+    assert [q.get_nowait(), q.get_nowait()] == [(0, "b"), (0, "c")]
+    assert q.dropped_count == 1
+
+
+def test_priority_queue_coalesce_merges_into_same_lane():
+    q = PriorityQueue(
+        get_priority=lambda item: item[0],
+        weights=(1, 1),
+        maxsize=2,
+        overflow=OverflowPolicy.COALESCE,
+    )
+    for item in [(0, "a"), (1, "b"), (0, "c")]:
+        q.put_nowait(item)
+
+    assert [q.get_nowait(), q.get_nowait()] == [(0, "c"), (1, "b")]
+    assert q.coalesced_count == 1
+
+
+async def test_priority_queue_wait_times():
+    wait_times = Histogram()
+    q = PriorityQueue(get_priority=lambda item: item, wait_times=wait_times)
+    q.put_nowait(0)
+    q.put_nowait(1)
+    await q.get_batch(2)
+    assert wait_times.count == 2
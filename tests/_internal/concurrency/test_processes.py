@@ -0,0 +1,133 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from prefect._internal.concurrency.api import create_call, from_async, from_sync
+from prefect._internal.concurrency.calls import Call
+from prefect._internal.concurrency.cancellation import CancelledError
+from prefect._internal.concurrency.processes import (
+    ProcessPoolPortal,
+    _recv,
+    _send,
+    shutdown_process_pool,
+)
+
+
+def identity(x):
+    return x
+
+
+async def aidentity(x):
+    await asyncio.sleep(0)
+    return x
+
+
+def raises(exc):
+    raise exc
+
+
+@pytest.fixture
+def portal():
+    with ProcessPoolPortal(size=2) as portal:
+        yield portal
+
+
+@pytest.mark.parametrize("work", [identity, aidentity])
+def test_process_pool_submit(portal, work):
+    call = portal.submit(Call.new(work, 1))
+    assert call.result() == 1
+
+
+async def test_process_pool_aresult(portal):
+    call = portal.submit(Call.new(identity, 1))
+    assert await call.aresult() == 1
+
+
+def test_process_pool_runs_in_other_process(portal):
+    call = portal.submit(Call.new(os.getpid))
+    assert call.result() != os.getpid()
+
+
+def test_process_pool_runs_closures(portal):
+    value = 2
+    call = portal.submit(Call.new(lambda x: x * value, 3))
+    assert call.result() == 6
+
+
+def test_process_pool_exception(portal):
+    call = portal.submit(Call.new(raises, ValueError("test")))
+    with pytest.raises(ValueError, match="test"):
+        call.result()
+
+
+def test_process_pool_timeout_terminates_worker(portal):
+    call = Call.new(time.sleep, 10)
+    call.set_timeout(0.5)
+    portal.submit(call)
+
+    with pytest.raises(CancelledError):
+        call.result()
+    assert call.timedout()
+    assert portal.stats()["terminated_process_count"] == 1
+
+    # A new worker replaces the terminated one
+    assert portal.submit(Call.new(identity, 1)).result() == 1
+
+
+def test_process_pool_cancel_running_call(portal):
+    call = portal.submit(Call.new(time.sleep, 10))
+
+    deadline = time.monotonic() + 10
+    while not call.future.running():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    assert call.cancel()
+    with pytest.raises(CancelledError):
+        call.result()
+    assert not call.timedout()
+
+
+def test_process_pool_warm_workers():
+    with ProcessPoolPortal(size=2, warm=2) as portal:
+        assert portal.stats()["processes"] == 2
+        pids = {portal.submit(Call.new(os.getpid)).result() for _ in range(5)}
+        assert pids <= {worker.process.pid for worker in portal._workers}
+        assert portal.stats()["started_process_count"] == 2
+
+
+def test_process_pool_warm_cannot_exceed_size():
+    with pytest.raises(ValueError, match="more warm workers"):
+        ProcessPoolPortal(size=1, warm=2)
+
+
+def test_send_large_buffers_out_of_band():
+    np = pytest.importorskip("numpy")
+
+    array = np.arange(1_000_000)
+    parent, child = multiprocessing.Pipe()
+    # The array is larger than the pipe buffer
+    sender = threading.Thread(target=_send, args=(parent, {"array": array}))
+    sender.start()
+    result = _recv(child)
+    sender.join()
+
+    assert (result["array"] == array).all()
+
+
+@pytest.fixture
+def global_process_pool():
+    yield
+    shutdown_process_pool()
+
+
+def test_from_sync_call_in_worker_process(global_process_pool):
+    assert from_sync.call_in_worker_process(create_call(identity, 1)) == 1
+
+
+async def test_from_async_call_in_worker_process(global_process_pool):
+    assert await from_async.call_in_worker_process(create_call(aidentity, 1)) == 1
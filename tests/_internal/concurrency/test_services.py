@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+import queue
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
@@ -8,13 +9,20 @@ from unittest.mock import ANY, MagicMock, call
 
 import pytest
 from prefect._internal.concurrency.api import create_call, from_async, from_sync
+from prefect._internal.concurrency.primitives import OverflowPolicy
 from prefect._internal.concurrency.services import (
+    AdaptiveBatchController,
     BatchedQueueService,
+    LoopThreadAssignment,
     QueueService,
     drain_on_exit,
     drain_on_exit_async,
 )
-from prefect._internal.concurrency.threads import wait_for_global_loop_exit
+from prefect._internal.concurrency.threads import (
+    get_global_loop,
+    get_loop_thread_pool,
+    wait_for_global_loop_exit,
+)
 
 
 class MockService(QueueService[int]):
@@ -381,4 +389,625 @@ def test_batched_queue_service_min_interval():
     IntervalMockBatchedService.drain_all()
     IntervalMockBatchedService.mock.assert_has_calls(
         [call(instance, [1]), call(instance, [2])]
-    )
\ No newline at end of file
+    )
+
+
+def test_batched_queue_service_takes_available_items_at_once():
+    event = threading.Event()
+
+    class SlowMockBatchedService(MockBatchedService):
+        _max_batch_size = 10
+
+        async def _handle_batch(self, items: List[int]):
+            await super()._handle_batch(items)
+            # Block the first batch until the remaining items are all queued
+            event.wait()
+
+    instance = SlowMockBatchedService.instance()
+    instance.send(0)
+    for i in range(1, 6):
+        instance.send(i)
+    event.set()
+    instance.drain()
+
+    batches = [c.args[1] for c in SlowMockBatchedService.mock.call_args_list]
+    assert sum(batches, []) == list(range(6))
+    assert len(batches) <= 2
+
+
+def test_batched_queue_service_item_sizes():
+    class SizedMockBatchedService(MockBatchedService):
+        _max_batch_size = 4
+
+        def _get_size(self, item: int) -> int:
+            return item
+
+    instance = SizedMockBatchedService.instance()
+    for item in [1, 2, 3, 1, 1]:
+        instance.send(item)
+    instance.drain()
+
+    SizedMockBatchedService.mock.assert_has_calls(
+        [call(instance, [1, 2, 3]), call(instance, [1, 1])]
+    )
+
+
+@pytest.fixture
+def blocked_service():
+    """
+    Yields a function that creates an instance of a service with its handler blocked
+    on the first item. The handler is released by setting the returned event.
+    """
+    event = threading.Event()
+
+    def create(service_type):
+        instance = service_type.instance()
+        service_type.mock.side_effect = lambda _, item: item or event.wait()
+        instance.send(0)
+        # Wait for the first item to be taken from the queue by the handler
+        while instance._queue.qsize():
+            time.sleep(0.01)
+        return instance, event
+
+    yield create
+    event.set()
+
+
+@pytest.mark.parametrize(
+    "policy,expected",
+    [
+        (OverflowPolicy.DROP_NEWEST, [0, 1, 2]),
+        (OverflowPolicy.DROP_OLDEST, [0, 3, 4]),
+        (OverflowPolicy.COALESCE, [0, 1, 4]),
+    ],
+)
+def test_bounded_queue_service_overflow_policy(blocked_service, policy, expected):
+    class BoundedMockService(MockService):
+        _max_queue_size = 2
+        _overflow_policy = policy
+
+    instance, event = blocked_service(BoundedMockService)
+    for i in range(1, 5):
+        instance.send(i)
+
+    assert instance._queue.qsize() == 2
+    event.set()
+    BoundedMockService.drain_all()
+    BoundedMockService.mock.assert_has_calls([call(instance, i) for i in expected])
+
+
+def test_bounded_queue_service_send_blocks(blocked_service):
+    class BoundedMockService(MockService):
+        _max_queue_size = 1
+        _send_timeout = 0.01
+
+    instance, _ = blocked_service(BoundedMockService)
+    instance.send(1)
+
+    with pytest.raises(queue.Full):
+        instance.send(2)
+    assert instance._queue.blocked_count == 1
+
+
+async def test_bounded_queue_service_send_async_waits_for_space():
+    class BoundedMockService(MockService):
+        _max_queue_size = 1
+
+    instance = BoundedMockService.instance()
+    for i in range(10):
+        await instance.send_async(i)
+
+    await BoundedMockService.drain_all()
+    BoundedMockService.mock.assert_has_calls([call(instance, i) for i in range(10)])
+
+
+async def test_send_async_to_stopped_service():
+    instance = MockService.instance()
+    instance._stop()
+    with pytest.raises(RuntimeError, match="stopped service"):
+        await instance.send_async(1)
+
+
+@pytest.fixture
+def queue_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("PREFECT_HOME", str(tmp_path))
+    return tmp_path / "queues"
+
+
+def test_durable_queue_service_replays_failed_items(queue_dir):
+    class DurableMockService(MockService):
+        _durable = True
+
+    def handle(instance, item):
+        if item == 1:
+            raise ValueError("Failed to handle item")
+
+    DurableMockService.mock.side_effect = handle
+    instance = DurableMockService.instance()
+    for i in range(3):
+        instance.send(i)
+    DurableMockService.drain_all()
+
+    assert len(list(queue_dir.glob("DurableMockService-*.db"))) == 1
+    DurableMockService.mock.reset_mock(side_effect=True)
+
+    instance = DurableMockService.instance()
+    DurableMockService.drain_all()
+    DurableMockService.mock.assert_called_once_with(instance, 1)
+
+
+def test_durable_batched_queue_service_replays_failed_batches(queue_dir):
+    class DurableMockBatchedService(MockBatchedService):
+        _durable = True
+
+    DurableMockBatchedService.mock.side_effect = ValueError("Failed to handle batch")
+    instance = DurableMockBatchedService.instance()
+    instance.send(1)
+    DurableMockBatchedService.drain_all()
+    DurableMockBatchedService.mock.reset_mock(side_effect=True)
+
+    instance = DurableMockBatchedService.instance()
+    instance.send(2)
+    DurableMockBatchedService.drain_all()
+    DurableMockBatchedService.mock.assert_called_once_with(instance, [1, 2])
+
+
+def test_durable_queue_service_stops_replaying_after_max_attempts(queue_dir):
+    class DurableMockService(MockService):
+        _durable = True
+        _durable_max_attempts = 2
+
+    DurableMockService.mock.side_effect = ValueError("Failed to handle item")
+    instance = DurableMockService.instance()
+    instance.send(1)
+    DurableMockService.drain_all()
+
+    instance = DurableMockService.instance()
+    DurableMockService.drain_all()
+    assert DurableMockService.mock.call_count == 2
+    DurableMockService.mock.reset_mock(side_effect=True)
+
+    DurableMockService.instance()
+    DurableMockService.drain_all()
+    DurableMockService.mock.assert_not_called()
+
+
+def test_durable_queue_service_max_queue_size(queue_dir, blocked_service):
+    class DurableMockService(MockService):
+        _durable = True
+        _max_queue_size = 2
+        _overflow_policy = OverflowPolicy.DROP_NEWEST
+
+    instance, event = blocked_service(DurableMockService)
+    for i in range(1, 5):
+        instance.send(i)
+
+    assert instance._queue.qsize() == 2
+    event.set()
+    DurableMockService.drain_all()
+    DurableMockService.mock.assert_has_calls([call(instance, i) for i in [0, 1, 2]])
+
+
+def test_durable_queue_service_falls_back_to_memory(tmp_path, monkeypatch):
+    # The queue directory cannot be created under a file
+    (tmp_path / "home").touch()
+    monkeypatch.setenv("PREFECT_HOME", str(tmp_path / "home"))
+
+    class DurableMockService(MockService):
+        _durable = True
+
+    instance = DurableMockService.instance()
+    instance.send(1)
+    DurableMockService.drain_all()
+
+    assert instance._durable_queue is None
+    DurableMockService.mock.assert_called_once_with(instance, 1)
+
+
+class ConcurrentMockService(MockService):
+    _max_concurrency = 3
+
+    async def _handle(self, item):
+        key, delay = item
+        self.mock(self, "start", item)
+        await asyncio.sleep(delay)
+        self.mock(self, "end", item)
+
+    def _ordering_key(self, item):
+        return item[0]
+
+
+def get_max_in_flight(mock: MagicMock) -> int:
+    in_flight = max_in_flight = 0
+    for args in mock.call_args_list:
+        in_flight += 1 if args[0][1] == "start" else -1
+        max_in_flight = max(in_flight, max_in_flight)
+    return max_in_flight
+
+
+def test_queue_service_max_concurrency():
+    instance = ConcurrentMockService.instance()
+    for i in range(6):
+        instance.send((i, 0.05))
+
+    ConcurrentMockService.drain_all()
+
+    # Draining waits for all in-flight items
+    assert ConcurrentMockService.mock.call_count == 12
+    assert get_max_in_flight(ConcurrentMockService.mock) == 3
+
+
+def test_queue_service_max_concurrency_with_ordering_key():
+    instance = ConcurrentMockService.instance()
+    # Earlier items for the same key take longer
+    items = [("a", 0.1), ("b", 0.1), ("a", 0.05), ("b", 0), ("c", 0), ("a", 0)]
+    for item in items:
+        instance.send(item)
+
+    ConcurrentMockService.drain_all()
+
+    calls = [args[0][1:] for args in ConcurrentMockService.mock.call_args_list]
+    for key in "abc":
+        assert [item for _, item in calls if item[0] == key] == [
+            item for item in items if item[0] == key for _ in range(2)
+        ]
+        # Each item finishes before the next item with the same key starts
+        assert [event for event, item in calls if item[0] == key] == [
+            "start",
+            "end",
+        ] * len([item for item in items if item[0] == key])
+
+    # Different keys are handled concurrently
+    assert get_max_in_flight(ConcurrentMockService.mock) > 1
+
+
+def test_batched_queue_service_max_concurrency_with_ordering_key():
+    handled = []
+    in_flight = set()
+    overlapped = []
+
+    class ConcurrentMockBatchedService(MockBatchedService):
+        _max_batch_size = 2
+        _max_concurrency = 2
+
+        async def _handle_batch(self, items):
+            keys = {key for key, _ in items}
+            overlapped.append(bool(in_flight & keys))
+            in_flight.update(keys)
+            await asyncio.sleep(max(delay for _, delay in items))
+            in_flight.difference_update(keys)
+            handled.extend(items)
+
+        def _ordering_key(self, item):
+            return item[0]
+
+    instance = ConcurrentMockBatchedService.instance()
+    items = [("a", 0.1), ("b", 0), ("c", 0), ("d", 0), ("a", 0), ("e", 0)]
+    for item in items:
+        instance.send(item)
+
+    ConcurrentMockBatchedService.drain_all()
+
+    assert sorted(handled) == sorted(items)
+    assert not any(overlapped)
+    assert [item for item in handled if item[0] == "a"] == [("a", 0.1), ("a", 0)]
+    # The batch without the slow key does not wait for it
+    assert handled.index(("c", 0)) < handled.index(("a", 0.1))
+
+
+def test_adaptive_batch_controller_starts_at_upper_bounds():
+    controller = AdaptiveBatchController(
+        min_batch_size=1, max_batch_size=100, interval_bounds=(0.1, 1)
+    )
+    assert controller.batch_size == 100
+    assert controller.interval == 1
+
+
+def test_adaptive_batch_controller_decreases_batch_size_on_failure():
+    controller = AdaptiveBatchController(
+        min_batch_size=10, max_batch_size=100, interval_bounds=(0.1, 1)
+    )
+    controller.interval = 0.2
+
+    controller.record(100, duration=0.1, failed=True, backlog=0)
+    assert controller.batch_size == 50
+    assert controller.interval == 0.4
+
+    for _ in range(5):
+        controller.record(100, duration=0.1, failed=True, backlog=0)
+    assert controller.batch_size == 10
+    assert controller.interval == 1
+
+
+def test_adaptive_batch_controller_decreases_batch_size_when_slow():
+    controller = AdaptiveBatchController(
+        min_batch_size=1, max_batch_size=100, interval_bounds=(0.1, 1)
+    )
+    controller.record(100, duration=2, failed=False, backlog=100)
+    assert controller.batch_size == 50
+    assert controller.interval == 1
+
+
+def test_adaptive_batch_controller_increases_batch_size_with_backlog():
+    controller = AdaptiveBatchController(
+        min_batch_size=1, max_batch_size=101, interval_bounds=(0.0, 1)
+    )
+    controller.batch_size = 50
+    controller.interval = 0.5
+
+    controller.record(50, duration=0.1, failed=False, backlog=0)
+    assert controller.batch_size == 60
+    assert controller.interval == pytest.approx(0.6)
+
+    controller.record(10, duration=0.1, failed=False, backlog=5)
+    assert controller.batch_size == 70
+
+    for _ in range(10):
+        controller.record(1000, duration=0.1, failed=False, backlog=1000)
+    assert controller.batch_size == 101
+    assert controller.interval == 1
+
+
+def test_adaptive_batch_controller_shortens_interval_under_light_load():
+    controller = AdaptiveBatchController(
+        min_batch_size=1, max_batch_size=100, interval_bounds=(0.1, 1)
+    )
+    controller.record(1, duration=0.1, failed=False, backlog=0)
+    assert controller.batch_size == 100
+    assert controller.interval == 0.5
+
+    for _ in range(5):
+        controller.record(1, duration=0.1, failed=False, backlog=0)
+    assert controller.interval == 0.1
+
+
+def test_adaptive_batch_controller_without_interval():
+    controller = AdaptiveBatchController(min_batch_size=1, max_batch_size=100)
+    controller.record(1, duration=0.1, failed=True, backlog=0)
+    controller.record(1, duration=0.1, failed=False, backlog=0)
+    assert controller.interval is None
+
+
+def test_adaptive_batched_queue_service():
+    class AdaptiveMockBatchedService(MockBatchedService):
+        _max_batch_size = 8
+        _min_interval = 1
+        _adaptive_batching = True
+
+    AdaptiveMockBatchedService.mock.side_effect = ValueError("Failed")
+    instance = AdaptiveMockBatchedService.instance()
+    assert instance.current_batch_size == 8
+    assert instance.current_interval == 1
+
+    for i in range(8):
+        instance.send(i)
+    AdaptiveMockBatchedService.drain_all()
+
+    assert instance.current_batch_size < 8
+    assert instance.current_interval == 1
+
+
+def test_batched_queue_service_current_values_without_adaptive_batching():
+    instance = MockBatchedService.instance()
+    assert instance.current_batch_size == 2
+    assert instance.current_interval is None
+
+
+def test_queue_service_stats():
+    instance = MockService.instance()
+    for i in range(3):
+        instance.send(i)
+    instance.drain()
+
+    stats = instance.stats()
+    assert stats["depth"] == 0
+    assert stats["enqueued_count"] == 3
+    assert stats["enqueue_rate"] > 0
+    assert stats["handled_count"] == 3
+    assert stats["time_in_queue_seconds"].count == 3
+    assert stats["handle_duration_seconds"].count == 3
+    assert stats["drain_duration_seconds"] >= 0
+
+
+def test_queue_service_stats_failures():
+    def handle(_, item):
+        if item == 1:
+            raise ValueError("Failed")
+
+    MockService.mock.side_effect = handle
+    instance = MockService.instance()
+    for i in range(3):
+        instance.send(i)
+    instance.drain()
+
+    assert instance.stats()["failed_count"] == 1
+
+
+def test_batched_queue_service_stats():
+    instance = MockBatchedService.instance()
+    for i in range(3):
+        instance.send(i)
+    instance.drain()
+
+    stats = instance.stats()
+    assert stats["handled_count"] == 3
+    assert stats["batch_size"].count == stats["handle_duration_seconds"].count
+    assert stats["batch_weight"].sum == 3
+    assert stats["current_batch_size"] == 2
+
+
+def test_queue_service_aggregate_stats():
+    instance = MockService.instance()
+    other = MockService.instance(1)
+    instance.send(1)
+    instance.send(2)
+    other.send(3)
+
+    stats = MockService.aggregate_stats()
+    assert stats["instances"] == 2
+    assert stats["enqueued_count"] == 3
+    assert MockService.all_stats()["MockService"]["instances"] == 2
+    assert MockBatchedService.aggregate_stats() == {"instances": 0}
+
+
+def test_queue_service_export_metrics(tmp_path):
+    instance = MockService.instance()
+    instance.send(1)
+
+    path = tmp_path / "metrics.txt"
+    MockService.export_metrics(path, interval=0.01).stop()
+
+    assert 'prefect_service_enqueued_total{service="MockService"} 1' in (
+        path.read_text()
+    )
+
+
+def test_queue_service_coalesce_key(blocked_service):
+    class CoalescingMockService(MockService):
+        def _coalesce_key(self, item):
+            return item % 2
+
+        def _coalesce(self, pending, item):
+            return max(pending, item)
+
+    instance, event = blocked_service(CoalescingMockService)
+    for i in [2, 1, 4, 3, 5, 6]:
+        instance.send(i)
+
+    assert instance._queue.qsize() == 2
+    event.set()
+    CoalescingMockService.drain_all()
+
+    CoalescingMockService.mock.assert_has_calls(
+        [call(instance, 0), call(instance, 6), call(instance, 5)]
+    )
+    assert CoalescingMockService.mock.call_count == 3
+    assert instance.stats()["coalesced_count"] == 4
+
+
+def test_queue_service_priority(blocked_service):
+    class PriorityMockService(MockService):
+        _priority_weights = (2, 1)
+
+        def _priority(self, item):
+            return 0 if item >= 10 else None
+
+    instance, event = blocked_service(PriorityMockService)
+    for i in [1, 2, 3, 4, 10, 11, 12, 13, 14, 15]:
+        instance.send(i)
+
+    assert instance._queue.lane_sizes() == [6, 4]
+    event.set()
+    PriorityMockService.drain_all()
+
+    # The first item used the share of the low priority lane for the first round
+    PriorityMockService.mock.assert_has_calls(
+        [call(instance, i) for i in [0, 10, 11, 12, 13, 1, 14, 15, 2, 3, 4]]
+    )
+
+
+def test_queue_service_priority_cannot_be_durable():
+    class PriorityMockService(MockService):
+        _priority_weights = (2, 1)
+        _durable = True
+
+    with pytest.raises(ValueError, match="Priority lanes cannot be combined"):
+        PriorityMockService.instance()
+
+
+def test_batched_queue_service_handles_urgent_items_immediately():
+    class PriorityMockBatchedService(MockBatchedService):
+        _max_batch_size = 10
+        _min_interval = 10
+        _priority_weights = (1, 1)
+
+        def _priority(self, item):
+            return 0 if item == 0 else 1
+
+    instance = PriorityMockBatchedService.instance()
+    instance.send(1)
+    instance.send(0)
+
+    # The batch is handled before the interval elapses
+    deadline = time.monotonic() + 5
+    while not PriorityMockBatchedService.mock.called:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    PriorityMockBatchedService.mock.assert_called_once()
+    assert sorted(PriorityMockBatchedService.mock.call_args[0][1]) == [0, 1]
+    PriorityMockBatchedService.drain_all()
+
+
+class ShardedMockService(MockService):
+    _loop_threads = 2
+
+    async def _handle(self, item: int):
+        await super()._handle(item)
+        self.mock(self, threading.current_thread().name)
+
+
+@pytest.fixture
+def loop_thread_pool():
+    pool = get_loop_thread_pool()
+    yield pool
+    pool.wait_for_exit()
+
+
+def test_queue_service_loop_threads(loop_thread_pool):
+    instances = [ShardedMockService.instance(i) for i in range(6)]
+    for instance in instances:
+        instance.send(1)
+
+    ShardedMockService.drain_all()
+
+    loop_threads = loop_thread_pool.threads()[:2]
+    for instance in instances:
+        assert instance._loop_thread in loop_threads
+        ShardedMockService.mock.assert_any_call(instance, 1)
+        ShardedMockService.mock.assert_any_call(instance, instance._loop_thread.name)
+
+
+def test_queue_service_loop_threads_by_load(loop_thread_pool):
+    class LoadShardedMockService(ShardedMockService):
+        _loop_thread_assignment = LoopThreadAssignment.LOAD
+
+    instances = [LoadShardedMockService.instance(i) for i in range(4)]
+
+    loop_threads = loop_thread_pool.threads()[:2]
+    assert [instance._loop_thread for instance in instances].count(loop_threads[0]) == 2
+    assert [instance._loop_thread for instance in instances].count(loop_threads[1]) == 2
+
+
+def test_queue_service_loop_threads_do_not_block_global_loop(loop_thread_pool):
+    class SlowMockService(MockService):
+        _loop_threads = 1
+
+    event = threading.Event()
+    MockService.mock.side_effect = lambda service, _: (
+        event.wait() if isinstance(service, SlowMockService) else None
+    )
+    SlowMockService.instance(1).send(1)
+
+    try:
+        # The global loop is free to handle other services while the handler blocks
+        instance = MockService.instance()
+        assert instance._loop_thread is get_global_loop()
+        instance.send(2)
+        instance.drain()
+        MockService.mock.assert_any_call(instance, 2)
+    finally:
+        event.set()
+
+    SlowMockService.drain_all()
+
+
+def test_drain_on_loop_thread_pool_shutdown(loop_thread_pool):
+    for i in range(4):
+        ShardedMockService.instance(i).send(i)
+
+    loop_thread_pool.wait_for_exit()
+
+    ShardedMockService.mock.assert_has_calls(
+        [call(ANY, i) for i in range(4)], any_order=True
+    )
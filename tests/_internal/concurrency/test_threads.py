@@ -1,10 +1,18 @@
 import concurrent.futures
+import threading
+import time
 from unittest.mock import MagicMock, call
 
 import pytest
 
 from prefect._internal.concurrency.calls import Call
-from prefect._internal.concurrency.threads import EventLoopThread, WorkerThread
+from prefect._internal.concurrency.cancellation import CancelledError
+from prefect._internal.concurrency.threads import (
+    EventLoopThread,
+    EventLoopThreadPool,
+    WorkerThread,
+    WorkerThreadPool,
+)
 from prefect.testing.utilities import AsyncMock
 
 
@@ -78,6 +86,24 @@ def test_event_loop_thread_clears_shutdown_hooks_after_shutdown():
     assert not event_loop_thread._on_shutdown
 
 
+def test_event_loop_thread_pool():
+    pool = EventLoopThreadPool(name="TestPool")
+
+    first = pool.get(0)
+    assert pool.get(0) is first
+    assert pool.get(1) is not first
+    assert [thread.name for thread in pool.threads()] == ["TestPool-0", "TestPool-1"]
+
+    pool.wait_for_exit()
+    assert not first.thread.is_alive()
+
+    # A thread that was shut down is replaced
+    replacement = pool.get(0)
+    assert replacement is not first
+    assert replacement.thread.is_alive()
+    pool.wait_for_exit()
+
+
 @pytest.mark.parametrize("thread_cls", [WorkerThread, EventLoopThread])
 @pytest.mark.parametrize("daemon", [True, False])
 def test_thread_daemon(daemon, thread_cls):
@@ -111,3 +137,118 @@ def test_thread_submit(work, thread_cls):
     call = thread.submit(Call.new(work, 1))
     assert call.result() == 1
     thread.shutdown()
+
+
+@pytest.fixture
+def worker_pool():
+    pools = []
+
+    def worker_pool(**kwargs):
+        pool = WorkerThreadPool(**kwargs)
+        pools.append(pool)
+        return pool
+
+    yield worker_pool
+
+    for pool in pools:
+        pool.wait_for_exit()
+
+
+@pytest.mark.parametrize("work", [identity, aidentity])
+def test_worker_pool_submit(worker_pool, work):
+    pool = worker_pool()
+    call = pool.submit(Call.new(work, 1))
+    assert call.result() == 1
+
+
+def test_worker_pool_reuses_threads(worker_pool):
+    pool = worker_pool()
+    threads = set()
+    for _ in range(5):
+        call = pool.submit(Call.new(threading.current_thread))
+        threads.add(call.result())
+
+    assert len(threads) == 1
+    assert pool.stats()["started_thread_count"] == 1
+    assert pool.stats()["completed_count"] == 5
+
+
+def test_worker_pool_max_size(worker_pool):
+    pool = worker_pool(max_size=2)
+    event = threading.Event()
+    calls = [pool.submit(Call.new(event.wait)) for _ in range(4)]
+
+    stats = pool.stats()
+    assert stats["threads"] == 2
+    assert stats["depth"] == 2
+
+    event.set()
+    assert all(call.result() for call in calls)
+    assert pool.stats()["max_depth"] == 2
+    assert pool.stats()["depth"] == 0
+
+
+def test_worker_pool_nested_submission_when_full(worker_pool):
+    pool = worker_pool(max_size=1)
+
+    def outer():
+        return pool.submit(Call.new(identity, 1)).result()
+
+    # The inner call gets its own thread instead of waiting for the outer call
+    assert pool.submit(Call.new(outer)).result(timeout=5) == 1
+
+
+def test_worker_pool_idle_timeout(worker_pool):
+    pool = worker_pool(min_size=1, idle_timeout=0.1)
+    event = threading.Event()
+    calls = [pool.submit(Call.new(event.wait)) for _ in range(3)]
+    event.set()
+    for submitted in calls:
+        submitted.result()
+
+    deadline = time.monotonic() + 5
+    while pool.stats()["threads"] > 1:
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+
+    # The remaining thread is reused
+    assert pool.submit(Call.new(identity, 1)).result() == 1
+    assert pool.stats()["started_thread_count"] == 3
+
+
+def test_worker_pool_counts_with_idle_timeouts_racing_submissions(worker_pool):
+    pool = worker_pool(max_size=2, idle_timeout=0.001)
+
+    for _ in range(50):
+        calls = [pool.submit(Call.new(identity, i)) for i in range(4)]
+        assert [submitted.result(timeout=5) for submitted in calls] == list(range(4))
+        time.sleep(0.001)
+
+    stats = pool.stats()
+    assert stats["depth"] == 0
+    assert stats["idle_threads"] <= stats["threads"]
+
+
+def test_worker_pool_call_timeout(worker_pool):
+    pool = worker_pool()
+    call = Call.new(time.sleep, 2)
+    call.set_timeout(0.1)
+    pool.submit(call)
+
+    with pytest.raises(CancelledError):
+        call.result()
+    assert call.timedout()
+
+    # The thread is reused after the call is cancelled
+    assert pool.submit(Call.new(identity, 1)).result() == 1
+    assert pool.stats()["started_thread_count"] == 1
+
+
+def test_worker_pool_shutdown(worker_pool):
+    pool = worker_pool()
+    pool.submit(Call.new(identity, 1)).result()
+    pool.wait_for_exit()
+
+    assert pool.stats()["threads"] == 0
+    with pytest.raises(RuntimeError, match="shutdown"):
+        pool.submit(Call.new(identity, 1))
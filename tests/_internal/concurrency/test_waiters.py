@@ -4,10 +4,15 @@ import time
 
 import pytest
 
+from prefect._internal.concurrency.api import from_sync
 from prefect._internal.concurrency.calls import Call
 from prefect._internal.concurrency.cancellation import CancelledError
-from prefect._internal.concurrency.threads import WorkerThread
+from prefect._internal.concurrency.threads import (
+    WorkerThread,
+    wait_for_global_loop_exit,
+)
 from prefect._internal.concurrency.waiters import (
+    _WAITERS_BY_THREAD,
     AsyncWaiter,
     SyncWaiter,
     get_waiter_for_thread,
@@ -392,3 +397,113 @@ def test_sync_waiter_base_exception_in_main_thread(exception_cls, raise_fn):
     assert (
         done_callback.result(timeout=0) == 1
     ), "The done callback should still be called on exception"
+
+
+def test_sync_waiter_runs_callbacks_submitted_while_waiting():
+    with WorkerThread(run_once=True) as runner:
+
+        def on_worker_thread():
+            callbacks = [waiter.submit(Call.new(identity, i)) for i in range(10)]
+            return [callback.result() for callback in callbacks]
+
+        call = Call.new(on_worker_thread)
+        waiter = SyncWaiter(call)
+        runner.submit(call)
+        waiter.wait()
+
+    assert call.result() == list(range(10))
+    assert get_waiter_for_thread(threading.current_thread()) is not waiter
+
+
+async def test_async_waiter_runs_callbacks_submitted_while_waiting():
+    with WorkerThread(run_once=True) as runner:
+
+        def on_worker_thread():
+            callbacks = [waiter.submit(Call.new(aidentity, i)) for i in range(10)]
+            return [callback.result() for callback in callbacks]
+
+        call = Call.new(on_worker_thread)
+        waiter = AsyncWaiter(call)
+        runner.submit(call)
+        await waiter.wait()
+
+    assert call.result() == list(range(10))
+    assert get_waiter_for_thread(threading.current_thread()) is not waiter
+
+
+def run_in_thread(fn) -> threading.Thread:
+    """
+    Run a function in a new thread, re-raising its exception in this thread.
+    """
+    errors = []
+
+    def target():
+        try:
+            fn()
+        except BaseException as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if errors:
+        raise errors[0]
+    return thread
+
+
+def test_waiters_are_unregistered_when_done_waiting():
+    def wait_in_thread():
+        waiter = SyncWaiter(Call.new(identity, 1))
+        with WorkerThread(run_once=True) as runner:
+            runner.submit(waiter._call)
+            waiter.wait()
+
+    # The registry does not keep the thread once its waiters are done
+    assert run_in_thread(wait_in_thread) not in _WAITERS_BY_THREAD
+
+
+def test_waiters_are_unregistered_when_waiting_raises():
+    def interrupted():
+        raise KeyboardInterrupt()
+
+    def wait_in_thread():
+        waiter = SyncWaiter(Call.new(identity, 1))
+        # Interrupt the waiter while it is waiting for the call
+        waiter._handle_waiting_callbacks = interrupted
+        with pytest.raises(KeyboardInterrupt):
+            waiter.wait()
+
+    assert run_in_thread(wait_in_thread) not in _WAITERS_BY_THREAD
+
+
+def test_waiters_are_unregistered_when_waiting_is_not_reached():
+    class FailingContext:
+        def __enter__(self):
+            raise ValueError("test")
+
+        def __exit__(self, *_):
+            pass
+
+    def wait_in_thread():
+        with pytest.raises(ValueError, match="test"):
+            from_sync.wait_for_call_in_loop_thread(
+                Call.new(aidentity, 1), contexts=[FailingContext()]
+            )
+
+    try:
+        assert run_in_thread(wait_in_thread) not in _WAITERS_BY_THREAD
+    finally:
+        wait_for_global_loop_exit()
+
+
+@pytest.mark.parametrize("cls", [AsyncWaiter, SyncWaiter])
+def test_waiter_submit_after_call_is_done(cls):
+    call = Call.new(identity, 1)
+    waiter = cls(call)
+    call.run()
+
+    with pytest.raises(RuntimeError, match="already done"):
+        waiter.submit(Call.new(identity, 2))
+
+    with pytest.raises(RuntimeError, match="done waiters"):
+        waiter.add_done_callback(Call.new(identity, 2))
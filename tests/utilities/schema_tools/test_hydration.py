@@ -0,0 +1,185 @@
+import json
+import math
+from decimal import Decimal
+
+import pytest
+
+from prefect.utilities.schema_tools.hydration import (
+    JSON_CACHE_MIN_LENGTH,
+    HydrationContext,
+    InvalidJSON,
+    WorkspaceVariableNotFound,
+    hydrate,
+    hydrate_many,
+    set_json_parser,
+)
+
+
+@pytest.fixture
+def parsed_values():
+    """
+    Records the values parsed by the `json` handler.
+    """
+    values = []
+
+    def parser(value):
+        values.append(value)
+        return json.loads(value)
+
+    set_json_parser(parser)
+    try:
+        yield values
+    finally:
+        set_json_parser(None)
+
+
+class TestJSONParsing:
+    def test_parses_json(self):
+        assert hydrate({"a": {"__prefect_kind": "json", "value": '{"b": [1]}'}}) == {
+            "a": {"b": [1]}
+        }
+
+    def test_parses_nan(self):
+        result = hydrate({"a": {"__prefect_kind": "json", "value": "NaN"}})
+        assert math.isnan(result["a"])
+
+    def test_parses_big_integers(self):
+        result = hydrate({"a": {"__prefect_kind": "json", "value": str(2**70)}})
+        assert result == {"a": 2**70}
+
+    @pytest.mark.parametrize("value", ["{", 1])
+    def test_invalid_json(self, value):
+        with pytest.raises(InvalidJSON):
+            hydrate(
+                {"a": {"__prefect_kind": "json", "value": value}},
+                HydrationContext(raise_on_error=True),
+            )
+
+    def test_custom_parser(self):
+        set_json_parser(lambda value: json.loads(value, parse_float=Decimal))
+        try:
+            result = hydrate({"a": {"__prefect_kind": "json", "value": "1.5"}})
+        finally:
+            set_json_parser(None)
+
+        assert result == {"a": Decimal("1.5")}
+
+    def test_long_values_are_parsed_once(self, parsed_values):
+        value = json.dumps({"b": "x" * JSON_CACHE_MIN_LENGTH})
+        obj = {"a": {"__prefect_kind": "json", "value": value}}
+
+        assert hydrate(obj) == hydrate(obj) == {"a": json.loads(value)}
+        assert parsed_values == [value]
+
+    def test_short_values_are_not_cached(self, parsed_values):
+        obj = {"a": {"__prefect_kind": "json", "value": "[1]"}}
+
+        hydrate(obj)
+        hydrate(obj)
+
+        assert parsed_values == ["[1]", "[1]"]
+
+    def test_cached_values_are_not_aliased(self):
+        value = json.dumps({"b": ["x" * JSON_CACHE_MIN_LENGTH]})
+        obj = {"a": {"__prefect_kind": "json", "value": value}}
+
+        first = hydrate(obj)
+        first["a"]["b"].append(2)
+
+        assert hydrate(obj) == {"a": json.loads(value)}
+
+    def test_cached_custom_parser_values_are_not_aliased(self):
+        value = json.dumps(["x" * JSON_CACHE_MIN_LENGTH, 1.5])
+        obj = {"a": {"__prefect_kind": "json", "value": value}}
+        set_json_parser(lambda value: json.loads(value, parse_float=Decimal))
+        try:
+            first = hydrate(obj)
+            first["a"].append(2)
+            second = hydrate(obj)
+        finally:
+            set_json_parser(None)
+
+        assert second == {"a": ["x" * JSON_CACHE_MIN_LENGTH, Decimal("1.5")]}
+
+
+class TestHydrateMany:
+    def test_returns_results_in_input_order(self):
+        objs = [
+            {"a": {"__prefect_kind": "json", "value": '{"b": 1}'}},
+            {"a": {"__prefect_kind": "none", "value": 2}},
+            {"a": 3},
+        ]
+        assert hydrate_many(objs) == [
+            ({"a": {"b": 1}}, None),
+            ({"a": 2}, None),
+            ({"a": 3}, None),
+        ]
+
+    def test_matches_hydrate(self):
+        ctx = HydrationContext(workspace_variables={"foo": "bar"})
+        objs = [
+            {"a": {"__prefect_kind": "workspace_variable", "variable_name": "foo"}},
+            {
+                "a": {
+                    "__prefect_kind": "json",
+                    "value": {"__prefect_kind": "none", "value": "[1, 2]"},
+                }
+            },
+            {"a": [{"__prefect_kind": "json"}]},
+        ]
+        assert [result for result, _ in hydrate_many(objs, ctx)] == [
+            hydrate(obj, ctx) for obj in objs
+        ]
+
+    def test_parses_distinct_json_values_once(self, parsed_values):
+        objs = [{"a": {"__prefect_kind": "json", "value": '{"b": 1}'}}] * 3
+        objs.append({"a": {"__prefect_kind": "json", "value": "[1]"}})
+
+        results = hydrate_many(objs)
+
+        assert sorted(parsed_values) == sorted(['{"b": 1}', "[1]"])
+        assert [result for result, _ in results] == [{"a": {"b": 1}}] * 3 + [{"a": [1]}]
+
+    def test_shared_json_values_are_not_aliased(self):
+        objs = [{"a": {"__prefect_kind": "json", "value": '{"b": [1]}'}}] * 2
+
+        (first, _), (second, _) = hydrate_many(objs)
+        first["a"]["b"].append(2)
+
+        assert second == {"a": {"b": [1]}}
+
+    def test_returns_errors_per_payload(self):
+        ctx = HydrationContext(raise_on_error=True)
+        objs = [
+            {"a": {"__prefect_kind": "json", "value": "{"}},
+            {"a": 1},
+            {"a": {"__prefect_kind": "workspace_variable", "variable_name": "foo"}},
+        ]
+
+        results = hydrate_many(objs, ctx)
+
+        assert results[0][0] is None
+        assert isinstance(results[0][1], InvalidJSON)
+        assert results[1] == ({"a": 1}, None)
+        assert results[2] == (None, WorkspaceVariableNotFound(detail="foo"))
+
+    def test_returns_top_level_placeholder_errors(self):
+        results = hydrate_many([{"__prefect_kind": "json", "value": "{"}])
+        assert results[0][0] is None
+        assert isinstance(results[0][1], InvalidJSON)
+
+    def test_returns_nested_placeholder_errors(self):
+        objs = [
+            {"a": [1, {"b": {"__prefect_kind": "json", "value": "{"}}]},
+            {"a": {"__prefect_kind": "workspace_variable", "variable_name": "foo"}},
+        ]
+
+        results = hydrate_many(objs)
+
+        assert results[0][0] is None
+        assert isinstance(results[0][1], InvalidJSON)
+        assert results[1] == (None, WorkspaceVariableNotFound(detail="foo"))
+
+    @pytest.mark.parametrize("objs", [[], iter([])])
+    def test_empty(self, objs):
+        assert hydrate_many(objs) == []
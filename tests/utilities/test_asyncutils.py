@@ -330,8 +330,52 @@ def test_sync_compatible_requires_async_function():
             pass
 
 
+@sync_compatible
+async def sync_compatible_gen(n):
+    for i in range(n):
+        await asyncio.sleep(0)
+        yield i
+
+
+def test_sync_compatible_async_generator_from_sync():
+    assert list(sync_compatible_gen(5)) == [0, 1, 2, 3, 4]
+
+
+async def test_sync_compatible_async_generator_from_async():
+    assert [i async for i in sync_compatible_gen(5)] == [0, 1, 2, 3, 4]
+
+
+async def test_sync_compatible_async_generator_from_worker():
+    def run_fn():
+        return list(sync_compatible_gen(5))
+
+    assert await run_sync_in_worker_thread(run_fn) == [0, 1, 2, 3, 4]
+
+
+def test_sync_compatible_async_generator_early_break_closes_generator():
+    closed = threading.Event()
+
+    @sync_compatible
+    async def numbers():
+        try:
+            i = 0
+            while True:
+                yield i
+                i += 1
+        finally:
+            closed.set()
+
+    for i in numbers():
+        if i == 3:
+            break
+
+    assert closed.is_set()
+
+
 def test_sync_compatible_with_async_context_manager():
-    with pytest.raises(ValueError, match="Async generators cannot yet be marked"):
+    with pytest.raises(
+        ValueError, match="Functions wrapping async generators cannot yet be marked"
+    ):
 
         @sync_compatible
         @asynccontextmanager
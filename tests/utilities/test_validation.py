@@ -1,9 +1,26 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import jsonschema
 import pytest
+from prefect.utilities import validation
 from prefect.utilities.validation import (
+    ValidationErrorDetail,
+    get_validator,
+    validate_many,
+    validate_patched_values_conform_to_schema,
     validate_schema,
     validate_values_conform_to_schema,
 )
 
+
+@pytest.fixture(autouse=True)
+def clear_validators():
+    validation._validators.clear()
+    yield
+    validation._validators.clear()
+
+
 # Tests for validate_schema function
 
 
@@ -95,3 +112,326 @@ def test_validate_values_conform_to_schema_none_values_or_schema():
     validate_values_conform_to_schema(None, {"type": "string"})
     validate_values_conform_to_schema({"name": "John"}, None)
     validate_values_conform_to_schema(None, None)
+
+
+# Tests for get_validator function
+
+
+def test_get_validator_returns_same_validator_for_same_schema():
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+    assert get_validator(schema) is get_validator(schema)
+
+
+def test_get_validator_returns_same_validator_for_equal_schemas():
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+    other = {"properties": {"name": {"type": "string"}}, "type": "object"}
+    assert get_validator(schema) is get_validator(other)
+
+
+def test_get_validator_returns_different_validators_for_different_schemas():
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+    other = {"type": "object", "properties": {"name": {"type": "integer"}}}
+    assert get_validator(schema) is not get_validator(other)
+
+
+def test_get_validator_caches_by_ignore_required():
+    schema = {
+        "type": "object",
+        "properties": {"name": {"type": "string"}},
+        "required": ["name"],
+    }
+    validator = get_validator(schema)
+    ignore_required_validator = get_validator(schema, ignore_required=True)
+
+    assert validator is not ignore_required_validator
+    assert not validator.is_valid({})
+    assert ignore_required_validator.is_valid({})
+    assert get_validator(schema, ignore_required=True) is ignore_required_validator
+
+
+def test_get_validator_builds_validator_once():
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+    with patch.object(
+        validation, "validator_for", wraps=validation.validator_for
+    ) as validator_for:
+        for _ in range(3):
+            validate_values_conform_to_schema({"name": "John"}, schema)
+
+    validator_for.assert_called_once()
+
+
+def test_get_validator_is_not_affected_by_schema_mutation():
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+    validator = get_validator(schema)
+
+    schema["properties"]["name"]["type"] = "integer"
+
+    assert validator.is_valid({"name": "John"})
+    other = {"type": "object", "properties": {"name": {"type": "string"}}}
+    assert get_validator(other).is_valid({"name": "John"})
+
+
+def test_get_validator_builds_a_validator_for_each_thread():
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+    with patch.object(
+        validation, "validator_for", wraps=validation.validator_for
+    ) as validator_for:
+        validator = get_validator(schema)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(get_validator, schema).result()
+
+    assert other is not validator
+    assert other.is_valid({"name": "John"})
+    validator_for.assert_called_once()
+
+
+def test_get_validator_does_not_cache_invalid_schemas():
+    schema = {"type": "object", "properties": {"name": {"type": "nonexistenttype"}}}
+    for _ in range(2):
+        with pytest.raises(jsonschema.SchemaError):
+            get_validator(schema)
+    assert len(validation._validators) == 0
+
+
+def test_get_validator_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(validation, "_validators", validation.LRUCache(maxsize=2))
+    schemas = [{"type": type_} for type_ in ("string", "integer", "boolean")]
+
+    first = get_validator(schemas[0])
+    second = get_validator(schemas[1])
+    assert get_validator(schemas[0]) is first
+
+    # The least recently used schema is evicted
+    get_validator(schemas[2])
+    assert get_validator(schemas[0]) is first
+    assert get_validator(schemas[1]) is not second
+
+
+# Tests for validate_many function
+
+
+@pytest.fixture
+def person_schema():
+    return {
+        "type": "object",
+        "properties": {"name": {"type": "string"}, "age": {"type": "integer"}},
+        "required": ["name"],
+    }
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_validate_many_returns_errors_in_order(person_schema, max_workers):
+    values_list = [
+        {"name": "John"},
+        {"name": 123, "age": "old"},
+        {"age": 1},
+    ]
+    results = validate_many(values_list, person_schema, max_workers=max_workers)
+
+    assert results == [
+        [],
+        [
+            ValidationErrorDetail(path="$.name", message="123 is not of type 'string'"),
+            ValidationErrorDetail(
+                path="$.age", message="'old' is not of type 'integer'"
+            ),
+        ],
+        [ValidationErrorDetail(path="$", message="'name' is a required property")],
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_validate_many_fail_fast(person_schema, max_workers):
+    values_list = [{"name": "John"}, {"name": 123}, {"name": 456}, {"name": "Jane"}]
+    results = validate_many(
+        values_list, person_schema, max_workers=max_workers, fail_fast=True
+    )
+
+    assert results == [
+        [],
+        [ValidationErrorDetail(path="$.name", message="123 is not of type 'string'")],
+    ]
+
+
+def test_validate_many_ignore_required(person_schema):
+    assert validate_many([{}, {"age": 1}], person_schema, ignore_required=True) == [
+        [],
+        [],
+    ]
+
+
+def test_validate_many_reuses_validator(person_schema):
+    with patch.object(
+        validation, "validator_for", wraps=validation.validator_for
+    ) as validator_for:
+        validate_many([{"name": "John"}] * 10, person_schema)
+        validate_many([{"name": "Jane"}] * 10, person_schema, max_workers=2)
+
+    validator_for.assert_called_once()
+
+
+def test_validate_many_invalid_schema():
+    schema = {"type": "object", "properties": {"name": {"type": "nonexistenttype"}}}
+    with pytest.raises(ValueError, match="The provided schema is not a valid json"):
+        validate_many([{"name": "John"}], schema)
+
+
+def test_validate_many_none_values_or_schema(person_schema):
+    assert validate_many([None], person_schema) == [[]]
+    assert validate_many([{"name": 123}], None) == [[]]
+    assert validate_many([], person_schema) == []
+
+
+# Tests for validate_patched_values_conform_to_schema function
+
+
+@pytest.fixture
+def parameters_schema():
+    # Matches the shape of schemas generated for flow parameters
+    return {
+        "title": "Parameters",
+        "type": "object",
+        "properties": {
+            "name": {"title": "name", "position": 0, "type": "string"},
+            "child": {
+                "title": "child",
+                "position": 1,
+                "allOf": [{"$ref": "#/definitions/Child"}],
+            },
+            "tags": {
+                "title": "tags",
+                "position": 2,
+                "type": "array",
+                "items": {"type": "string"},
+            },
+        },
+        "required": ["name"],
+        "additionalProperties": False,
+        "definitions": {
+            "Child": {
+                "title": "Child",
+                "type": "object",
+                "properties": {"value": {"type": "integer"}},
+                "required": ["value"],
+            }
+        },
+    }
+
+
+def test_validate_patched_values_returns_patched_values(parameters_schema):
+    values = {"name": "John", "child": {"value": 1}}
+    patched = validate_patched_values_conform_to_schema(
+        values,
+        [{"op": "replace", "path": "/child/value", "value": 2}],
+        parameters_schema,
+    )
+
+    assert patched == {"name": "John", "child": {"value": 2}}
+    assert values == {"name": "John", "child": {"value": 1}}
+
+
+@pytest.mark.parametrize(
+    "patch,message",
+    [
+        (
+            [{"op": "replace", "path": "/name", "value": 123}],
+            "Validation failed for field 'name'. Failure reason: 123 is not of type 'string'",
+        ),
+        (
+            [{"op": "replace", "path": "/child/value", "value": "one"}],
+            "Validation failed for field 'child.value'. Failure reason: 'one' is not of type 'integer'",
+        ),
+        (
+            [{"op": "remove", "path": "/child/value"}],
+            "Validation failed for field 'child'. Failure reason: 'value' is a required property",
+        ),
+        (
+            [{"op": "add", "path": "/tags/-", "value": 1}],
+            "Validation failed for field 'tags[2]'. Failure reason: 1 is not of type 'string'",
+        ),
+        (
+            [{"op": "add", "path": "/other", "value": 1}],
+            "Validation failed. Failure reason: Additional properties are not allowed ('other' was unexpected)",
+        ),
+        (
+            [{"op": "remove", "path": "/name"}],
+            "Validation failed. Failure reason: 'name' is a required property",
+        ),
+    ],
+)
+def test_validate_patched_values_invalid(parameters_schema, patch, message):
+    values = {"name": "John", "child": {"value": 1}, "tags": ["a", "b"]}
+    with pytest.raises(ValueError) as excinfo:
+        validate_patched_values_conform_to_schema(values, patch, parameters_schema)
+    assert str(excinfo.value) == message
+
+
+def test_validate_patched_values_only_validates_changes(parameters_schema):
+    # The values do not conform to the schema, but the change does not touch the
+    # nonconforming field
+    values = {"name": 123, "child": {"value": 1}}
+    patched = validate_patched_values_conform_to_schema(
+        values,
+        [{"op": "replace", "path": "/child/value", "value": 2}],
+        parameters_schema,
+    )
+    assert patched == {"name": 123, "child": {"value": 2}}
+
+
+@pytest.mark.parametrize(
+    "keyword",
+    [
+        {"oneOf": [{"required": ["child"]}, {"required": ["tags"]}]},
+        {"dependencies": {"child": ["tags"]}},
+    ],
+)
+def test_validate_patched_values_falls_back_to_full_validation(
+    parameters_schema, keyword
+):
+    parameters_schema.update(keyword)
+    values = {"name": 123, "child": {"value": 1}}
+
+    with pytest.raises(ValueError, match="Validation failed"):
+        validate_patched_values_conform_to_schema(
+            values,
+            [{"op": "replace", "path": "/child/value", "value": 2}],
+            parameters_schema,
+        )
+
+
+def test_validate_patched_values_validates_array_with_unique_items():
+    schema = {
+        "type": "object",
+        "properties": {"tags": {"type": "array", "uniqueItems": True}},
+    }
+    with pytest.raises(ValueError, match="has non-unique elements"):
+        validate_patched_values_conform_to_schema(
+            {"tags": ["a", "b"]},
+            [{"op": "replace", "path": "/tags/1", "value": "a"}],
+            schema,
+        )
+
+
+def test_validate_patched_values_ignore_required(parameters_schema):
+    patched = validate_patched_values_conform_to_schema(
+        {"name": "John"},
+        [{"op": "remove", "path": "/name"}],
+        parameters_schema,
+        ignore_required=True,
+    )
+    assert patched == {}
+
+
+def test_validate_patched_values_invalid_patch(parameters_schema):
+    with pytest.raises(ValueError, match="The provided patch could not be applied"):
+        validate_patched_values_conform_to_schema(
+            {"name": "John"},
+            [{"op": "replace", "path": "/missing/value", "value": 1}],
+            parameters_schema,
+        )
+
+
+def test_validate_patched_values_none_schema():
+    assert validate_patched_values_conform_to_schema(
+        {"name": "John"}, [{"op": "replace", "path": "/name", "value": 1}], None
+    ) == {"name": 1}